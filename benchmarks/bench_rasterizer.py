@@ -0,0 +1,73 @@
+"""Compares segno's ``to_pil`` path with the NumPy rasterizer.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_rasterizer
+
+Both paths produce the same RGBA image as ``QRCodeBase.generate_qr_code``
+(``to_pil`` followed by ``convert("RGBA")``). For every scale the script
+reports the mean wall time per image and the peak resident memory growth,
+measured in a fresh child process so Pillow's native allocations count too.
+"""
+
+import multiprocessing
+import resource
+import timeit
+
+import segno
+
+from sage_qrcode.service.raster import rasterize
+
+PAYLOAD = (
+    "BEGIN:VCARD\nVERSION:3.0\nN:John Doe\nFN:Johnny\nEMAIL:john.doe@example.com\n"
+    "TEL:+1234567890\nORG:ExampleOrg\nADR:123 Main St\nURL:https://example.com\n"
+    "END:VCARD"
+)
+COLORS = {"dark": "#112233", "light": "#FFFFFF", "finder_dark": "#FF0000"}
+SCALES = (10, 40, 100)
+REPEAT = 5
+
+
+def render_pil(qr_code, scale):
+    return qr_code.to_pil(scale=scale, **COLORS).convert("RGBA")
+
+
+def render_numpy(qr_code, scale):
+    return rasterize(qr_code, scale=scale, **COLORS)
+
+
+RENDERERS = {"pil": render_pil, "numpy": render_numpy}
+
+
+def _peak_rss_child(name, scale, queue):
+    qr_code = segno.make(PAYLOAD, error="h")
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    RENDERERS[name](qr_code, scale)
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put(after - before)
+
+
+def peak_rss_mib(name, scale):
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_peak_rss_child, args=(name, scale, queue))
+    process.start()
+    delta_kib = queue.get()
+    process.join()
+    return delta_kib / 1024
+
+
+def main():
+    qr_code = segno.make(PAYLOAD, error="h")
+    print(f"version {qr_code.version}, {qr_code.symbol_size()[0]} modules incl. border")
+    print(f"{'scale':>6} {'path':>6} {'ms/image':>10} {'peak MiB':>10}")
+    for scale in SCALES:
+        for name, func in RENDERERS.items():
+            seconds = timeit.timeit(lambda: func(qr_code, scale), number=REPEAT)
+            peak = peak_rss_mib(name, scale)
+            print(
+                f"{scale:>6} {name:>6} {seconds / REPEAT * 1000:>10.2f} {peak:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
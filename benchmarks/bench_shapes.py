@@ -0,0 +1,57 @@
+"""Compares styled module shapes with flat squares.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_shapes
+
+Flat squares go through the NumPy rasterizer; styled shapes stamp cached
+sprites over the module matrix. For every scale the script reports the mean
+wall time per image with warm sprite caches, and the ratio to flat squares.
+"""
+
+import timeit
+
+import segno
+
+from sage_qrcode.service.fills import Fill
+from sage_qrcode.service.raster import rasterize
+from sage_qrcode.service.shapes import rasterize_shapes
+
+PAYLOAD = (
+    "BEGIN:VCARD\nVERSION:3.0\nN:John Doe\nFN:Johnny\nEMAIL:john.doe@example.com\n"
+    "TEL:+1234567890\nORG:ExampleOrg\nADR:123 Main St\nURL:https://example.com\n"
+    "END:VCARD"
+)
+COLORS = {"dark": "#112233", "light": "#FFFFFF", "finder_dark": "#FF0000"}
+GRADIENT = Fill("linear", ("#112233", "#9333EA"))
+STYLES = {
+    "squares": {"module_shape": "square", "finder_shape": "square"},
+    "dots": {"module_shape": "dots", "finder_shape": "circle"},
+    "rounded": {"module_shape": "rounded", "finder_shape": "rounded"},
+    "dots+fill": {"module_shape": "dots", "finder_shape": "circle", "fill": GRADIENT},
+}
+SCALES = (10, 20, 40)
+REPEAT = 20
+
+
+def time_ms(func):
+    func()  # warm the sprite caches
+    return timeit.timeit(func, number=REPEAT) / REPEAT * 1000
+
+
+def main():
+    qr_code = segno.make(PAYLOAD, error="h")
+    print(f"version {qr_code.version}, {qr_code.symbol_size()[0]} modules incl. border")
+    print(f"{'scale':>6} {'style':>10} {'ms/image':>10} {'x flat':>8}")
+    for scale in SCALES:
+        flat = time_ms(lambda: rasterize(qr_code, scale=scale, **COLORS))
+        print(f"{scale:>6} {'flat':>10} {flat:>10.2f} {1:>8.1f}")
+        for name, style in STYLES.items():
+            seconds = time_ms(
+                lambda: rasterize_shapes(qr_code, scale=scale, **COLORS, **style)
+            )
+            print(f"{scale:>6} {name:>10} {seconds:>10.2f} {seconds / flat:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
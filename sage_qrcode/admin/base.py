@@ -1,4 +1,8 @@
-from django.contrib import admin
+from urllib.parse import urlencode
+
+from django.contrib import admin, messages
+from django.contrib.contenttypes.models import ContentType
+from django.http import HttpResponseRedirect
 from polymorphic.admin import PolymorphicParentModelAdmin
 from django.utils.translation import gettext_lazy as _
 
@@ -18,16 +22,23 @@ from sage_qrcode.models import (
     QRCode,
     EPCQRCode,
 )
+from sage_qrcode.forms import QRCodeForm
 from sage_qrcode.helpers.filters import QRCodeTypeFilter
+from sage_qrcode.service.admission import RenderLimitExceeded
 from sage_qrcode.utils.admin import (
-    generate_qr_code,
+    enqueue_qr_code,
+    get_model_for_url,
+    render_qr_code_files,
     save_qr_code_image,
+    save_qr_code_renditions,
     download_qr_code,
+    regenerate_qr_codes,
 )
 
 @admin.register(QRCode)
 class QRCodeParentAdmin(PolymorphicParentModelAdmin):
     base_model = QRCode
+    form = QRCodeForm
     child_models = (
         SkypeQRCode,
         TikTokQRCode,
@@ -43,7 +54,7 @@ class QRCodeParentAdmin(PolymorphicParentModelAdmin):
         TelegramQRCode,
         InstagramQRCode,
     )
-    actions = [download_qr_code]
+    actions = [download_qr_code, regenerate_qr_codes]
 
     list_display = ("id","get_qr_code_type" ,"created", "modified")
     list_filter = ("created", "modified", QRCodeTypeFilter)
@@ -53,7 +64,44 @@ class QRCodeParentAdmin(PolymorphicParentModelAdmin):
     def get_qr_code_type(self, obj):
         return obj.get_real_instance_class()._meta.verbose_name
 
+    def add_view(self, request, form_url="", extra_context=None):
+        """Skips the type choice when the add page is opened with ``?url=``.
+
+        The URL's platform picks the child model, and the URL is passed on
+        to prefill its form.
+        """
+        url = request.GET.get("url")
+        if self.model is QRCode and url and "ct_id" not in request.GET:
+            model = get_model_for_url(url)
+            if model in self.get_child_models():
+                content_type = ContentType.objects.get_for_model(
+                    model, for_concrete_model=False
+                )
+                query = {**request.GET.dict(), "ct_id": content_type.pk}
+                return HttpResponseRedirect(f"?{urlencode(query)}")
+        return super().add_view(request, form_url, extra_context)
+
     def save_model(self, request, obj, form, change):
-        qr_image = generate_qr_code(obj)
-        save_qr_code_image(obj, qr_image)
+        """Saves the object, then renders its QR code and renditions.
+
+        Rendering follows the save, so uploaded custom and fill images are
+        committed to the storage and new objects have the primary key their
+        files are named after. ``QRCodeForm`` refuses renders rejected by
+        ``SAGE_QRCODE_RENDER_LIMITS`` before the save; queued renders keep
+        the previous image until the queue renders them.
+        """
         super().save_model(request, obj, form, change)
+        try:
+            qr_image, renditions = render_qr_code_files(obj)
+        except RenderLimitExceeded as error:
+            if error.action == "queue":
+                enqueue_qr_code(obj)
+                self.message_user(
+                    request, _("The QR code is being rendered in the background.")
+                )
+            else:
+                self.message_user(request, str(error), messages.ERROR)
+            return
+        save_qr_code_image(obj, qr_image)
+        obj.save(update_fields=["qr_code_image"])
+        save_qr_code_renditions(obj, renditions)
@@ -33,7 +33,17 @@ class VCardQRCodeAdmin(PolymorphicChildModelAdmin, QRCodeParentAdmin):
             _("Advanced options"),
             {
                 "classes": ("collapse",),
-                "fields": ("org", "size", "color", "second_color", "third_color"),
+                "fields": (
+                    "org",
+                    "size",
+                    "color",
+                    "second_color",
+                    "third_color",
+                    "fill_type",
+                    "gradient_color",
+                    "gradient_angle",
+                    "fill_image",
+                ),
             },
         ),
     )
@@ -56,7 +66,16 @@ class WiFiQRCodeAdmin(QRCodeParentAdmin):
             _("Advanced options"),
             {
                 "classes": ("collapse",),
-                "fields": ("size", "color", "second_color", "third_color"),
+                "fields": (
+                    "size",
+                    "color",
+                    "second_color",
+                    "third_color",
+                    "fill_type",
+                    "gradient_color",
+                    "gradient_angle",
+                    "fill_image",
+                ),
             },
         ),
     )
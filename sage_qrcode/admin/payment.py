@@ -22,7 +22,16 @@ class EPCQRCodeAdmin(PolymorphicChildModelAdmin, QRCodeParentAdmin):
             _("Advanced options"),
             {
                 "classes": ("collapse",),
-                "fields": ("size", "color", "second_color", "third_color"),
+                "fields": (
+                    "size",
+                    "color",
+                    "second_color",
+                    "third_color",
+                    "fill_type",
+                    "gradient_color",
+                    "gradient_angle",
+                    "fill_image",
+                ),
             },
         ),
     )
@@ -50,6 +59,10 @@ class BitcoinQRCodeAdmin(PolymorphicChildModelAdmin, QRCodeParentAdmin):
                     "color",
                     "second_color",
                     "third_color",
+                    "fill_type",
+                    "gradient_color",
+                    "gradient_angle",
+                    "fill_image",
                 ),
             },
         ),
@@ -37,6 +37,10 @@ class SkypeQRCodeAdmin(PolymorphicChildModelAdmin, QRCodeParentAdmin):
                     "color",
                     "second_color",
                     "third_color",
+                    "fill_type",
+                    "gradient_color",
+                    "gradient_angle",
+                    "fill_image",
                 ),
             },
         ),
@@ -66,6 +70,10 @@ class TikTokQRCodeAdmin(PolymorphicChildModelAdmin, QRCodeParentAdmin):
                     "color",
                     "second_color",
                     "third_color",
+                    "fill_type",
+                    "gradient_color",
+                    "gradient_angle",
+                    "fill_image",
                 ),
             },
         ),
@@ -94,6 +102,10 @@ class SnapchatQRCodeAdmin(PolymorphicChildModelAdmin, QRCodeParentAdmin):
                     "color",
                     "second_color",
                     "third_color",
+                    "fill_type",
+                    "gradient_color",
+                    "gradient_angle",
+                    "fill_image",
                 ),
             },
         ),
@@ -122,6 +134,10 @@ class XQRCodeAdmin(PolymorphicChildModelAdmin, QRCodeParentAdmin):
                     "color",
                     "second_color",
                     "third_color",
+                    "fill_type",
+                    "gradient_color",
+                    "gradient_angle",
+                    "fill_image",
                 ),
             },
         ),
@@ -150,6 +166,10 @@ class LinkedInQRCodeAdmin(PolymorphicChildModelAdmin, QRCodeParentAdmin):
                     "color",
                     "second_color",
                     "third_color",
+                    "fill_type",
+                    "gradient_color",
+                    "gradient_angle",
+                    "fill_image",
                 ),
             },
         ),
@@ -177,6 +197,10 @@ class FacebookQRCodeAdmin(PolymorphicChildModelAdmin, QRCodeParentAdmin):
                     "color",
                     "second_color",
                     "third_color",
+                    "fill_type",
+                    "gradient_color",
+                    "gradient_angle",
+                    "fill_image",
                 ),
             },
         ),
@@ -205,6 +229,10 @@ class TelegramQRCodeAdmin(PolymorphicChildModelAdmin, QRCodeParentAdmin):
                     "color",
                     "second_color",
                     "third_color",
+                    "fill_type",
+                    "gradient_color",
+                    "gradient_angle",
+                    "fill_image",
                 ),
             },
         ),
@@ -233,6 +261,10 @@ class InstagramQRCodeAdmin(PolymorphicChildModelAdmin, QRCodeParentAdmin):
                     "color",
                     "second_color",
                     "third_color",
+                    "fill_type",
+                    "gradient_color",
+                    "gradient_angle",
+                    "fill_image",
                 ),
             },
         ),
@@ -257,7 +289,16 @@ class MediaUrlAdmin(PolymorphicChildModelAdmin, QRCodeParentAdmin):
             _("Advanced options"),
             {
                 "classes": ("collapse",),
-                "fields": ("size", "color", "second_color", "third_color"),
+                "fields": (
+                    "size",
+                    "color",
+                    "second_color",
+                    "third_color",
+                    "fill_type",
+                    "gradient_color",
+                    "gradient_angle",
+                    "fill_image",
+                ),
             },
         ),
     )
@@ -0,0 +1,26 @@
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+SETTINGS_PREFIX = "SAGE_QRCODE_"
+
+
+def get_setting(name: str, default: Any = None) -> Any:
+    """Returns the value of a ``SAGE_QRCODE_*`` Django setting.
+
+    Settings are read at call time so that overrides applied after import
+    (e.g. in tests) are honoured. When Django settings are not configured
+    at all, the default is returned.
+
+    Args:
+        name (str): The setting name without the ``SAGE_QRCODE_`` prefix.
+        default (Any, optional): Value returned when the setting is missing.
+
+    Returns:
+        Any: The configured value or the default.
+    """
+    try:
+        return getattr(settings, f"{SETTINGS_PREFIX}{name}", default)
+    except ImproperlyConfigured:
+        return default
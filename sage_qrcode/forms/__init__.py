@@ -1,4 +1,5 @@
 from .forms import (
+    QRCodeForm,
     WiFiQRCodeForm,
     VCardQRCodeForm,
     TikTokForm,
@@ -9,6 +10,7 @@ from .forms import (
 )
 
 __all__ = [
+    "QRCodeForm",
     "WiFiQRCodeForm",
     "VCardQRCodeForm",
     "TikTokForm",
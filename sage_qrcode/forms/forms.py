@@ -1,4 +1,8 @@
+import copy
+
 from django import forms
+from django.core.exceptions import ValidationError
+from django.forms.models import construct_instance
 from sage_qrcode.models import (
     VCardQRCode,
     WifiQRCode,
@@ -8,12 +12,37 @@ from sage_qrcode.models import (
     BitcoinQRCode,
     XQRCode,
 )
+from sage_qrcode.service.admission import RenderLimitExceeded
+from sage_qrcode.utils.admin import check_render_limits
 
 import uuid
 import os
 
 
-class VCardQRCodeForm(forms.ModelForm):
+class QRCodeForm(forms.ModelForm):
+    """Base form of the QR code admins.
+
+    Rejects QR codes over ``SAGE_QRCODE_RENDER_LIMITS`` before the object
+    is saved, so a rejected edit keeps both the old fields and the old
+    image. Queued renders pass and are queued once the object is saved.
+    """
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if self.errors:
+            return cleaned_data
+        instance = construct_instance(
+            self, copy.deepcopy(self.instance), self._meta.fields, self._meta.exclude
+        )
+        try:
+            check_render_limits(instance)
+        except RenderLimitExceeded as error:
+            if error.action == "reject":
+                raise ValidationError(str(error), code="render_limit")
+        return cleaned_data
+
+
+class VCardQRCodeForm(QRCodeForm):
     class Meta:
         model = VCardQRCode
         fields = ["full_name", "display_name", "email", "phone", "url", "custom_gif"]
@@ -39,7 +68,7 @@ class VCardQRCodeForm(forms.ModelForm):
         return instance
 
 
-class WiFiQRCodeForm(forms.ModelForm):
+class WiFiQRCodeForm(QRCodeForm):
     class Meta:
         model = WifiQRCode
         fields = ["ssid", "password", "security", "custom_gif"]
@@ -65,7 +94,7 @@ class WiFiQRCodeForm(forms.ModelForm):
         return instance
 
 
-class TikTokForm(forms.ModelForm):
+class TikTokForm(QRCodeForm):
     """A form for creating TikTok QR Codes."""
 
     class Meta:
@@ -73,7 +102,7 @@ class TikTokForm(forms.ModelForm):
         fields = ["url", "custom_gif", "color", "second_color", "third_color"]
 
 
-class XForm(forms.ModelForm):
+class XForm(QRCodeForm):
     """A form for creating X QR Codes."""
 
     class Meta:
@@ -81,7 +110,7 @@ class XForm(forms.ModelForm):
         fields = ["url", "custom_gif", "color", "second_color", "third_color"]
 
 
-class MediaUrlForm(forms.ModelForm):
+class MediaUrlForm(QRCodeForm):
     class Meta:
         model = MediaUrl
         fields = ["url", "custom_gif"]
@@ -106,7 +135,7 @@ class MediaUrlForm(forms.ModelForm):
         return instance
 
 
-class EPCQRCodeForm(forms.ModelForm):
+class EPCQRCodeForm(QRCodeForm):
     class Meta:
         model = EPCQRCode
         fields = ["name", "iban", "amount", "text", "custom_gif"]
@@ -131,7 +160,7 @@ class EPCQRCodeForm(forms.ModelForm):
         return instance
 
 
-class BitForm(forms.ModelForm):
+class BitForm(QRCodeForm):
     class Meta:
         model = BitcoinQRCode
         fields = [
@@ -1,4 +1,8 @@
+from typing import Dict
+
+from django.core.validators import MaxValueValidator
 from django.db import models
+from django.db.models.fields.files import FieldFile
 from django.utils.translation import gettext_lazy as _
 
 from colorfield.fields import ColorField
@@ -6,6 +10,7 @@ from polymorphic.models import PolymorphicModel
 
 from sage_qrcode.mixins import TimestampMixin
 from sage_qrcode.helpers.validators import validate_image_file, validate_size
+from sage_qrcode.utils.renditions import get_renditions
 
 
 class QRCode(PolymorphicModel, TimestampMixin):
@@ -63,11 +68,57 @@ class QRCode(PolymorphicModel, TimestampMixin):
         blank=True,
         db_comment="The third color of the BAR code in hexadecimal format.",
     )
+    fill_type = models.CharField(
+        max_length=10,
+        choices=[
+            ("solid", _("Solid")),
+            ("linear", _("Linear gradient")),
+            ("radial", _("Radial gradient")),
+            ("image", _("Image")),
+        ],
+        default="solid",
+        help_text=_("How the dark modules of the QR code are filled."),
+        db_comment="Fill style of the dark modules: solid, linear, radial or image.",
+    )
+    gradient_color = ColorField(
+        format="hex",
+        help_text=_("End color of a gradient fill, starting from the color."),
+        null=True,
+        blank=True,
+        db_comment="The end color of a gradient fill in hexadecimal format.",
+    )
+    gradient_angle = models.PositiveSmallIntegerField(
+        default=45,
+        validators=[MaxValueValidator(359)],
+        help_text=_("Direction of a linear gradient in degrees."),
+        db_comment="The direction of a linear gradient fill in degrees.",
+    )
+    fill_image = models.ImageField(
+        upload_to="fill_images/",
+        blank=True,
+        null=True,
+        validators=[validate_image_file],
+        help_text=_("Image whose colors are sampled by an image fill."),
+        db_comment="An optional image sampled to color the dark modules.",
+    )
 
     class Meta:
         verbose_name = _("QR Code")
         verbose_name_plural = _("QR Codes")
 
+    @property
+    def renditions(self) -> Dict[str, FieldFile]:
+        """The files of the ``SAGE_QRCODE_RENDITIONS`` of this code by alias.
+
+        They are stored next to ``qr_code_image`` whenever the code is saved
+        in the admin.
+        """
+        field = self._meta.get_field("qr_code_image")
+        return {
+            alias: FieldFile(self, field, rendition.get_name(self))
+            for alias, rendition in get_renditions().items()
+        }
+
     def __str__(self):
         return f"{self.__class__.__name__} {self.pk} - {self.title or 'No Title'}"
 
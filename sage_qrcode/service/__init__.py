@@ -1,13 +1,89 @@
-from .base import QRCodeBase
-from .barcode import BarcodeProxy
-from .contact_qrcode import ContactQRCode
-from .payment_qrcode import PaymentQRCode
-from .social_qrcode import SocialMediaQRCode
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .admission import (
+        AdmissionControl,
+        RenderEstimate,
+        RenderLimitExceeded,
+        estimate_render,
+        get_admission_control,
+    )
+    from .base import QRCodeBase
+    from .barcode import BarcodeProxy
+    from .contact_qrcode import ContactQRCode
+    from .payment_qrcode import PaymentQRCode
+    from .social_qrcode import SocialMediaQRCode
+    from .encoding import (
+        EncodingCache,
+        get_encoding_cache,
+        make_qr_code,
+        shared_encoding,
+    )
+    from .render_cache import RenderCache, get_render_cache, render_key
+    from .renderer import QRRenderer, RenderResult, RenderSpec, get_renderer, render
+
+# segno, Pillow, NumPy and python-barcode are only imported once a service is
+# first used, so loading the admin does not pay for them.
+_LAZY_ATTRIBUTES = {
+    "AdmissionControl": ".admission",
+    "RenderEstimate": ".admission",
+    "RenderLimitExceeded": ".admission",
+    "estimate_render": ".admission",
+    "get_admission_control": ".admission",
+    "QRCodeBase": ".base",
+    "BarcodeProxy": ".barcode",
+    "ContactQRCode": ".contact_qrcode",
+    "PaymentQRCode": ".payment_qrcode",
+    "SocialMediaQRCode": ".social_qrcode",
+    "EncodingCache": ".encoding",
+    "get_encoding_cache": ".encoding",
+    "make_qr_code": ".encoding",
+    "shared_encoding": ".encoding",
+    "RenderCache": ".render_cache",
+    "get_render_cache": ".render_cache",
+    "render_key": ".render_cache",
+    "QRRenderer": ".renderer",
+    "RenderResult": ".renderer",
+    "RenderSpec": ".renderer",
+    "get_renderer": ".renderer",
+    "render": ".renderer",
+}
 
 __all__ = [
+    "AdmissionControl",
+    "RenderEstimate",
+    "RenderLimitExceeded",
+    "estimate_render",
+    "get_admission_control",
     "QRCodeBase",
     "BarcodeProxy",
     "ContactQRCode",
     "PaymentQRCode",
     "SocialMediaQRCode",
+    "EncodingCache",
+    "get_encoding_cache",
+    "make_qr_code",
+    "shared_encoding",
+    "RenderCache",
+    "get_render_cache",
+    "render_key",
+    "QRRenderer",
+    "RenderResult",
+    "RenderSpec",
+    "get_renderer",
+    "render",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,498 @@
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+from django.utils.module_loading import import_string
+
+from sage_qrcode.conf import get_setting
+
+logger = logging.getLogger(__name__)
+
+ACTIONS = ("reject", "downscale", "queue")
+
+# Error correction codewords per block and number of blocks of versions 1 to
+# 40 (ISO/IEC 18004, table 9), indexed by ``version - 1``.
+# fmt: off
+_EC_CODEWORDS_PER_BLOCK = {
+    "l": (
+        7, 10, 15, 20, 26, 18, 20, 24, 30, 18,
+        20, 24, 26, 30, 22, 24, 28, 30, 28, 28,
+        28, 28, 30, 30, 26, 28, 30, 30, 30, 30,
+        30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+    ),
+    "m": (
+        10, 16, 26, 18, 24, 16, 18, 22, 22, 26,
+        30, 22, 22, 24, 24, 28, 28, 26, 26, 26,
+        26, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+        28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+    ),
+    "q": (
+        13, 22, 18, 26, 18, 24, 18, 22, 20, 24,
+        28, 26, 24, 20, 30, 24, 28, 28, 26, 30,
+        28, 30, 30, 30, 30, 28, 30, 30, 30, 30,
+        30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+    ),
+    "h": (
+        17, 28, 22, 16, 22, 28, 26, 26, 24, 28,
+        24, 28, 22, 24, 24, 30, 28, 28, 26, 28,
+        30, 24, 30, 30, 30, 30, 30, 30, 30, 30,
+        30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+    ),
+}
+_EC_BLOCKS = {
+    "l": (
+        1, 1, 1, 1, 1, 2, 2, 2, 2, 4,
+        4, 4, 4, 4, 6, 6, 6, 6, 7, 8,
+        8, 9, 9, 10, 12, 12, 12, 13, 14, 15,
+        16, 17, 18, 19, 19, 20, 21, 22, 24, 25,
+    ),
+    "m": (
+        1, 1, 1, 2, 2, 4, 4, 4, 5, 5,
+        5, 8, 9, 9, 10, 10, 11, 13, 14, 16,
+        17, 17, 18, 20, 21, 23, 25, 26, 28, 29,
+        31, 33, 35, 37, 38, 40, 43, 45, 47, 49,
+    ),
+    "q": (
+        1, 1, 2, 2, 4, 4, 6, 6, 8, 8,
+        8, 10, 12, 16, 12, 17, 16, 18, 21, 20,
+        23, 23, 25, 27, 29, 34, 34, 35, 38, 40,
+        43, 45, 48, 51, 53, 56, 59, 62, 65, 68,
+    ),
+    "h": (
+        1, 1, 2, 4, 4, 4, 5, 6, 8, 8,
+        11, 11, 16, 16, 18, 16, 19, 21, 25, 25,
+        25, 34, 30, 32, 35, 37, 40, 42, 45, 48,
+        51, 54, 57, 60, 63, 66, 70, 74, 77, 81,
+    ),
+}
+# fmt: on
+
+MAX_VERSION = 40
+QUIET_ZONE = 4
+# ``customize_qr_code`` always renders artistic codes at this scale.
+ARTISTIC_SCALE = 8
+
+
+def data_codewords(version: int, error: str) -> int:
+    """Returns the number of data codewords of a symbol version.
+
+    Args:
+        version (int): The symbol version, 1 to 40.
+        error (str): Error correction level ('l', 'm', 'q' or 'h').
+
+    Returns:
+        int: The codewords left for data after error correction.
+    """
+    modules = (16 * version + 128) * version + 64
+    if version >= 2:
+        alignments = version // 7 + 2
+        modules -= (25 * alignments - 10) * alignments - 55
+        if version >= 7:
+            modules -= 36
+    index = version - 1
+    return (
+        modules // 8 - _EC_CODEWORDS_PER_BLOCK[error][index] * _EC_BLOCKS[error][index]
+    )
+
+
+def byte_capacity(version: int, error: str) -> int:
+    """Returns how many bytes a symbol version holds in byte mode.
+
+    Args:
+        version (int): The symbol version, 1 to 40.
+        error (str): Error correction level ('l', 'm', 'q' or 'h').
+
+    Returns:
+        int: The byte mode capacity.
+    """
+    header_bits = 4 + (8 if version < 10 else 16)
+    return (data_codewords(version, error) * 8 - header_bits) // 8
+
+
+def estimate_version(length: int, error: str = "h") -> int:
+    """Returns the smallest version holding a payload in byte mode.
+
+    Numeric and alphanumeric payloads may fit a smaller version, so this is
+    an upper bound of what ``segno.make`` picks.
+
+    Args:
+        length (int): The payload length in bytes.
+        error (str, optional): Error correction level. Default is 'h'.
+
+    Returns:
+        int: The version, or 40 if the payload does not fit at all.
+    """
+    error = (error or "m").lower()
+    for version in range(1, MAX_VERSION + 1):
+        if byte_capacity(version, error) >= length:
+            return version
+    return MAX_VERSION
+
+
+def payload_length(data: Any) -> int:
+    """Returns the encoded length of a payload in bytes."""
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    return len(str(data).encode("utf-8"))
+
+
+def count_frames(path: os.PathLike) -> int:
+    """Returns the number of frames of a custom image without decoding them.
+
+    Args:
+        path (os.PathLike): Path to the image.
+
+    Returns:
+        int: The frame count, or 1 if the image cannot be read.
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(path) as image:
+            return getattr(image, "n_frames", 1)
+    except OSError as error:
+        logger.warning("Could not count frames of %s: %s", path, error)
+        return 1
+
+
+@dataclass(frozen=True)
+class RenderEstimate:
+    """The predicted cost of a raster render, computed before encoding.
+
+    Attributes:
+        version (int): Upper bound of the symbol version.
+        scale (int): Pixels per module.
+        frames (int): Number of frames, above 1 for animated custom images.
+        bytes_per_pixel (int): 4 for RGBA output, 1 for palette output.
+    """
+
+    version: int
+    scale: int
+    frames: int = 1
+    bytes_per_pixel: int = 4
+
+    @property
+    def width(self) -> int:
+        """The symbol width in modules, including the quiet zone."""
+        return 17 + 4 * self.version + 2 * QUIET_ZONE
+
+    @property
+    def pixels(self) -> int:
+        """The pixel count of one frame."""
+        return (self.width * self.scale) ** 2
+
+    @property
+    def nbytes(self) -> int:
+        """The expected size of the decoded image in memory."""
+        return self.pixels * self.frames * self.bytes_per_pixel
+
+    def rescaled(self, scale: int) -> "RenderEstimate":
+        """Returns the estimate of the same render at another scale."""
+        return RenderEstimate(self.version, scale, self.frames, self.bytes_per_pixel)
+
+    def as_dict(self) -> Dict[str, int]:
+        """Returns the estimate as metrics."""
+        return {
+            "version": self.version,
+            "scale": self.scale,
+            "frames": self.frames,
+            "pixels": self.pixels,
+            "bytes": self.nbytes,
+        }
+
+
+def estimate_render(
+    data: Any,
+    error: Optional[str] = "h",
+    scale: int = 10,
+    custom: Optional[os.PathLike] = None,
+    bytes_per_pixel: int = 4,
+) -> RenderEstimate:
+    """Predicts the cost of rendering a payload from its length alone.
+
+    Args:
+        data (Any): The payload to encode.
+        error (str, optional): Error correction level. Default is 'h'.
+        scale (int, optional): Pixels per module. Default is 10.
+        custom (os.PathLike, optional): A custom image, whose frames are
+            counted and which fixes the scale at ``ARTISTIC_SCALE``.
+        bytes_per_pixel (int, optional): Bytes per output pixel. Default is 4.
+
+    Returns:
+        RenderEstimate: The estimate.
+    """
+    version = estimate_version(payload_length(data), error)
+    if custom:
+        return RenderEstimate(version, ARTISTIC_SCALE, count_frames(custom), 4)
+    return RenderEstimate(version, scale, 1, bytes_per_pixel)
+
+
+class RenderLimitExceeded(ValueError):
+    """Raised when a render is over the configured limits.
+
+    Attributes:
+        estimate (RenderEstimate): The estimate of the render.
+        action (str): 'reject', or 'queue' when the render should be
+            repeated in the background.
+    """
+
+    def __init__(self, estimate: RenderEstimate, limits: List[str], action: str):
+        super().__init__(
+            "QR code render exceeds the {} limit ({} pixels, {} frames, "
+            "{} bytes).".format(
+                ", ".join(limits), estimate.pixels, estimate.frames, estimate.nbytes
+            )
+        )
+        self.estimate = estimate
+        self.limits = limits
+        self.action = action
+
+    def __reduce__(self):
+        # Keeps the attributes when the error crosses a process boundary.
+        return type(self), (self.estimate, self.limits, self.action)
+
+
+class RenderAdmitted(Exception):
+    """Raised by ``admit`` inside ``check_only`` once a render is admitted.
+
+    Attributes:
+        scale (int): The scale the render would use.
+    """
+
+    def __init__(self, scale: int):
+        super().__init__(scale)
+        self.scale = scale
+
+
+class AdmissionControl:
+    """Checks render estimates against limits and records them as metrics.
+
+    Attributes:
+        max_pixels (int, optional): Largest pixel count of one frame.
+        max_bytes (int, optional): Largest decoded image size in bytes.
+        max_frames (int, optional): Largest number of frames.
+        action (str): What happens to renders over a limit: 'reject',
+            'downscale' to the largest scale within the limits, or 'queue'.
+        queue (Callable, optional): Called with the model label and primary
+            key of a QR code whose render is queued.
+    """
+
+    def __init__(
+        self,
+        max_pixels: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_frames: Optional[int] = None,
+        action: str = "reject",
+        queue: Optional[Callable[[str, Any], None]] = None,
+    ) -> None:
+        """Initializes the limits and empty metrics.
+
+        Raises:
+            ValueError: If the action is unknown, or 'queue' has no queue.
+        """
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown render limit action: {action}")
+        if action == "queue" and queue is None:
+            raise ValueError("The 'queue' render limit action requires a 'QUEUE'.")
+        self.max_pixels = max_pixels
+        self.max_bytes = max_bytes
+        self.max_frames = max_frames
+        self.action = action
+        self.queue = queue
+        self._counters = dict.fromkeys(
+            ("estimates", "admitted", "downscaled", "rejected", "queued"), 0
+        )
+        self._totals = dict.fromkeys(("pixels", "bytes", "frames"), 0)
+        self._peaks = dict.fromkeys(("pixels", "bytes", "frames"), 0)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured."""
+        return bool(self.max_pixels or self.max_bytes or self.max_frames)
+
+    def exceeded(self, estimate: RenderEstimate) -> List[str]:
+        """Returns the names of the limits an estimate is over."""
+        limits = []
+        if self.max_pixels and estimate.pixels > self.max_pixels:
+            limits.append("pixel")
+        if self.max_bytes and estimate.nbytes > self.max_bytes:
+            limits.append("byte")
+        if self.max_frames and estimate.frames > self.max_frames:
+            limits.append("frame")
+        return limits
+
+    def admit(self, estimate: RenderEstimate) -> int:
+        """Checks an estimate and returns the scale to render at.
+
+        Args:
+            estimate (RenderEstimate): The estimate of the requested render.
+
+        Returns:
+            int: The requested scale, or a smaller one when downscaling.
+
+        Raises:
+            RenderLimitExceeded: If the render is rejected or queued.
+            RenderAdmitted: If it is admitted inside ``check_only``.
+        """
+        limits = self.exceeded(estimate) if not _unrestricted() else []
+        outcome, scale = "admitted", estimate.scale
+        if limits and self.action == "downscale" and "frame" not in limits:
+            while scale > 1 and self.exceeded(estimate.rescaled(scale)):
+                scale -= 1
+            if self.exceeded(estimate.rescaled(scale)):
+                outcome = "rejected"
+            else:
+                outcome = "downscaled"
+                logger.warning(
+                    "Downscaling QR code render from scale %s to %s.",
+                    estimate.scale,
+                    scale,
+                )
+        elif limits:
+            outcome = "queued" if self.action == "queue" else "rejected"
+        checking = _checking()
+        if not checking or outcome == "rejected":
+            self._record(estimate, outcome)
+        if outcome in ("rejected", "queued"):
+            logger.warning("QR code render %s: %s", outcome, estimate.as_dict())
+            raise RenderLimitExceeded(
+                estimate,
+                limits,
+                "queue" if outcome == "queued" else "reject",
+            )
+        if checking:
+            raise RenderAdmitted(scale)
+        return scale
+
+    def _record(self, estimate: RenderEstimate, outcome: str) -> None:
+        """Adds an estimate and its outcome to the metrics."""
+        values = {
+            "pixels": estimate.pixels,
+            "bytes": estimate.nbytes,
+            "frames": estimate.frames,
+        }
+        with self._lock:
+            self._counters["estimates"] += 1
+            self._counters[outcome] += 1
+            for name, value in values.items():
+                self._totals[name] += value
+                self._peaks[name] = max(self._peaks[name], value)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the render estimates and outcomes for monitoring.
+
+        Returns:
+            dict: Counts of estimates and of each outcome, the total and
+            peak pixels, bytes and frames, and the configured limits.
+        """
+        with self._lock:
+            return {
+                **self._counters,
+                "total": dict(self._totals),
+                "peak": dict(self._peaks),
+                "max_pixels": self.max_pixels,
+                "max_bytes": self.max_bytes,
+                "max_frames": self.max_frames,
+                "action": self.action,
+            }
+
+
+def build_admission_control(
+    config: Optional[Mapping[str, Any]],
+) -> AdmissionControl:
+    """Creates the admission control from the ``SAGE_QRCODE_RENDER_LIMITS`` setting.
+
+    Args:
+        config (Mapping, optional): 'MAX_PIXELS', 'MAX_BYTES', 'MAX_FRAMES',
+            'ACTION' and 'QUEUE' (a callable or its dotted path).
+
+    Returns:
+        AdmissionControl: The admission control; without limits it admits
+        every render and only records the estimates.
+    """
+    config = config or {}
+    queue = config.get("QUEUE")
+    if isinstance(queue, str):
+        queue = import_string(queue)
+    return AdmissionControl(
+        max_pixels=config.get("MAX_PIXELS"),
+        max_bytes=config.get("MAX_BYTES"),
+        max_frames=config.get("MAX_FRAMES"),
+        action=config.get("ACTION", "reject"),
+        queue=queue,
+    )
+
+
+_admission_control: Optional[AdmissionControl] = None
+_admission_control_lock = threading.Lock()
+
+
+def get_admission_control() -> AdmissionControl:
+    """Returns the process-wide admission control, creating it on first use.
+
+    Returns:
+        AdmissionControl: The shared instance.
+    """
+    global _admission_control
+    if _admission_control is None:
+        with _admission_control_lock:
+            if _admission_control is None:
+                _admission_control = build_admission_control(
+                    get_setting("RENDER_LIMITS")
+                )
+    return _admission_control
+
+
+def reset_admission_control() -> None:
+    """Discards the shared instance so the next use re-reads the settings."""
+    global _admission_control
+    with _admission_control_lock:
+        _admission_control = None
+
+
+_local = threading.local()
+
+
+def _unrestricted() -> bool:
+    return getattr(_local, "unrestricted", False)
+
+
+@contextmanager
+def unrestricted() -> Iterator[None]:
+    """Admits every render of the current thread inside the block.
+
+    Background workers rendering queued codes use this, since the limits
+    exist to keep heavy renders out of request handling. Estimates are
+    still recorded.
+    """
+    previous = _unrestricted()
+    _local.unrestricted = True
+    try:
+        yield
+    finally:
+        _local.unrestricted = previous
+
+
+def _checking() -> bool:
+    return getattr(_local, "checking", False)
+
+
+@contextmanager
+def check_only() -> Iterator[None]:
+    """Stops every render of the current thread once it is admitted.
+
+    Inside the block ``admit`` raises ``RenderAdmitted`` instead of
+    returning, so a render is checked against the limits before anything
+    is encoded. Only rejections are recorded, as admitted and queued
+    renders are recorded again when they run.
+    """
+    previous = _checking()
+    _local.checking = True
+    try:
+        yield
+    finally:
+        _local.checking = previous
@@ -1,10 +1,8 @@
 import uuid
+from importlib import import_module
 from io import BytesIO
 import logging
-from typing import Optional
-from barcode import get_barcode_class
-from barcode.writer import ImageWriter
-import pyshorteners
+from typing import Any, Dict, Mapping, Optional
 from sage_qrcode.helpers.type import ColorName
 
 try:
@@ -14,18 +12,73 @@ except ImportError as exc:
 
 logger = logging.getLogger(__name__)
 
+# python-barcode and pyshorteners are imported on the first barcode render.
+_LAZY_IMPORTS = {
+    "get_barcode_class": ("barcode", "get_barcode_class"),
+    "ImageWriter": ("barcode.writer", "ImageWriter"),
+    "pyshorteners": ("pyshorteners", None),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_IMPORTS[name]
+    value = import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def _lazy_import(name: str) -> Any:
+    """Returns a lazily imported dependency, honouring patched module attributes."""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
 class BarcodeProxy:
     """A proxy class for generating and handling barcodes.
 
     Attributes:
         barcode_image (Optional[Image.Image]): Stores the generated barcode image.
+        batch_methods (Dict[str, str]): Maps a render ``kind`` to the method
+            that generates it.
     """
 
+    batch_methods: Dict[str, str] = {
+        "barcode": "generate_barcode",
+        "barcode_url": "create_url",
+        "barcode_text": "create_text_barcode",
+    }
+
     def __init__(self) -> None:
         """Initializes a new instance of BarcodeProxy with no barcode image."""
         logger.info("Initializing BarcodeProxy instance.")
         self.barcode_image: Optional[Image.Image] = None
 
+    def render_spec(
+        self, kind: str, image_format: str, options: Mapping[str, Any]
+    ) -> Dict[str, Any]:
+        """Describes everything that determines the bytes of a rendered barcode.
+
+        Args:
+            kind (str): The render kind.
+            image_format (str): The requested output format.
+            options (Mapping[str, Any]): The keyword arguments of the render.
+
+        Returns:
+            dict: The render spec used as the render cache key.
+        """
+        return {
+            **options,
+            "service": type(self).__name__,
+            "kind": kind,
+            "format": image_format.lower(),
+        }
+
     def shorten_url(self, url: str) -> str:
         """Shortens the provided URL using the TinyURL service.
 
@@ -36,7 +89,7 @@ class BarcodeProxy:
             str: The shortened URL.
         """
         logger.debug("Shortening URL: %s", url)
-        shortener = pyshorteners.Shortener()
+        shortener = _lazy_import("pyshorteners").Shortener()
         shortened_url = shortener.tinyurl.short(url)
         logger.info("Shortened URL: %s", shortened_url)
         return shortened_url
@@ -68,8 +121,8 @@ class BarcodeProxy:
             logger.info("Data is a long URL, shortening it...")
             data = self.shorten_url(data)
 
-        barcode_class = get_barcode_class(barcode_type)
-        barcode_instance = barcode_class(data, writer=ImageWriter())
+        barcode_class = _lazy_import("get_barcode_class")(barcode_type)
+        barcode_instance = barcode_class(data, writer=_lazy_import("ImageWriter")())
         buffer = BytesIO()
         barcode_instance.write(
             buffer,
@@ -1,7 +1,20 @@
+import io
 import logging
 import os
+import shutil
+import tempfile
 import uuid
-from typing import Optional
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
 from pathlib import Path
 
 import segno
@@ -11,79 +24,580 @@ try:
 except ImportError as exc:
     raise ImportError("Install `pillow` package. Run `pip install pillow`.") from exc
 
+from sage_qrcode.conf import get_setting
 from sage_qrcode.helpers.type import HexCode
+from sage_qrcode.service.admission import (
+    ARTISTIC_SCALE,
+    estimate_render,
+    get_admission_control,
+)
+from sage_qrcode.service.encoding import EncodingCache, make_qr_code
+from sage_qrcode.service.error_level import resolve_error_level
+from sage_qrcode.service.fills import Fill
+from sage_qrcode.service.raster import (
+    colorize_template,
+    numpy_available,
+    rasterize,
+    rasterize_indexed,
+)
+from sage_qrcode.service.render_cache import get_render_cache
+from sage_qrcode.service.shapes import rasterize_shapes
+from sage_qrcode.service.streaming import (
+    DEFAULT_STREAMING_MIN_PIXELS,
+    may_need_streaming,
+    stream_png,
+)
+from sage_qrcode.service.symbols import get_symbol_cache
+from sage_qrcode.utils import encode_image
+from sage_qrcode.utils.composition import Decoration
+from sage_qrcode.utils.layers import get_layer_cache
 
 logger = logging.getLogger(__name__)
 
 
+class _SpooledBuffer(tempfile.SpooledTemporaryFile):
+    """A spooled temporary file that hides its file descriptor while it is
+    still held in memory.
+
+    Pillow's encoders write straight to ``fileno()`` when available, which
+    would otherwise force every spooled file to roll over to disk.
+    """
+
+    def fileno(self) -> int:
+        if not self._rolled:
+            raise io.UnsupportedOperation("fileno")
+        return super().fileno()
+
+
 class QRCodeBase:
     """A base class for generating and handling QR codes.
 
     Attributes:
         qr_image (Optional[Image.Image]): Stores the generated QR code image.
+        qr_vector (Optional[bytes]): Stores the generated QR code when a vector
+            output format (SVG, PDF or EPS) is requested.
+        qr_file (Optional[IO[bytes]]): A temporary file holding the streamed
+            PNG when a raster is too large to build in memory.
+        output_format (str): The output format of the last generated QR code.
+        batch_methods (Dict[str, str]): Maps the ``kind`` of a batch spec to
+            the method that generates it.
     """
 
+    VECTOR_FORMATS = ("svg", "pdf", "eps")
+
+    batch_methods: Dict[str, str] = {"qr_code": "generate_qr_code"}
+    default_batch_kind = "qr_code"
+
     def __init__(self) -> None:
         """Initializes a new instance of QRCodeBase with no QR code image."""
         logger.info("Initializing QRCodeBase instance.")
         self.qr_image: Optional[Image.Image] = None
+        self.qr_vector: Optional[bytes] = None
+        self.qr_file: Optional[IO[bytes]] = None
+        self.output_format = "png"
+
+    @classmethod
+    def is_vector_format(cls, output_format: Optional[str]) -> bool:
+        """Returns True if the output format is rendered by segno's vector writers."""
+        return bool(output_format) and output_format.lower() in cls.VECTOR_FORMATS
+
+    @property
+    def is_encoded(self) -> bool:
+        """Whether the last QR code was written as a document or streamed file."""
+        return self.qr_vector is not None or self.qr_file is not None
 
     def generate_qr_code(
         self,
         data: dict,
         scale: int = 10,
-        error: str = "h",
+        error: Optional[str] = None,
         custom: Path = None,
         color: HexCode = "#000000",
         color2: HexCode = "#FFFFFF",
         color3: HexCode = "#000000",
+        rasterizer: Optional[str] = None,
+        output_format: str = "png",
+        image_mode: Optional[str] = None,
+        fill: Union[Fill, Mapping[str, Any], None] = None,
+        module_shape: Optional[str] = None,
+        finder_shape: Optional[str] = None,
+        decorations: Sequence[Decoration] = (),
     ) -> bool:
         """Generates a QR code image based on the provided data and parameters.
 
+        Flat-colored raster symbols are colored and scaled from a template
+        cached per payload at one pixel per module (see
+        ``SAGE_QRCODE_SYMBOL_CACHE_SIZE``), so changing only the colors or
+        the scale neither encodes nor rasterizes the payload again. The
+        finished raster is kept as the base layer of the layer cache (see
+        ``SAGE_QRCODE_LAYER_CACHE_SIZE``), and ``qr_image`` receives a copy.
+
+        Before anything is encoded, raster renders are estimated from the
+        payload length and checked against ``SAGE_QRCODE_RENDER_LIMITS``,
+        which may lower the scale or reject the render.
+
+        Rasters of at least ``SAGE_QRCODE_STREAMING_MIN_PIXELS`` pixels are
+        written by ``stream_png`` into the temporary file ``qr_file`` instead,
+        so they never exist as an image in memory. Streaming only draws flat
+        squares, so it is skipped, with a warning, for codes with a fill,
+        module shapes or decorations.
+
         Args:
             data (dict): The data to encode in the QR code.
             scale (int, optional): Scale factor for the QR code size. Default is 10.
-            error (str, optional): Error correction level ('h', 'q', 'm', 'l'). Default is 'h'.
+            error (str, optional): Error correction level ('h', 'q', 'm', 'l'),
+                or 'auto' for the lowest level that still leaves
+                ``SAGE_QRCODE_ERROR_SAFETY_MARGIN`` of recovery once the
+                decorations are drawn. Defaults to the
+                ``SAGE_QRCODE_ERROR_LEVEL`` setting, or 'h'.
             custom (str): Path to a custom image to overlay on the QR code. Default is None.
             color (str, optional): Color of the QR code. Default is '#000000'.
             color2 (str, optional): Background color of the QR code. Default is '#FFFFFF'.
             color3 (str, optional): Finder pattern color of the QR code. Default is '#000000'.
+            rasterizer (str, optional): 'pil' to render through segno's ``to_pil`` or
+                'numpy' for the vectorized rasterizer when the symbol cache is
+                disabled. Defaults to the ``SAGE_QRCODE_RASTERIZER`` setting, or 'pil'.
+            output_format (str, optional): 'png' for a raster image, or 'svg', 'pdf'
+                or 'eps' to write the symbol with segno's vector writers into
+                ``qr_vector`` without rasterizing. Default is 'png'.
+            image_mode (str, optional): 'RGBA' for a 32-bit image, or 'auto' to keep
+                the symbol as a palette (``P``) or 1-bit (``1``) image until a
+                decoration needs alpha. Defaults to the ``SAGE_QRCODE_IMAGE_MODE``
+                setting, or 'RGBA'.
+            fill (Fill or dict, optional): A linear, radial or image fill for the
+                dark modules, replacing ``color``. Needs NumPy and a raster
+                output; otherwise the flat color is used. Default is None.
+            module_shape (str, optional): 'square', 'dots', 'rounded' or a
+                registered module shape, stamped from cached sprites. Needs
+                NumPy and a raster output. Default is None (squares).
+            finder_shape (str, optional): 'square', 'rounded', 'circle' or a
+                registered finder pattern shape. Default is None (squares).
+            decorations (Sequence[Decoration], optional): The icons, frames and
+                captions the caller draws over the symbol afterwards. They are
+                measured for ``error='auto'`` and keep the symbol from being
+                streamed. Default is none.
 
         Returns:
-            bool: True if a custom QR code is generated, False otherwise.
+            bool: True if a custom, vector or streamed QR code is generated,
+            False otherwise.
+
+        Raises:
+            RenderLimitExceeded: If the render is over the configured limits
+                and rejected or queued.
         """
         logger.debug("Generating QR code with data: %s", data)
-        qr_code = segno.make(data, error=error)
+        self.output_format = output_format.lower()
+        self.qr_vector = None
+        self.qr_file = None
+        fill = Fill.from_value(fill)
+
+        if self.is_vector_format(output_format):
+            if custom:
+                logger.warning("Custom images are not supported in vector output.")
+            if fill:
+                logger.warning("Fills are not supported in vector output.")
+            if module_shape or finder_shape:
+                logger.warning("Module shapes are not supported in vector output.")
+            error = resolve_error_level(error, data)
+            self.qr_image = None
+            self.qr_vector = self.export_vector(
+                make_qr_code(data, error=error),
+                output_format,
+                scale,
+                color,
+                color2,
+                color3,
+            )
+            return True
+
+        image_mode = (image_mode or get_setting("IMAGE_MODE", "RGBA")).lower()
+        indexed = image_mode == "auto" and not (fill or module_shape or finder_shape)
+        error = resolve_error_level(
+            error, data, decorations, ARTISTIC_SCALE if custom else scale, indexed
+        )
+        scale = get_admission_control().admit(
+            estimate_render(data, error, scale, custom, 1 if indexed else 4)
+        )
+
+        min_pixels = get_setting("STREAMING_MIN_PIXELS", DEFAULT_STREAMING_MIN_PIXELS)
+        if not custom and may_need_streaming(scale, min_pixels):
+            qr_code = make_qr_code(data, error=error)
+            width, height = qr_code.symbol_size(scale=scale)
+            if width * height >= min_pixels:
+                if not (fill or module_shape or finder_shape or decorations):
+                    self.qr_image = None
+                    self.qr_file = self.stream_symbol(
+                        qr_code, scale, color, color2, color3
+                    )
+                    return True
+                # Streamed output has flat squares only, so styled and
+                # decorated codes are still built in memory.
+                logger.warning(
+                    "QR code of %sx%s pixels has a fill, module shapes or "
+                    "decorations and is not streamed.",
+                    width,
+                    height,
+                )
 
         if custom:
             logger.info("Applying custom image to QR code.")
-            self.qr_image = self.customize_qr_code(qr_code, custom)
+            self.qr_image = self.customize_qr_code(
+                make_qr_code(data, error=error), custom, scale
+            )
             return True
 
-        try:
-            self.qr_image = qr_code.to_pil(
-                scale=scale, dark=color, light=color2, finder_dark=color3
+        shaped = bool(module_shape or finder_shape)
+        if (fill or shaped) and not numpy_available():
+            logger.warning(
+                "Fills and module shapes require NumPy; using flat squares instead."
+            )
+            fill, shaped = None, False
+        if not shaped:
+            module_shape = finder_shape = None
+
+        rasterizer = rasterizer or get_setting("RASTERIZER", "pil")
+        symbol_key = EncodingCache.make_key(data, error)
+        layer_key = None
+        if symbol_key is not None:
+            layer_key = symbol_key + (
+                scale,
+                color,
+                color2,
+                color3,
+                rasterizer,
+                image_mode,
+                fill,
+                module_shape,
+                finder_shape,
             )
+        layer_cache = get_layer_cache()
+        image = layer_cache.get_or_create(
+            "base",
+            layer_key,
+            lambda: self.render_symbol(
+                data,
+                scale,
+                error,
+                color,
+                color2,
+                color3,
+                rasterizer,
+                image_mode,
+                fill,
+                module_shape,
+                finder_shape,
+            ),
+        )
+        # Decorations are drawn onto the image in place, so the cached base
+        # layer is never handed out.
+        self.qr_image = image.copy() if layer_cache.enabled else image
+        logger.info("QR code generated in %s mode.", self.qr_image.mode)
+        return False
+
+    def render_symbol(
+        self,
+        data: Any,
+        scale: int,
+        error: str,
+        color: HexCode,
+        color2: HexCode,
+        color3: HexCode,
+        rasterizer: str,
+        image_mode: str,
+        fill: Optional[Fill] = None,
+        module_shape: Optional[str] = None,
+        finder_shape: Optional[str] = None,
+    ) -> Image.Image:
+        """Rasterizes a symbol without decorations, the base layer of a QR code.
+
+        Args:
+            data (Any): The data to encode in the QR code.
+            scale (int): Scale factor for the QR code size.
+            error (str): Error correction level.
+            color (str): Color of the QR code.
+            color2 (str): Background color of the QR code.
+            color3 (str): Finder pattern color of the QR code.
+            rasterizer (str): 'pil' or 'numpy', used when the symbol cache is
+                disabled.
+            image_mode (str): 'auto' or 'rgba'.
+            fill (Fill, optional): The fill of the dark modules. Default is None.
+            module_shape (str, optional): The module shape. Default is None.
+            finder_shape (str, optional): The finder pattern shape. Default is None.
+
+        Returns:
+            Image.Image: The rasterized symbol.
+        """
+        shaped = bool(module_shape or finder_shape)
+        symbol_cache = get_symbol_cache()
+        if symbol_cache.enabled and not (fill or shaped):
+            template = symbol_cache.get_template(
+                data, error, lambda: make_qr_code(data, error=error)
+            )
+            return self.colorize_symbol(
+                template, scale, color, color2, color3, image_mode
+            )
+
+        qr_code = make_qr_code(data, error=error)
+        if image_mode == "auto" and not (fill or shaped):
+            try:
+                return rasterize_indexed(
+                    qr_code, scale=scale, dark=color, light=color2, finder_dark=color3
+                )
+            except ValueError as error:
+                logger.error("Error applying color: %s", error)
+                return rasterize_indexed(qr_code, scale=scale)
+
+        try:
+            if shaped:
+                image = rasterize_shapes(
+                    qr_code,
+                    scale=scale,
+                    dark=color,
+                    light=color2,
+                    finder_dark=color3,
+                    fill=fill,
+                    module_shape=module_shape or "square",
+                    finder_shape=finder_shape or "square",
+                )
+            elif fill or (rasterizer == "numpy" and numpy_available()):
+                image = rasterize(
+                    qr_code,
+                    scale=scale,
+                    dark=color,
+                    light=color2,
+                    finder_dark=color3,
+                    fill=fill,
+                )
+            else:
+                image = qr_code.to_pil(
+                    scale=scale, dark=color, light=color2, finder_dark=color3
+                )
         except ValueError as error:
             logger.error("Error applying color: %s", error)
-            self.qr_image = qr_code.to_pil(scale=scale)
+            image = qr_code.to_pil(scale=scale)
 
-        if self.qr_image.mode != "RGBA":
-            self.qr_image = self.qr_image.convert("RGBA")
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+        return image
 
-        logger.info("QR code generated successfully.")
-        return False
+    @staticmethod
+    def colorize_symbol(
+        template: Image.Image,
+        scale: int = 10,
+        color: HexCode = "#000000",
+        color2: HexCode = "#FFFFFF",
+        color3: HexCode = "#000000",
+        image_mode: str = "rgba",
+    ) -> Image.Image:
+        """Colors a cached symbol template by swapping its palette and
+        enlarges it to the requested scale.
+
+        Args:
+            template (Image.Image): The palette indices of the symbol at one
+                pixel per module.
+            scale (int, optional): Pixels per module. Default is 10.
+            color (str, optional): Color of the QR code. Default is '#000000'.
+            color2 (str, optional): Background color of the QR code. Default is '#FFFFFF'.
+            color3 (str, optional): Finder pattern color of the QR code. Default is '#000000'.
+            image_mode (str, optional): 'auto' to keep the palette (``P``) or
+                1-bit (``1``) image, anything else for RGBA. Default is 'rgba'.
+
+        Returns:
+            Image.Image: The colored symbol.
+        """
+        try:
+            image = colorize_template(template, color, color2, color3, scale)
+        except ValueError as error:
+            logger.error("Error applying color: %s", error)
+            image = colorize_template(template, scale=scale)
+        if image_mode != "auto":
+            image = image.convert("RGBA")
+        return image
+
+    @staticmethod
+    def stream_symbol(
+        qr_code: segno.QRCode,
+        scale: int = 10,
+        color: HexCode = "#000000",
+        color2: HexCode = "#FFFFFF",
+        color3: HexCode = "#000000",
+    ) -> IO[bytes]:
+        """Writes a symbol as a PNG band by band, without building an image.
+
+        The PNG goes to a temporary file, so neither the pixels nor the
+        encoded image are ever held in memory as a whole.
 
-    def show_qr_code(self, save: bool = False) -> Image.Image:
+        Args:
+            qr_code (segno.QRCode): The encoded symbol.
+            scale (int, optional): Pixels per module. Default is 10.
+            color (str, optional): Color of the QR code. Default is '#000000'.
+            color2 (str, optional): Background color of the QR code. Default is '#FFFFFF'.
+            color3 (str, optional): Finder pattern color of the QR code. Default is '#000000'.
+
+        Returns:
+            IO[bytes]: The temporary file holding the PNG, rewound to its start.
+        """
+        target = tempfile.TemporaryFile()
+        try:
+            width, height = stream_png(qr_code, target, scale, color, color2, color3)
+        except ValueError as error:
+            logger.error("Error applying color: %s", error)
+            target.seek(0)
+            target.truncate()
+            width, height = stream_png(qr_code, target, scale)
+        target.seek(0)
+        logger.info("QR code streamed as a %sx%s PNG.", width, height)
+        return target
+
+    def generate_many(
+        self, specs: Iterable[Mapping[str, Any]], image_format: str = "PNG"
+    ) -> Iterator[bytes]:
+        """Generates QR codes for a stream of specs, one encoded image at a time.
+
+        Each spec holds the keyword arguments of one of the ``batch_methods``
+        plus an optional ``kind`` selecting that method. A single worker
+        instance renders the whole batch and drops every image as soon as it
+        is encoded, so memory stays flat however long the batch is. Fonts,
+        icons and encoded symbols are shared through the process-wide caches,
+        and specs already rendered are served from the render cache when
+        ``SAGE_QRCODE_RENDER_CACHE`` is configured.
+
+        Args:
+            specs (Iterable[Mapping[str, Any]]): The payload and style specs.
+            image_format (str, optional): A Pillow format name, or 'svg', 'pdf'
+                or 'eps' for vector output. Default is "PNG".
+
+        Yields:
+            bytes: The encoded image for each spec, in input order.
+
+        Raises:
+            ValueError: If a spec names an unsupported kind.
+        """
+        worker = type(self)()
+        vector = self.is_vector_format(image_format)
+        render_cache = get_render_cache()
+        for count, spec in enumerate(specs, start=1):
+            options = dict(spec)
+            kind = options.pop("kind", self.default_batch_kind)
+            method_name = self.batch_methods.get(kind)
+            if method_name is None:
+                logger.error("Unsupported batch kind: %s", kind)
+                raise ValueError(f"Unsupported QR code kind: {kind}")
+            if vector:
+                options["output_format"] = image_format
+
+            def render() -> bytes:
+                getattr(worker, method_name)(**options)
+                image, worker.qr_image = worker.qr_image, None
+                document, worker.qr_vector = worker.qr_vector, None
+                streamed, worker.qr_file = worker.qr_file, None
+                logger.debug("Encoding batch item %s of kind %s.", count, kind)
+                if document is not None:
+                    return document
+                if streamed is not None:
+                    with streamed:
+                        return streamed.read()
+                return encode_image(image, image_format)
+
+            if render_cache is None:
+                yield render()
+                continue
+            yield render_cache.get_or_render(
+                self.render_spec(kind, image_format, options), render
+            )
+
+    def render_spec(
+        self, kind: str, image_format: str, options: Mapping[str, Any]
+    ) -> Dict[str, Any]:
+        """Describes everything that determines the bytes of a batch item.
+
+        The service class and kind fix the frame, caption and icon; the
+        options carry the payload, scale, colors and custom image.
+
+        Args:
+            kind (str): The batch kind of the item.
+            image_format (str): The requested output format.
+            options (Mapping[str, Any]): The keyword arguments of the item.
+
+        Returns:
+            dict: The render spec used as the render cache key.
+        """
+        return {
+            **options,
+            "service": type(self).__name__,
+            "kind": kind,
+            "format": image_format.lower(),
+            "image_mode": get_setting("IMAGE_MODE", "RGBA"),
+            "error_level": get_setting("ERROR_LEVEL", "h"),
+            "error_margin": get_setting("ERROR_SAFETY_MARGIN"),
+        }
+
+    def export_vector(
+        self,
+        qr_code: segno.QRCode,
+        output_format: str = "svg",
+        scale: int = 10,
+        color: HexCode = "#000000",
+        color2: HexCode = "#FFFFFF",
+        color3: HexCode = "#000000",
+    ) -> bytes:
+        """Serializes a symbol with segno's native SVG, PDF or EPS writer.
+
+        Args:
+            qr_code (segno.QRCode): The encoded symbol.
+            output_format (str, optional): 'svg', 'pdf' or 'eps'. Default is 'svg'.
+            scale (int, optional): Size of a module in the output units. Default is 10.
+            color (str, optional): Color of the QR code. Default is '#000000'.
+            color2 (str, optional): Background color of the QR code. Default is '#FFFFFF'.
+            color3 (str, optional): Finder pattern color of the QR code, only
+                supported by SVG. Default is '#000000'.
+
+        Returns:
+            bytes: The serialized document.
+        """
+        kind = output_format.lower()
+        options = {"kind": kind, "scale": scale, "dark": color, "light": color2}
+        if kind == "svg":
+            options["finder_dark"] = color3
+
+        # The EPS writer emits text, the other writers emit bytes.
+        buffer = io.StringIO() if kind == "eps" else io.BytesIO()
+        try:
+            qr_code.save(buffer, **options)
+        except ValueError as error:
+            logger.error("Error applying color: %s", error)
+            buffer = io.StringIO() if kind == "eps" else io.BytesIO()
+            qr_code.save(buffer, kind=kind, scale=scale)
+
+        logger.info("QR code written as %s.", kind.upper())
+        value = buffer.getvalue()
+        return value.encode("ascii") if kind == "eps" else value
+
+    def show_qr_code(self, save: bool = False) -> Union[Image.Image, bytes, IO[bytes]]:
         """Displays the generated QR code image.
 
         Args:
             save (bool, optional): Whether to save the QR code image to a file. Default is False.
 
         Returns:
-            Image.Image: The generated QR code image.
+            Union[Image.Image, bytes, IO[bytes]]: The generated QR code image,
+            the serialized document for vector output formats, or the
+            temporary file of a streamed PNG, rewound to its start.
         """
         logger.debug("Attempting to display QR code.")
+        if self.qr_file is not None:
+            if save:
+                logger.info("Saving streamed QR code.")
+                self.save_qr_code()
+            self.qr_file.seek(0)
+            return self.qr_file
+
+        if self.qr_vector is not None:
+            if save:
+                logger.info("Saving QR code %s.", self.output_format.upper())
+                self.save_qr_code()
+            return self.qr_vector
+
         if self.qr_image is None:
             logger.error("No QR code image to display.")
             raise ValueError("QR code image is not generated.")
@@ -99,6 +613,21 @@ class QRCodeBase:
     def save_qr_code(self) -> None:
         """Saves the generated QR code image to a file."""
         logger.debug("Attempting to save QR code image.")
+        if self.qr_file is not None:
+            unique_filename = f"{uuid.uuid4()}.png"
+            self.qr_file.seek(0)
+            with open(unique_filename, "wb") as target:
+                shutil.copyfileobj(self.qr_file, target)
+            logger.info("QR code saved as %s", unique_filename)
+            return
+
+        if self.qr_vector is not None:
+            unique_filename = f"{uuid.uuid4()}.{self.output_format}"
+            with open(unique_filename, "wb") as target:
+                target.write(self.qr_vector)
+            logger.info("QR code saved as %s", unique_filename)
+            return
+
         if self.qr_image is None:
             logger.error("No QR code image to save.")
             raise ValueError("QR code image is not generated.")
@@ -108,23 +637,67 @@ class QRCodeBase:
         logger.info("QR code image saved as %s", unique_filename)
 
     def customize_qr_code(
-        self, qr_code: segno.QRCode, path: str, scale: int = 10
+        self,
+        qr_code: segno.QRCode,
+        path: str,
+        scale: int = ARTISTIC_SCALE,
+        in_memory: Optional[bool] = None,
     ) -> Image.Image:
         """Applies custom styling to the QR code by overlaying it with another
         image.
 
+        By default the artistic output is rendered into an in-memory buffer
+        (or a spooled temporary file once it grows beyond
+        ``SAGE_QRCODE_ARTISTIC_SPOOL_MAX_SIZE`` bytes) and decoded from there,
+        so no file is written to the working directory.
+
         Args:
             qr_code (segno.QRCode): The QR code object to customize.
             path (str): Path to the custom image file.
-            scale (int, optional): Scale factor for the custom image. Default is 10.
+            scale (int, optional): Scale factor for the custom image. Default is 8.
+            in_memory (bool, optional): Whether to render without touching the
+                filesystem. Defaults to the ``SAGE_QRCODE_ARTISTIC_IN_MEMORY``
+                setting, or True.
 
         Returns:
             Image.Image: The customized QR code image.
         """
         logger.debug("Customizing QR code with image from path: %s", path)
         target_extension = os.path.splitext(path)[1]
-        unique_filename = f"{uuid.uuid4()}{target_extension}"
-        qr_code.to_artistic(background=path, target=unique_filename, scale=8)
-        customized_qr = Image.open(unique_filename)
-        logger.info("Customized QR code generated successfully.")
+        if in_memory is None:
+            in_memory = get_setting("ARTISTIC_IN_MEMORY", True)
+
+        if not in_memory:
+            unique_filename = f"{uuid.uuid4()}{target_extension}"
+            qr_code.to_artistic(background=path, target=unique_filename, scale=scale)
+            customized_qr = Image.open(unique_filename)
+            logger.info("Customized QR code generated successfully.")
+            return customized_qr
+
+        buffer = self._artistic_buffer()
+        qr_code.to_artistic(
+            background=path,
+            target=buffer,
+            kind=target_extension.lstrip(".").lower() or "png",
+            scale=scale,
+        )
+        buffer.seek(0)
+        # The image keeps a reference to the buffer so that further frames of
+        # an animated background can still be decoded lazily.
+        customized_qr = Image.open(buffer)
+        customized_qr.load()
+        logger.info("Customized QR code generated in memory successfully.")
         return customized_qr
+
+    @staticmethod
+    def _artistic_buffer() -> IO[bytes]:
+        """Returns the in-memory target for artistic renders.
+
+        Returns:
+            IO[bytes]: A ``BytesIO`` or, if a spool threshold is configured, a
+            spooled temporary file that moves to disk above that size.
+        """
+        max_size = get_setting("ARTISTIC_SPOOL_MAX_SIZE")
+        if max_size:
+            return _SpooledBuffer(max_size=max_size)
+        return io.BytesIO()
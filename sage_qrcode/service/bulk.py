@@ -0,0 +1,247 @@
+import logging
+import os
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import resource_tracker, shared_memory
+from typing import Deque, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sage_qrcode.conf import get_setting
+from sage_qrcode.service.renderer import RenderResult, RenderSpec, get_renderer
+from sage_qrcode.utils.fonts import get_font_registry
+from sage_qrcode.utils.icons import get_icon_cache
+
+logger = logging.getLogger(__name__)
+
+# (position, shared memory name, content size, kind, image format)
+SharedHandle = Tuple[int, str, int, str, str]
+
+
+def warm_worker() -> None:
+    """Preloads the package icons, the default font and the renderer.
+
+    Used as the pool initializer so that the first render of every worker
+    does not pay for decoding icons or loading fonts.
+    """
+    get_icon_cache().preload()
+    get_font_registry().get_font()
+    get_renderer()
+    logger.debug("Bulk render worker %s warmed up.", os.getpid())
+
+
+def _create_block(size: int) -> shared_memory.SharedMemory:
+    """Creates a shared memory block that is only unlinked explicitly."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(create=True, size=size, track=False)
+    return shared_memory.SharedMemory(create=True, size=size)
+
+
+def _disown(block: shared_memory.SharedMemory) -> None:
+    """Keeps the worker's resource tracker from unlinking a published block."""
+    if sys.version_info < (3, 13) and os.name == "posix":
+        # POSIX blocks are tracked under their name with a leading slash.
+        resource_tracker.unregister(f"/{block.name}", "shared_memory")
+
+
+def _render_chunk(chunk: Sequence[Tuple[int, RenderSpec]]) -> List[SharedHandle]:
+    """Renders a chunk of specs and publishes each result in shared memory.
+
+    Only the small handles are pickled back to the parent, which reads and
+    unlinks the shared memory blocks. If a spec fails, the blocks of the
+    chunk created so far are unlinked before the error is raised.
+
+    Args:
+        chunk (Sequence[tuple]): Pairs of input position and spec.
+
+    Returns:
+        list: One handle per spec.
+    """
+    renderer = get_renderer()
+    handles, blocks = [], []
+    try:
+        for position, spec in chunk:
+            result = renderer.render(spec)
+            size = len(result.content)
+            block = _create_block(max(size, 1))
+            blocks.append(block)
+            block.buf[:size] = result.content
+            handles.append(
+                (position, block.name, size, result.kind, result.image_format)
+            )
+    except BaseException:
+        for block in blocks:
+            block.close()
+            block.unlink()
+        raise
+    for block in blocks:
+        block.close()
+        _disown(block)
+    return handles
+
+
+def _read_handle(handle: SharedHandle) -> Tuple[int, RenderResult]:
+    """Copies a result out of shared memory and releases the block."""
+    position, name, size, kind, image_format = handle
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        content = bytes(block.buf[:size])
+    finally:
+        block.close()
+        block.unlink()
+    return position, RenderResult(kind, image_format, content)
+
+
+def _release_handle(handle: SharedHandle) -> None:
+    """Releases the shared memory of a result that is not consumed."""
+    try:
+        block = shared_memory.SharedMemory(name=handle[1])
+    except FileNotFoundError:
+        return
+    block.close()
+    block.unlink()
+
+
+class BulkRenderer:
+    """Renders large batches of specs on a pool of worker processes.
+
+    Workers are warmed with the package icons and fonts when they start.
+    Encoded images travel back through ``multiprocessing.shared_memory``
+    blocks, so only small handles are pickled between processes. The pool
+    is created on first use and kept until ``close`` is called, which also
+    happens when the renderer is used as a context manager.
+
+    Attributes:
+        max_workers (Optional[int]): Number of worker processes.
+        chunksize (int): Number of specs sent to a worker at a time.
+        ordered (bool): Whether results are yielded in input order.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        ordered: bool = True,
+        mp_context=None,
+        max_in_flight: Optional[int] = None,
+    ) -> None:
+        """Initializes the renderer without starting any process.
+
+        Args:
+            max_workers (int, optional): Number of worker processes. Defaults
+                to ``SAGE_QRCODE_BULK_MAX_WORKERS`` or the CPU count.
+            chunksize (int, optional): Specs per task. Defaults to
+                ``SAGE_QRCODE_BULK_CHUNKSIZE`` or 1.
+            ordered (bool, optional): Yield results in input order rather than
+                completion order. Default is True.
+            mp_context (optional): A ``multiprocessing`` context for the pool.
+            max_in_flight (int, optional): Chunks submitted but not yet
+                yielded. Defaults to ``SAGE_QRCODE_BULK_MAX_IN_FLIGHT`` or
+                twice the number of workers.
+        """
+        self.max_workers = max_workers or get_setting("BULK_MAX_WORKERS")
+        self.chunksize = max(1, chunksize or get_setting("BULK_CHUNKSIZE", 1))
+        self.max_in_flight = max(
+            1,
+            max_in_flight
+            or get_setting("BULK_MAX_IN_FLIGHT")
+            or 2 * (self.max_workers or os.cpu_count() or 1),
+        )
+        self.ordered = ordered
+        self.mp_context = mp_context
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Returns the worker pool, starting it on first use."""
+        if self._executor is None:
+            logger.info("Starting bulk render pool with %s workers.", self.max_workers)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self.mp_context,
+                initializer=warm_worker,
+            )
+        return self._executor
+
+    def render_many(
+        self, specs: Iterable[RenderSpec]
+    ) -> Iterator[Tuple[int, RenderResult]]:
+        """Renders specs in parallel.
+
+        At most ``max_in_flight`` chunks are submitted at a time, so results
+        the caller has not consumed yet hold a bounded amount of shared
+        memory; the next chunk is submitted as each one is collected.
+
+        Args:
+            specs (Iterable[RenderSpec]): The specs to render.
+
+        Yields:
+            tuple: The input position of each spec and its result, in input
+            order or, when ``ordered`` is False, as soon as each chunk is done.
+        """
+        chunks = self._chunks(specs)
+        in_flight: Deque[Future] = deque()
+
+        def submit_next() -> None:
+            chunk = next(chunks, None)
+            if chunk is not None:
+                in_flight.append(self.executor.submit(_render_chunk, chunk))
+
+        try:
+            for _ in range(self.max_in_flight):
+                submit_next()
+            while in_flight:
+                if self.ordered:
+                    future = in_flight.popleft()
+                else:
+                    done = wait(in_flight, return_when=FIRST_COMPLETED).done
+                    future = next(future for future in in_flight if future in done)
+                    in_flight.remove(future)
+                handles = future.result()
+                submit_next()
+                for index, handle in enumerate(handles):
+                    try:
+                        yield _read_handle(handle)
+                    except GeneratorExit:
+                        for unread in handles[index + 1 :]:
+                            _release_handle(unread)
+                        raise
+        finally:
+            self._discard(in_flight)
+
+    def _chunks(
+        self, specs: Iterable[RenderSpec]
+    ) -> Iterator[List[Tuple[int, RenderSpec]]]:
+        """Groups specs with their input positions into chunks of ``chunksize``."""
+        chunk: List[Tuple[int, RenderSpec]] = []
+        for position, spec in enumerate(specs):
+            chunk.append((position, spec))
+            if len(chunk) >= self.chunksize:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _discard(futures: Iterable[Future]) -> None:
+        """Cancels or releases the results of abandoned chunks."""
+        for future in futures:
+            if future.cancel():
+                continue
+            try:
+                handles = future.result()
+            except Exception:
+                continue
+            for handle in handles:
+                _release_handle(handle)
+
+    def close(self) -> None:
+        """Shuts the worker pool down."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "BulkRenderer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
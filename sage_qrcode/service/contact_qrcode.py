@@ -1,10 +1,10 @@
 import logging
-from typing import Optional
+from typing import Any, Mapping, Optional
 from pathlib import Path
 from segno import helpers
 
 from sage_qrcode.service.base import QRCodeBase
-from sage_qrcode.utils import add_text_to_image, add_frame_to_image
+from sage_qrcode.utils import Caption, Frame, compose
 from sage_qrcode.helpers.type import HexCode
 
 logger = logging.getLogger(__name__)
@@ -13,6 +13,13 @@ logger = logging.getLogger(__name__)
 class ContactQRCode(QRCodeBase):
     """A class for generating specific types of QR codes like WiFi, MeCard, and VCard."""
 
+    batch_methods = {
+        **QRCodeBase.batch_methods,
+        "wifi": "generate_wifi_qr_code",
+        "mecard": "generate_mecard_qr_code",
+        "vcard": "generate_vcard_qr_code",
+    }
+
     def generate_wifi_qr_code(
         self,
         ssid: str,
@@ -25,21 +32,35 @@ class ContactQRCode(QRCodeBase):
         size: int = 10,
         color2: HexCode = "#FFFFFF",
         color3: HexCode = "#000000",
+        output_format: str = "png",
+        fill: Optional[Mapping[str, Any]] = None,
     ) -> None:
         """Generates a QR code for connecting to a WiFi network."""
         logger.debug("Generating WiFi QR code for SSID: %s", ssid)
         wifi_data = helpers.make_wifi_data(
             ssid=ssid, password=password, security=security_type
         )
-        result = self.generate_qr_code(
-            data=wifi_data, custom=custom, color=color, scale=size
-        )
+        decorations = []
         if frame_type:
             logger.info("Adding frame_type to QR code.")
-            self.qr_image = add_frame_to_image(self.qr_image, frame_type)
+            decorations.append(Frame(frame_type))
+        caption = Caption("Scan to open WiFi")
+        result = self.generate_qr_code(
+            data=wifi_data,
+            custom=custom,
+            color=color,
+            scale=size,
+            output_format=output_format,
+            fill=fill,
+            decorations=[*decorations, caption],
+        )
+        if self.is_encoded:
+            self.show_qr_code(save)
+            return
         if not result:
             logger.info("Adding text to QR code image.")
-            self.qr_image = add_text_to_image(self.qr_image, "Scan to open WiFi")
+            decorations.append(caption)
+        self.qr_image = compose(self.qr_image, decorations)
         self.show_qr_code(save)
 
     def generate_mecard_qr_code(
@@ -55,6 +76,8 @@ class ContactQRCode(QRCodeBase):
         color: str = "#000000",
         color2: HexCode = "#FFFFFF",
         color3: HexCode = "#000000",
+        output_format: str = "png",
+        fill: Optional[Mapping[str, Any]] = None,
     ) -> None:
         """Generates a QR code for a MeCard contact."""
         logger.debug("Generating MeCard QR code for name: %s", name)
@@ -62,15 +85,27 @@ class ContactQRCode(QRCodeBase):
             f"MECARD:N:{name};"
             f"EMAIL:{email};TEL:{phone};URL:{url};;"
         )
-        result = self.generate_qr_code(
-            data=mecard_data, custom=custom, color=color, scale=size
-        )
+        decorations = []
         if frame_type:
             logger.info("Adding frame_type to QR code.")
-            self.qr_image = add_frame_to_image(self.qr_image, frame_type)
+            decorations.append(Frame(frame_type))
+        caption = Caption("Scan to view MeCard")
+        result = self.generate_qr_code(
+            data=mecard_data,
+            custom=custom,
+            color=color,
+            scale=size,
+            output_format=output_format,
+            fill=fill,
+            decorations=[*decorations, caption],
+        )
+        if self.is_encoded:
+            self.show_qr_code(save)
+            return
         if not result:
             logger.info("Adding text to QR code image.")
-            self.qr_image = add_text_to_image(self.qr_image, "Scan to view MeCard")
+            decorations.append(caption)
+        self.qr_image = compose(self.qr_image, decorations)
         self.show_qr_code(save)
 
     def generate_vcard_qr_code(
@@ -89,6 +124,8 @@ class ContactQRCode(QRCodeBase):
         frame_type: Optional[str] = None,
         color2: HexCode = "#FFFFFF",
         color3: HexCode = "#000000",
+        output_format: str = "png",
+        fill: Optional[Mapping[str, Any]] = None,
     ) -> None:
         """Generates a QR code for a VCard contact."""
         logger.debug("Generating VCard QR code for name: %s", name)
@@ -97,6 +134,11 @@ class ContactQRCode(QRCodeBase):
             f"FN:{displayname}\nEMAIL:{email}\nTEL:{phone}\n"
             f"ORG:{org}\nADR:{address}\nURL:{url}\nEND:VCARD"
         )
+        decorations = []
+        if frame_type:
+            logger.info("Adding frame_type to QR code.")
+            decorations.append(Frame(frame_type))
+        caption = Caption("Scan to view VCard")
         result = self.generate_qr_code(
             data=vcard_data,
             color=color,
@@ -104,11 +146,15 @@ class ContactQRCode(QRCodeBase):
             color3=color3,
             scale=size,
             custom=custom,
+            output_format=output_format,
+            fill=fill,
+            decorations=[*decorations, caption],
         )
-        if frame_type:
-            logger.info("Adding frame_type to QR code.")
-            self.qr_image = add_frame_to_image(self.qr_image, frame_type)
+        if self.is_encoded:
+            self.show_qr_code(save)
+            return
         if not result:
             logger.info("Adding text to QR code image.")
-            self.qr_image = add_text_to_image(self.qr_image, "Scan to view VCard")
+            decorations.append(caption)
+        self.qr_image = compose(self.qr_image, decorations)
         self.show_qr_code(save)
@@ -0,0 +1,208 @@
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple
+
+import segno
+
+from sage_qrcode.conf import get_setting
+from sage_qrcode.utils.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 512
+DEFAULT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+CacheKey = Tuple[Hashable, ...]
+
+
+def _symbol_nbytes(qr_code: segno.QRCode) -> int:
+    """Approximates the memory held by an encoded symbol.
+
+    Args:
+        qr_code (segno.QRCode): The encoded symbol.
+
+    Returns:
+        int: The number of bytes used by the module matrix.
+    """
+    return sum(len(row) for row in qr_code.matrix)
+
+
+class EncodingCache(LRUCache):
+    """A bounded, thread-safe LRU cache of encoded QR code symbols.
+
+    The cache sits in front of ``segno.make`` so that regenerating the same
+    payload with another scale or color scheme only repeats rasterization.
+    Entries are evicted in least-recently-used order once either the entry
+    count or the approximate byte size exceeds its limit.
+
+    Attributes:
+        max_size (int): Maximum number of cached symbols. ``0`` disables caching.
+        max_bytes (int): Maximum approximate size of all cached symbols.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that required encoding.
+        evictions (int): Number of entries dropped to honour the limits.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initializes an empty cache with the given limits."""
+        super().__init__(max_size, max_bytes)
+
+    @staticmethod
+    def make_key(
+        data: Any,
+        error: Optional[str] = "h",
+        version: Optional[Any] = None,
+        mask: Optional[int] = None,
+        micro: bool = False,
+    ) -> Optional[CacheKey]:
+        """Builds the cache key for an encoding request.
+
+        Args:
+            data (Any): The payload to encode.
+            error (str, optional): Error correction level.
+            version (Any, optional): Requested symbol version.
+            mask (int, optional): Requested mask pattern.
+            micro (bool, optional): Whether Micro QR codes are allowed.
+
+        Returns:
+            Optional[tuple]: The key, or None if the payload is not hashable.
+        """
+        try:
+            hash(data)
+        except TypeError:
+            return None
+        if isinstance(error, str):
+            error = error.lower()
+        if isinstance(version, str):
+            version = version.upper()
+        return (type(data).__name__, data, error, version, mask, micro)
+
+    def get_or_make(
+        self,
+        data: Any,
+        error: Optional[str] = "h",
+        version: Optional[Any] = None,
+        mask: Optional[int] = None,
+        micro: bool = False,
+    ) -> segno.QRCode:
+        """Returns the encoded symbol for the payload, encoding it on a miss.
+
+        Short payloads at error levels below 'h' fit a Micro QR code, which
+        segno prefers by default; symbols are regular QR codes unless
+        ``micro`` is set.
+
+        Args:
+            data (Any): The payload to encode.
+            error (str, optional): Error correction level. Default is 'h'.
+            version (Any, optional): Requested symbol version. Default is None.
+            mask (int, optional): Requested mask pattern. Default is None.
+            micro (bool, optional): Allow Micro QR codes. Default is False.
+
+        Returns:
+            segno.QRCode: The encoded symbol. It is shared and must not be mutated.
+        """
+        return self.get_or_create(
+            self.make_key(data, error, version, mask, micro),
+            lambda: segno.make(
+                data, error=error, version=version, mask=mask, micro=micro
+            ),
+            _symbol_nbytes,
+        )
+
+
+_encoding_cache: Optional[EncodingCache] = None
+_encoding_cache_lock = threading.Lock()
+
+
+def get_encoding_cache() -> EncodingCache:
+    """Returns the process-wide encoding cache, creating it on first use.
+
+    The limits are read from the ``SAGE_QRCODE_ENCODING_CACHE_SIZE`` and
+    ``SAGE_QRCODE_ENCODING_CACHE_MAX_BYTES`` settings.
+
+    Returns:
+        EncodingCache: The shared cache instance.
+    """
+    global _encoding_cache
+    if _encoding_cache is None:
+        with _encoding_cache_lock:
+            if _encoding_cache is None:
+                _encoding_cache = EncodingCache(
+                    max_size=get_setting("ENCODING_CACHE_SIZE", DEFAULT_CACHE_SIZE),
+                    max_bytes=get_setting(
+                        "ENCODING_CACHE_MAX_BYTES", DEFAULT_CACHE_MAX_BYTES
+                    ),
+                )
+    return _encoding_cache
+
+
+def reset_encoding_cache() -> None:
+    """Discards the shared cache so the next use re-reads the settings."""
+    global _encoding_cache
+    with _encoding_cache_lock:
+        _encoding_cache = None
+
+
+_shared = threading.local()
+
+
+@contextmanager
+def shared_encoding() -> Iterator[Dict[CacheKey, segno.QRCode]]:
+    """Encodes each payload at most once inside the block.
+
+    Symbols made by ``make_qr_code`` in the block are pinned for the current
+    thread until it exits, even when the encoding cache is disabled or
+    evicts them, so several renditions of one code share a single
+    ``segno.make``. Nested blocks share the outermost pin.
+
+    Yields:
+        dict: The pinned symbols by cache key.
+    """
+    symbols = getattr(_shared, "symbols", None)
+    if symbols is not None:
+        yield symbols
+        return
+    _shared.symbols = symbols = {}
+    try:
+        yield symbols
+    finally:
+        _shared.symbols = None
+
+
+def make_qr_code(
+    data: Any,
+    error: Optional[str] = "h",
+    version: Optional[Any] = None,
+    mask: Optional[int] = None,
+    micro: bool = False,
+) -> segno.QRCode:
+    """Encodes the payload through the shared encoding cache.
+
+    Inside ``shared_encoding`` the symbol is also pinned for the rest of
+    the block.
+
+    Args:
+        data (Any): The payload to encode.
+        error (str, optional): Error correction level. Default is 'h'.
+        version (Any, optional): Requested symbol version. Default is None.
+        mask (int, optional): Requested mask pattern. Default is None.
+        micro (bool, optional): Allow Micro QR codes. Default is False.
+
+    Returns:
+        segno.QRCode: The encoded symbol.
+    """
+    symbols = getattr(_shared, "symbols", None)
+    key = EncodingCache.make_key(data, error, version, mask, micro)
+    if symbols is None or key is None:
+        return get_encoding_cache().get_or_make(data, error, version, mask, micro)
+    qr_code = symbols.get(key)
+    if qr_code is None:
+        qr_code = symbols[key] = get_encoding_cache().get_or_make(
+            data, error, version, mask, micro
+        )
+    return qr_code
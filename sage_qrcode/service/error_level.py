@@ -0,0 +1,138 @@
+import logging
+from typing import Any, Optional, Sequence
+
+from sage_qrcode.conf import get_setting
+from sage_qrcode.service.admission import QUIET_ZONE, estimate_version, payload_length
+from sage_qrcode.utils.composition import Decoration, compile_plan, get_icon_layer
+
+logger = logging.getLogger(__name__)
+
+AUTO = "auto"
+ERROR_LEVELS = ("l", "m", "q", "h")
+# Share of codewords each level restores (ISO/IEC 18004, 7.5.1).
+ERROR_RECOVERY = {"l": 0.07, "m": 0.15, "q": 0.25, "h": 0.30}
+DEFAULT_SAFETY_MARGIN = 0.05
+
+
+def overlay_coverage(
+    decorations: Sequence[Decoration],
+    modules: int,
+    scale: int,
+    indexed: bool = False,
+    border: int = QUIET_ZONE,
+) -> float:
+    """Returns the share of symbol modules hidden by decorations.
+
+    The decorations are compiled for the image size exactly as ``compose``
+    draws them, so the layers measured here are the cached layers drawn
+    later. A module counts as covered if any icon or overlay box touches it;
+    the quiet zone is ignored.
+
+    Args:
+        decorations (Sequence[Decoration]): Icons, frames and captions.
+        modules (int): The symbol width in modules, without the quiet zone.
+        scale (int): Pixels per module.
+        indexed (bool, optional): Whether the symbol is a palette or 1-bit
+            image, which selects the caption antialiasing. Default is False.
+        border (int, optional): The quiet zone in modules. Default is 4.
+
+    Returns:
+        float: The covered share of modules, from 0 to 1.
+    """
+    if not decorations:
+        return 0.0
+    width = (modules + 2 * border) * scale
+    plan = compile_plan(
+        decorations, (width, width), "P" if indexed else "RGBA", indexed
+    )
+    boxes = [box for _, overlay in plan.overlays for box, _ in overlay]
+    for icon in plan.icons:
+        scaled = get_icon_layer(icon, width)
+        position = (width - scaled.width) // 2
+        boxes.append(
+            (position, position, position + scaled.width, position + scaled.height)
+        )
+
+    covered = bytearray(modules * modules)
+    for left, top, right, bottom in boxes:
+        first_column = max(0, left // scale - border)
+        last_column = min(modules, -(-right // scale) - border)
+        if first_column >= last_column:
+            continue
+        run = b"\x01" * (last_column - first_column)
+        for row in range(
+            max(0, top // scale - border), min(modules, -(-bottom // scale) - border)
+        ):
+            start = row * modules + first_column
+            covered[start : start + len(run)] = run
+    return covered.count(1) / len(covered)
+
+
+def choose_error_level(
+    data: Any,
+    decorations: Sequence[Decoration] = (),
+    scale: int = 10,
+    indexed: bool = False,
+    margin: Optional[float] = None,
+) -> str:
+    """Returns the lowest error level that survives the decorations.
+
+    Each level is tried from 'l' upwards at the symbol version the payload
+    needs at that level, since a higher level also grows the symbol. A level
+    is chosen once its recovery share exceeds the covered share by at least
+    the margin.
+
+    Args:
+        data (Any): The payload to encode.
+        decorations (Sequence[Decoration], optional): The icons, frames and
+            captions drawn over the symbol. Default is none.
+        scale (int, optional): Pixels per module. Default is 10.
+        indexed (bool, optional): Whether the symbol is a palette or 1-bit
+            image. Default is False.
+        margin (float, optional): The spare recovery share required.
+            Defaults to ``SAGE_QRCODE_ERROR_SAFETY_MARGIN``, or 0.05.
+
+    Returns:
+        str: 'l', 'm', 'q' or 'h'; 'h' if no level leaves the margin.
+    """
+    if margin is None:
+        margin = get_setting("ERROR_SAFETY_MARGIN", DEFAULT_SAFETY_MARGIN)
+    length = payload_length(data)
+    for error in ERROR_LEVELS:
+        modules = 17 + 4 * estimate_version(length, error)
+        coverage = overlay_coverage(decorations, modules, scale, indexed)
+        if ERROR_RECOVERY[error] - coverage >= margin:
+            logger.debug(
+                "Chose error level %s for %.1f%% coverage.", error, coverage * 100
+            )
+            return error
+    logger.warning("Decorations cover %.1f%% of the symbol.", coverage * 100)
+    return "h"
+
+
+def resolve_error_level(
+    error: Optional[str],
+    data: Any,
+    decorations: Sequence[Decoration] = (),
+    scale: int = 10,
+    indexed: bool = False,
+) -> str:
+    """Returns the error level to encode with.
+
+    Args:
+        error (str, optional): 'l', 'm', 'q', 'h' or 'auto'. Defaults to
+            ``SAGE_QRCODE_ERROR_LEVEL``, or 'h'.
+        data (Any): The payload to encode.
+        decorations (Sequence[Decoration], optional): The decorations drawn
+            over the symbol, measured for 'auto'.
+        scale (int, optional): Pixels per module. Default is 10.
+        indexed (bool, optional): Whether the symbol is a palette or 1-bit
+            image. Default is False.
+
+    Returns:
+        str: The lower-cased error level.
+    """
+    error = (error or get_setting("ERROR_LEVEL", "h")).lower()
+    if error != AUTO:
+        return error
+    return choose_error_level(data, decorations, scale, indexed)
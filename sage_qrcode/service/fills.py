@@ -0,0 +1,155 @@
+import logging
+import math
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Tuple, Union
+
+try:
+    from PIL import Image
+except ImportError as exc:
+    raise ImportError("Install `pillow` package. Run `pip install pillow`.") from exc
+
+from sage_qrcode.helpers.type import HexCode
+from sage_qrcode.service.raster import _import_numpy, to_rgba
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FILL_TYPES = ("solid", "linear", "radial", "image")
+DEFAULT_GRADIENT_ANGLE = 45
+FILL_IMAGE_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True)
+class Fill:
+    """Describes how the dark modules of a symbol are colored.
+
+    Colors are computed once per module, so a gradient costs about the same
+    to rasterize as a flat color. Finder patterns keep their own color.
+
+    Attributes:
+        type (str): 'solid', 'linear', 'radial' or 'image'.
+        colors (tuple): Gradient stops, evenly spaced from start to end. For
+            radial fills the first stop is the center.
+        angle (float): Direction of a linear gradient in degrees, clockwise
+            from left-to-right.
+        image (str, optional): The image sampled by an 'image' fill. It is
+            stretched over the symbol without its quiet zone.
+    """
+
+    type: str = "solid"
+    colors: Tuple[HexCode, ...] = ()
+    angle: float = DEFAULT_GRADIENT_ANGLE
+    image: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.type not in FILL_TYPES:
+            raise ValueError(f"Unknown fill type: {self.type}")
+        if self.type in ("linear", "radial") and len(self.colors) < 2:
+            raise ValueError("Gradient fills need at least two colors.")
+        if self.type == "image" and not self.image:
+            raise ValueError("Image fills need an image.")
+        object.__setattr__(self, "colors", tuple(self.colors))
+
+    @classmethod
+    def from_value(
+        cls, value: Union["Fill", Mapping[str, Any], None]
+    ) -> Optional["Fill"]:
+        """Builds a fill from a render option.
+
+        Args:
+            value: A Fill, a mapping of its attributes as used in render specs,
+                or None.
+
+        Returns:
+            Optional[Fill]: The fill, or None for solid fills.
+        """
+        if value is None or isinstance(value, Fill):
+            fill = value
+        else:
+            fill = cls(**value)
+        if fill is None or fill.type == "solid":
+            return None
+        return fill
+
+    def module_colors(self, shape: Tuple[int, int], border: int) -> "np.ndarray":
+        """Computes the color of every module position.
+
+        Args:
+            shape (tuple): The height and width of the module matrix,
+                including the quiet zone.
+            border (int): The quiet zone size in modules.
+
+        Returns:
+            np.ndarray: A ``uint32`` matrix of native RGBA values.
+        """
+        np = _import_numpy()
+        if self.type == "image":
+            return _image_colors(self.image, shape, border)
+
+        height, width = shape
+        ys, xs = np.mgrid[0:height, 0:width].astype(np.float32)
+        # Module centers relative to the symbol, without the quiet zone.
+        xs += 0.5 - border
+        ys += 0.5 - border
+        span_x, span_y = width - 2 * border, height - 2 * border
+        if self.type == "linear":
+            angle = math.radians(self.angle)
+            dx, dy = math.cos(angle), math.sin(angle)
+            position = xs * dx + ys * dy
+            corners = [x * dx + y * dy for x in (0, span_x) for y in (0, span_y)]
+            start, end = min(corners), max(corners)
+        else:
+            position = np.hypot(xs - span_x / 2, ys - span_y / 2)
+            start, end = 0.0, math.hypot(span_x / 2, span_y / 2)
+        position = np.clip((position - start) / ((end - start) or 1.0), 0.0, 1.0)
+        return interpolate_colors(position, self.colors)
+
+
+def interpolate_colors(position: "np.ndarray", colors: Tuple[HexCode, ...]):
+    """Maps positions between 0 and 1 onto evenly spaced color stops.
+
+    Args:
+        position (np.ndarray): A float matrix of positions.
+        colors (tuple): The color stops.
+
+    Returns:
+        np.ndarray: A ``uint32`` matrix of native RGBA values.
+    """
+    np = _import_numpy()
+    stops = np.array([to_rgba(color) for color in colors], dtype=np.float32)
+    offsets = np.linspace(0.0, 1.0, len(stops), dtype=np.float32)
+    rgba = np.empty(position.shape + (4,), dtype=np.uint8)
+    for channel in range(4):
+        rgba[..., channel] = np.rint(np.interp(position, offsets, stops[:, channel]))
+    return rgba.view(np.uint32)[..., 0]
+
+
+def _image_colors(path: str, shape: Tuple[int, int], border: int):
+    stat = os.stat(path)
+    return _sample_image(
+        os.path.abspath(path), stat.st_mtime_ns, stat.st_size, shape, border
+    )
+
+
+@lru_cache(maxsize=FILL_IMAGE_CACHE_SIZE)
+def _sample_image(
+    path: str, mtime_ns: int, size: int, shape: Tuple[int, int], border: int
+):
+    """Averages an image down to one color per module of the symbol."""
+    np = _import_numpy()
+    height, width = shape
+    logger.debug("Sampling fill image %s for %sx%s modules.", path, width, height)
+    with Image.open(path) as source:
+        sampled = source.convert("RGBA").resize(
+            (width - 2 * border, height - 2 * border), Image.BOX
+        )
+    colors = np.zeros(shape, dtype=np.uint32)
+    colors[border : height - border, border : width - border] = np.asarray(
+        sampled
+    ).view(np.uint32)[..., 0]
+    colors.setflags(write=False)
+    return colors
@@ -1,10 +1,10 @@
 import logging
-from typing import Optional
+from typing import Any, Mapping, Optional
 from urllib.parse import urlencode
 from pathlib import Path
 
 from sage_qrcode.service.base import QRCodeBase
-from sage_qrcode.utils import add_text_to_image, add_frame_to_image
+from sage_qrcode.utils import Caption, Frame, compose
 from sage_qrcode.helpers.type import HexCode, IBAN
 
 logger = logging.getLogger(__name__)
@@ -15,6 +15,12 @@ class PaymentQRCode(QRCodeBase):
     such as EPC and Bitcoin payment QR codes.
     """
 
+    batch_methods = {
+        **QRCodeBase.batch_methods,
+        "epc": "generate_epc_qr_code",
+        "bitcoin": "generate_bitcoin_qr_code",
+    }
+
     def generate_epc_qr_code(
         self,
         name: str,
@@ -28,6 +34,8 @@ class PaymentQRCode(QRCodeBase):
         size: int = 10,
         color2: HexCode = "#FFFFFF",
         color3: HexCode = "#000000",
+        output_format: str = "png",
+        fill: Optional[Mapping[str, Any]] = None,
     ) -> None:
         """Generates a QR code for EPC (European Payments Council) payments."""
         logger.debug(
@@ -38,6 +46,11 @@ class PaymentQRCode(QRCodeBase):
             f"BCD\n001\n1\nSCT\n{name}\n{iban}\n"
             f"EUR{amount}\n{int(amount * 100)}\n{text}\n"
         )
+        decorations = []
+        if frame_type:
+            logger.info("Adding frame_type to QR code.")
+            decorations.append(Frame(frame_type))
+        caption = Caption("Scan for EPC payment")
         result = self.generate_qr_code(
             data=epc_data,
             custom=custom,
@@ -45,13 +58,17 @@ class PaymentQRCode(QRCodeBase):
             scale=size,
             color2=color2,
             color3=color3,
+            output_format=output_format,
+            fill=fill,
+            decorations=[*decorations, caption],
         )
-        if frame_type:
-            logger.info("Adding frame_type to QR code.")
-            self.qr_image = add_frame_to_image(self.qr_image, frame_type)
+        if self.is_encoded:
+            self.show_qr_code(save)
+            return
         if not result:
             logger.info("Adding text to QR code image.")
-            self.qr_image = add_text_to_image(self.qr_image, "Scan for EPC payment")
+            decorations.append(caption)
+        self.qr_image = compose(self.qr_image, decorations)
         self.show_qr_code(save)
 
     def generate_bitcoin_qr_code(
@@ -66,6 +83,8 @@ class PaymentQRCode(QRCodeBase):
         frame_type: Optional[str] = None,
         color2: HexCode = "#FFFFFF",
         color3: HexCode = "#000000",
+        output_format: str = "png",
+        fill: Optional[Mapping[str, Any]] = None,
     ) -> None:
         """Generates a QR code for Bitcoin payments."""
         logger.debug(
@@ -83,19 +102,26 @@ class PaymentQRCode(QRCodeBase):
         if query_string:
             bitcoin_uri += f"?{query_string}"
 
+        decorations = []
+        if frame_type:
+            logger.info("Adding frame_type to QR code.")
+            decorations.append(Frame(frame_type))
+        caption = Caption("Scan for bitcoin payment")
         result = self.generate_qr_code(
             data=bitcoin_uri,
             scale=scale,
             color=color,
             color2=color2,
             color3=color3,
+            output_format=output_format,
+            fill=fill,
+            decorations=[*decorations, caption],
         )
-        if frame_type:
-            logger.info("Adding frame_type to QR code.")
-            self.qr_image = add_frame_to_image(self.qr_image, frame_type)
+        if self.is_encoded:
+            self.show_qr_code(save)
+            return
         if not result:
             logger.info("Adding text to QR code image.")
-            self.qr_image = add_text_to_image(
-                self.qr_image, "Scan for bitcoin payment"
-            )
+            decorations.append(caption)
+        self.qr_image = compose(self.qr_image, decorations)
         self.show_qr_code(save)
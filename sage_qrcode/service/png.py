@@ -0,0 +1,61 @@
+import struct
+import zlib
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+INCHES_PER_METER = 39.3700787
+
+
+def png_chunk(tag: bytes, data: bytes = b"") -> bytes:
+    """Serializes one PNG chunk.
+
+    Args:
+        tag (bytes): The four-letter chunk type, e.g. ``b"IDAT"``.
+        data (bytes, optional): The chunk payload.
+
+    Returns:
+        bytes: The length, type, payload and CRC of the chunk.
+    """
+    return (
+        struct.pack(">I", len(data))
+        + tag
+        + data
+        + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+    )
+
+
+def set_png_dpi(content: bytes, dpi: int) -> bytes:
+    """Records the print resolution of an encoded PNG without re-encoding it.
+
+    A ``pHYs`` chunk is inserted right after the header chunk, replacing
+    any resolution already present.
+
+    Args:
+        content (bytes): The encoded PNG.
+        dpi (int): Pixels per inch.
+
+    Returns:
+        bytes: The PNG with the resolution recorded.
+
+    Raises:
+        ValueError: If the content is not a PNG.
+    """
+    if not content.startswith(PNG_SIGNATURE):
+        raise ValueError("Resolution can only be recorded in PNG images.")
+    pixels_per_meter = round(dpi * INCHES_PER_METER)
+    chunks = [PNG_SIGNATURE]
+    position = len(PNG_SIGNATURE)
+    while position < len(content):
+        (length,) = struct.unpack(">I", content[position : position + 4])
+        end = position + length + 12
+        tag = content[position + 4 : position + 8]
+        if tag != b"pHYs":
+            chunks.append(content[position:end])
+        if tag == b"IHDR":
+            chunks.append(
+                png_chunk(
+                    b"pHYs",
+                    struct.pack(">IIB", pixels_per_meter, pixels_per_meter, 1),
+                )
+            )
+        position = end
+    return b"".join(chunks)
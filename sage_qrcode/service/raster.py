@@ -0,0 +1,296 @@
+import logging
+from typing import TYPE_CHECKING, Optional, Tuple
+
+import segno
+
+try:
+    from PIL import Image, ImageColor
+except ImportError as exc:
+    raise ImportError("Install `pillow` package. Run `pip install pillow`.") from exc
+
+from sage_qrcode.helpers.type import HexCode
+from sage_qrcode.utils.composition import PALETTE_RESERVED_KEY
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from sage_qrcode.service.fills import Fill
+
+logger = logging.getLogger(__name__)
+
+LIGHT, DARK, FINDER_DARK = 0, 1, 2
+FINDER_SIZE = 7
+
+# Palette images produced here keep the symbol colors in the first entries so
+# they can be swapped later; decorations append their own entries after them.
+SYMBOL_PALETTE_SIZE = 3
+
+_FINDER_TABLE = bytes.maketrans(b"\x01", b"\x02")
+_MONOCHROME_PALETTE = [255, 255, 255, 0, 0, 0, 0, 0, 0]
+_BLACK, _WHITE = (0, 0, 0, 255), (255, 255, 255, 255)
+
+RGBA = Tuple[int, int, int, int]
+
+
+_numpy = None
+
+
+def _import_numpy():
+    """Imports NumPy on first use, so PIL-only deployments never load it.
+
+    Returns:
+        The ``numpy`` module, or None if it is not installed.
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def numpy_available() -> bool:
+    """Returns True if NumPy is installed and the vectorized rasterizer can run."""
+    return _import_numpy() is not None
+
+
+def to_rgba(color: Optional[HexCode]) -> RGBA:
+    """Converts a color specification to an RGBA tuple.
+
+    Args:
+        color (Optional[str]): Any color understood by Pillow, or None for
+            a fully transparent color.
+
+    Returns:
+        tuple: The (red, green, blue, alpha) components.
+
+    Raises:
+        ValueError: If the color cannot be parsed.
+    """
+    if color is None:
+        return (0, 0, 0, 0)
+    return ImageColor.getcolor(color, "RGBA")
+
+
+def palette_indices(
+    qr_code: segno.QRCode, border: Optional[int] = None
+) -> Tuple[int, int, bytes]:
+    """Builds the one-pixel-per-module palette indices of a symbol.
+
+    Each byte holds ``LIGHT``, ``DARK`` or ``FINDER_DARK`` so that colors can
+    later be applied with a single palette lookup. Only the standard library
+    is used, so this also works without NumPy.
+
+    Args:
+        qr_code (segno.QRCode): The encoded symbol.
+        border (int, optional): Quiet zone size in modules. Defaults to the
+            symbol's recommended border.
+
+    Returns:
+        tuple: The width and height in modules and the row-major index bytes,
+        all including the quiet zone.
+    """
+    if border is None:
+        border = qr_code.default_border_size
+    matrix = qr_code.matrix
+    height, width = len(matrix), len(matrix[0])
+    quiet_row = bytes(width + 2 * border)
+    padding = bytes(border)
+
+    rows = [quiet_row] * border
+    for y, modules in enumerate(matrix):
+        row = bytearray(modules)
+        if y < FINDER_SIZE:
+            row[:FINDER_SIZE] = row[:FINDER_SIZE].translate(_FINDER_TABLE)
+            if not qr_code.is_micro:
+                row[-FINDER_SIZE:] = row[-FINDER_SIZE:].translate(_FINDER_TABLE)
+        elif y >= height - FINDER_SIZE and not qr_code.is_micro:
+            row[:FINDER_SIZE] = row[:FINDER_SIZE].translate(_FINDER_TABLE)
+        rows.append(padding + row + padding)
+    rows.extend([quiet_row] * border)
+    return width + 2 * border, height + 2 * border, b"".join(rows)
+
+
+def module_matrix(qr_code: segno.QRCode, border: Optional[int] = None) -> "np.ndarray":
+    """Returns the palette indices of a symbol as a NumPy matrix.
+
+    Args:
+        qr_code (segno.QRCode): The encoded symbol.
+        border (int, optional): Quiet zone size in modules. Defaults to the
+            symbol's recommended border.
+
+    Returns:
+        np.ndarray: A ``uint8`` array including the quiet zone.
+    """
+    np = _import_numpy()
+    width, height, indices = palette_indices(qr_code, border)
+    return np.frombuffer(indices, dtype=np.uint8).reshape(height, width)
+
+
+def rasterize_template(
+    qr_code: segno.QRCode, border: Optional[int] = None
+) -> Image.Image:
+    """Renders the palette indices of a symbol at one pixel per module.
+
+    The template is a ``P`` image whose pixels hold ``LIGHT``, ``DARK`` or
+    ``FINDER_DARK``, so any color scheme and scale are applied later by
+    attaching a palette and enlarging it, without encoding or rasterizing the
+    symbol again.
+
+    Args:
+        qr_code (segno.QRCode): The encoded symbol.
+        border (int, optional): Quiet zone size in modules. Default is None.
+
+    Returns:
+        Image.Image: The template in mode ``P``.
+    """
+    width, height, indices = palette_indices(qr_code, border)
+    return Image.frombytes("P", (width, height), indices)
+
+
+def colorize_template(
+    template: Image.Image,
+    dark: HexCode = "#000000",
+    light: HexCode = "#FFFFFF",
+    finder_dark: HexCode = "#000000",
+    scale: int = 1,
+) -> Image.Image:
+    """Colors and scales a template from ``rasterize_template``.
+
+    Colors are set by attaching a palette to the one-pixel-per-module
+    template, which is then enlarged with nearest-neighbour resampling, so
+    no 32-bit buffer is ever allocated. Pure black and white symbols are
+    returned in mode ``1``; everything else becomes a ``P`` image whose
+    first entries hold the light, dark and finder colors, with transparency
+    kept in the palette.
+
+    Args:
+        template (Image.Image): The palette indices of the symbol.
+        dark (str, optional): Color of dark modules. Default is '#000000'.
+        light (str, optional): Color of light modules. Default is '#FFFFFF'.
+        finder_dark (str, optional): Color of the finder patterns. Default is '#000000'.
+        scale (int, optional): Pixels per module. Default is 1.
+
+    Returns:
+        Image.Image: The colored image in mode ``P`` or ``1``.
+
+    Raises:
+        ValueError: If a color cannot be parsed.
+    """
+    colors = [to_rgba(light), to_rgba(dark), to_rgba(finder_dark)]
+    image = template.copy()
+    size = (template.width * scale, template.height * scale)
+    if colors == [_WHITE, _BLACK, _BLACK]:
+        image.putpalette(_MONOCHROME_PALETTE)
+        return image.convert("1", dither=Image.NONE).resize(size, Image.NEAREST)
+
+    if all(color[3] == 255 for color in colors):
+        image.putpalette([channel for color in colors for channel in color[:3]])
+    else:
+        image.putpalette(
+            [channel for color in colors for channel in color], rawmode="RGBA"
+        )
+    image = image.resize(size, Image.NEAREST)
+    image.info[PALETTE_RESERVED_KEY] = SYMBOL_PALETTE_SIZE
+    return image
+
+
+def rasterize_indexed(
+    qr_code: segno.QRCode,
+    scale: int = 10,
+    dark: HexCode = "#000000",
+    light: HexCode = "#FFFFFF",
+    finder_dark: HexCode = "#000000",
+    border: Optional[int] = None,
+) -> Image.Image:
+    """Renders a symbol to a palette (``P``) or 1-bit (``1``) image.
+
+    Pure black and white symbols are returned in mode ``1``. Everything else
+    becomes a ``P`` image whose first entries hold the light, dark and finder
+    colors; transparency is kept in the palette. The symbol is built at one
+    pixel per module and enlarged with nearest-neighbour resampling, so no
+    32-bit buffer is ever allocated.
+
+    Args:
+        qr_code (segno.QRCode): The encoded symbol.
+        scale (int, optional): Pixels per module. Default is 10.
+        dark (str, optional): Color of dark modules. Default is '#000000'.
+        light (str, optional): Color of light modules. Default is '#FFFFFF'.
+        finder_dark (str, optional): Color of the finder patterns. Default is '#000000'.
+        border (int, optional): Quiet zone size in modules. Default is None.
+
+    Returns:
+        Image.Image: The rendered image in mode ``P`` or ``1``.
+
+    Raises:
+        ValueError: If a color cannot be parsed.
+    """
+    return colorize_template(
+        rasterize_template(qr_code, border), dark, light, finder_dark, scale
+    )
+
+
+def rasterize(
+    qr_code: segno.QRCode,
+    scale: int = 10,
+    dark: HexCode = "#000000",
+    light: HexCode = "#FFFFFF",
+    finder_dark: HexCode = "#000000",
+    border: Optional[int] = None,
+    fill: Optional["Fill"] = None,
+) -> Image.Image:
+    """Renders a symbol straight to an RGBA image using NumPy.
+
+    The module matrix is mapped through a three-entry palette and broadcast
+    into a preallocated output buffer, so dark, light and finder colors are
+    painted in a single vectorized pass without an intermediate PIL image or
+    mode conversion.
+
+    Args:
+        qr_code (segno.QRCode): The encoded symbol.
+        scale (int, optional): Pixels per module. Default is 10.
+        dark (str, optional): Color of dark modules. Default is '#000000'.
+        light (str, optional): Color of light modules. Default is '#FFFFFF'.
+        finder_dark (str, optional): Color of the finder patterns. Default is '#000000'.
+        border (int, optional): Quiet zone size in modules. Default is None.
+        fill (Fill, optional): A gradient or image fill replacing the dark
+            color. It is evaluated once per module, so the cost does not
+            depend on the scale. Default is None.
+
+    Returns:
+        Image.Image: The rendered image in RGBA mode.
+
+    Raises:
+        ValueError: If a color cannot be parsed.
+        ImportError: If NumPy is not installed.
+    """
+    np = _import_numpy()
+    if np is None:
+        raise ImportError("Install `numpy` package. Run `pip install numpy`.")
+
+    palette = (
+        np.array([to_rgba(light), to_rgba(dark), to_rgba(finder_dark)], dtype=np.uint8)
+        .view(np.uint32)
+        .ravel()
+    )
+    if border is None:
+        border = qr_code.default_border_size
+    modules = module_matrix(qr_code, border)
+    height, width = modules.shape
+    logger.debug("Rasterizing %sx%s modules at scale %s.", width, height, scale)
+
+    colors = palette[modules]
+    if fill is not None:
+        fill_colors = fill.module_colors(modules.shape, border)
+        colors = np.where(modules == DARK, fill_colors, colors)
+
+    # Every RGBA pixel is handled as one native uint32 so a scaled module row
+    # is built once and then broadcast over its ``scale`` pixel rows.
+    rows = np.repeat(colors, scale, axis=1)
+    buffer = np.empty((height * scale, width * scale), dtype=np.uint32)
+    buffer.reshape(height, scale, width * scale)[...] = rows[:, None, :]
+    return Image.frombuffer(
+        "RGBA", (width * scale, height * scale), buffer, "raw", "RGBA", 0, 1
+    )
@@ -0,0 +1,361 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Mapping, Optional, Tuple
+
+from sage_qrcode.conf import get_setting
+
+logger = logging.getLogger(__name__)
+
+# Bump when the rendering output changes so stale entries are never served.
+RENDER_CACHE_VERSION = 2
+DIGEST_KEYS = ("custom", "fill_image", "image")
+
+
+def stream_digest(source: IO[bytes]) -> str:
+    """Returns the SHA-256 hex digest of the rest of a binary stream.
+
+    Args:
+        source (IO[bytes]): An open binary file, e.g. an uploaded file.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: source.read(64 * 1024), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_digest(path: os.PathLike) -> str:
+    """Returns the SHA-256 hex digest of a file's content.
+
+    Args:
+        path (os.PathLike): The file to hash.
+
+    Returns:
+        str: The hex digest.
+    """
+    with open(path, "rb") as source:
+        return stream_digest(source)
+
+
+def render_key(spec: Mapping[str, Any]) -> str:
+    """Builds a stable, content-addressed key for a full render spec.
+
+    The spec is serialized as canonical JSON. Custom and fill image paths are
+    replaced by the digest of the file content, also inside nested options
+    such as a fill, so moving or re-uploading an identical image still hits
+    while editing it in place misses.
+
+    Args:
+        spec (Mapping[str, Any]): Payload and style of the render, e.g. the
+            kind, payload fields, error level, scale, colors and frame type.
+
+    Returns:
+        str: The SHA-256 hex digest identifying the rendered output.
+    """
+    payload = json.dumps(
+        {"version": RENDER_CACHE_VERSION, "spec": _normalize_spec(spec)},
+        sort_keys=True,
+        default=str,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _normalize_spec(spec: Mapping[str, Any]) -> Dict[str, Any]:
+    normalized = {}
+    for name, value in spec.items():
+        if is_dataclass(value) and not isinstance(value, type):
+            value = asdict(value)
+        if name in DIGEST_KEYS and value:
+            value = file_digest(value)
+        elif isinstance(value, Mapping):
+            value = _normalize_spec(value)
+        elif isinstance(value, Path):
+            value = str(value)
+        normalized[name] = value
+    return normalized
+
+
+class DjangoCacheBackend:
+    """Stores rendered images in a configured Django cache.
+
+    Eviction is left to the cache itself, e.g. ``MAX_ENTRIES`` of the
+    local-memory backend or the LRU policy of Redis and Memcached.
+    """
+
+    def __init__(
+        self,
+        alias: str = "default",
+        timeout: Optional[int] = None,
+        key_prefix: str = "sage_qrcode:render:",
+    ) -> None:
+        """Initializes the backend for the given cache alias."""
+        self.alias = alias
+        self.timeout = timeout
+        self.key_prefix = key_prefix
+
+    @property
+    def cache(self):
+        from django.core.cache import caches
+
+        return caches[self.alias]
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.cache.get(self.key_prefix + key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self.cache.set(self.key_prefix + key, value, self.timeout)
+
+
+class DirectoryBackend:
+    """Stores rendered images as files in a local directory.
+
+    Reads refresh the file modification time, and writes evict the least
+    recently used files once the entry count or the total size exceeds its
+    limit. The backend keeps an index of the files in recency order, so a
+    write only touches the files it evicts; the directory is scanned on the
+    first write and again after every ``max_entries`` writes to pick up files
+    written by other processes.
+    """
+
+    def __init__(
+        self,
+        location: os.PathLike,
+        max_entries: int = 10000,
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        """Initializes the backend, creating the directory if needed."""
+        self.location = Path(location)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self.location.mkdir(parents=True, exist_ok=True)
+        self._index: "Optional[OrderedDict[str, Tuple[int, int]]]" = None
+        self._bytes = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.location / key[:2] / key
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            if self._index is not None and str(path) in self._index:
+                self._index.move_to_end(str(path))
+        return data
+
+    def set(self, key: str, value: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(descriptor, "wb") as target:
+            target.write(value)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            if self._index is None or self._writes >= self.max_entries:
+                self._scan()
+            else:
+                stat = path.stat()
+                previous = self._index.pop(str(path), None)
+                if previous is not None:
+                    self._bytes -= previous[1]
+                self._index[str(path)] = (stat.st_mtime_ns, stat.st_size)
+                self._bytes += stat.st_size
+            self._writes += 1
+            self._cull()
+
+    def _scan(self) -> None:
+        """Rebuilds the index from the files in the directory."""
+        entries = []
+        for shard in os.scandir(self.location):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        entries.sort()
+        self._index = OrderedDict(
+            (path, (mtime, size)) for mtime, size, path in entries
+        )
+        self._bytes = sum(size for _, size, _ in entries)
+        self._writes = 0
+
+    def _cull(self) -> None:
+        """Removes least recently used files until the limits hold.
+
+        A file read by another process since it was indexed has a newer
+        modification time, so it moves to the back of the index instead.
+        """
+        while self._index and (
+            len(self._index) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            path, (mtime, size) = self._index.popitem(last=False)
+            try:
+                current = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                self._bytes -= size
+                continue
+            if current > mtime:
+                self._index[path] = (current, size)
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._bytes -= size
+            self.evictions += 1
+
+
+class RenderCache:
+    """A content-addressed cache of finished, encoded QR code images.
+
+    Attributes:
+        backend: The storage backend with ``get`` and ``set`` methods.
+        hits (int): Number of renders answered from the cache.
+        misses (int): Number of renders that had to be produced.
+    """
+
+    def __init__(self, backend) -> None:
+        """Initializes the cache around a storage backend."""
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get_or_render(
+        self, spec: Mapping[str, Any], render: Callable[[], bytes]
+    ) -> bytes:
+        """Returns the cached bytes for the spec, rendering them on a miss.
+
+        Args:
+            spec (Mapping[str, Any]): The full render spec.
+            render (Callable[[], bytes]): Produces the encoded image on a miss.
+
+        Returns:
+            bytes: The encoded image.
+        """
+        data = self.get(spec)
+        if data is None:
+            data = render()
+            self.set(spec, data)
+        return data
+
+    def get(self, spec: Mapping[str, Any]) -> Optional[bytes]:
+        """Returns the cached bytes for the spec and counts the hit or miss.
+
+        Args:
+            spec (Mapping[str, Any]): The full render spec.
+
+        Returns:
+            Optional[bytes]: The encoded image, or None on a miss.
+        """
+        key = render_key(spec)
+        data = self.backend.get(key)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if data is not None:
+            logger.debug("Render cache hit for %s.", key)
+        return data
+
+    def set(self, spec: Mapping[str, Any], data: bytes) -> None:
+        """Stores the encoded image rendered for the spec.
+
+        Args:
+            spec (Mapping[str, Any]): The full render spec.
+            data (bytes): The encoded image.
+        """
+        self.backend.set(render_key(spec), data)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit and miss counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": getattr(self.backend, "evictions", 0),
+            }
+
+
+def build_render_cache(config: Optional[Mapping[str, Any]]) -> Optional[RenderCache]:
+    """Creates a render cache from a ``SAGE_QRCODE_RENDER_CACHE`` style dict.
+
+    Args:
+        config (Mapping[str, Any], optional): ``BACKEND`` is either "django"
+            (with ``ALIAS`` and ``TIMEOUT``) or "directory" (with ``LOCATION``,
+            ``MAX_ENTRIES`` and ``MAX_BYTES``).
+
+    Returns:
+        Optional[RenderCache]: The cache, or None when caching is disabled.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if not config:
+        return None
+
+    backend_name = config.get("BACKEND", "django")
+    if backend_name == "django":
+        backend = DjangoCacheBackend(
+            alias=config.get("ALIAS", "default"), timeout=config.get("TIMEOUT")
+        )
+    elif backend_name == "directory":
+        backend = DirectoryBackend(
+            config["LOCATION"],
+            max_entries=config.get("MAX_ENTRIES", 10000),
+            max_bytes=config.get("MAX_BYTES", 512 * 1024 * 1024),
+        )
+    else:
+        raise ValueError(f"Unknown render cache backend: {backend_name}")
+    return RenderCache(backend)
+
+
+_render_cache: Optional[RenderCache] = None
+_render_cache_loaded = False
+_render_cache_lock = threading.Lock()
+
+
+def get_render_cache() -> Optional[RenderCache]:
+    """Returns the process-wide render cache configured in the settings.
+
+    Returns:
+        Optional[RenderCache]: The shared cache, or None if
+        ``SAGE_QRCODE_RENDER_CACHE`` is not set.
+    """
+    global _render_cache, _render_cache_loaded
+    if not _render_cache_loaded:
+        with _render_cache_lock:
+            if not _render_cache_loaded:
+                _render_cache = build_render_cache(get_setting("RENDER_CACHE"))
+                _render_cache_loaded = True
+    return _render_cache
+
+
+def reset_render_cache() -> None:
+    """Discards the shared cache so the next use re-reads the settings."""
+    global _render_cache, _render_cache_loaded
+    with _render_cache_lock:
+        _render_cache = None
+        _render_cache_loaded = False
@@ -0,0 +1,179 @@
+import logging
+import mimetypes
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Type, Union
+
+from sage_qrcode.service.barcode import BarcodeProxy
+from sage_qrcode.service.base import QRCodeBase
+from sage_qrcode.service.contact_qrcode import ContactQRCode
+from sage_qrcode.service.payment_qrcode import PaymentQRCode
+from sage_qrcode.service.render_cache import get_render_cache
+from sage_qrcode.service.social_qrcode import SocialMediaQRCode
+from sage_qrcode.utils import encode_image
+
+logger = logging.getLogger(__name__)
+
+Service = Union[QRCodeBase, BarcodeProxy]
+
+DEFAULT_SERVICES = (
+    QRCodeBase,
+    ContactQRCode,
+    PaymentQRCode,
+    SocialMediaQRCode,
+    BarcodeProxy,
+)
+
+
+@dataclass(frozen=True)
+class RenderSpec:
+    """An immutable description of one image to render.
+
+    Attributes:
+        kind (str): The kind of code, e.g. 'wifi', 'epc' or 'barcode_url'.
+        options (Mapping[str, Any]): Keyword arguments of the service method
+            registered for the kind.
+        image_format (str): A Pillow format name, or 'svg', 'pdf' or 'eps'.
+    """
+
+    kind: str
+    options: Mapping[str, Any] = field(default_factory=dict)
+    image_format: str = "PNG"
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "options", MappingProxyType(dict(self.options)))
+
+    def __reduce__(self):
+        # Mapping proxies cannot be pickled, which process pools require.
+        return (type(self), (self.kind, dict(self.options), self.image_format))
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    """The immutable outcome of a render.
+
+    Attributes:
+        kind (str): The kind of the rendered spec.
+        image_format (str): The lower-cased output format.
+        content (bytes): The encoded image or vector document.
+    """
+
+    kind: str
+    image_format: str
+    content: bytes
+
+    @property
+    def content_type(self) -> str:
+        """Returns the MIME type of the content."""
+        content_type = mimetypes.guess_type(f"file.{self.image_format}")[0]
+        return content_type or "application/octet-stream"
+
+
+class QRRenderer:
+    """Renders specs to encoded images without keeping per-render state.
+
+    Every call works on a fresh service instance that is discarded
+    afterwards, and the renderer itself only holds a read-only table of
+    kinds. One renderer can therefore be shared by all threads of a process.
+
+    Attributes:
+        kinds (Mapping[str, Tuple[type, str]]): Maps each kind to its service
+            class and method name.
+    """
+
+    def __init__(self, services: Iterable[Type[Service]] = DEFAULT_SERVICES) -> None:
+        """Initializes the renderer from the ``batch_methods`` of the services.
+
+        Args:
+            services (Iterable[type], optional): Service classes whose batch
+                kinds are registered. Later classes override earlier ones.
+        """
+        kinds: Dict[str, Tuple[Type[Service], str]] = {}
+        for service_class in services:
+            for kind, method_name in service_class.batch_methods.items():
+                kinds[kind] = (service_class, method_name)
+        self.kinds = MappingProxyType(kinds)
+
+    def render(self, spec: RenderSpec) -> RenderResult:
+        """Renders a spec, using the render cache when it is configured.
+
+        Args:
+            spec (RenderSpec): The payload and style to render.
+
+        Returns:
+            RenderResult: The encoded image.
+
+        Raises:
+            ValueError: If the kind is unknown or the format is not supported.
+        """
+        if spec.kind not in self.kinds:
+            logger.error("Unsupported render kind: %s", spec.kind)
+            raise ValueError(f"Unsupported QR code kind: {spec.kind}")
+        service_class, method_name = self.kinds[spec.kind]
+        worker = service_class()
+        options = dict(spec.options)
+
+        vector = QRCodeBase.is_vector_format(spec.image_format)
+        if vector:
+            if not isinstance(worker, QRCodeBase):
+                raise ValueError(
+                    f"{spec.image_format} output is not supported for {spec.kind}."
+                )
+            options["output_format"] = spec.image_format.lower()
+
+        def produce() -> bytes:
+            getattr(worker, method_name)(**options)
+            if isinstance(worker, BarcodeProxy):
+                return encode_image(worker.barcode_image, spec.image_format)
+            if worker.qr_vector is not None:
+                return worker.qr_vector
+            if worker.qr_file is not None:
+                with worker.qr_file:
+                    return worker.qr_file.read()
+            return encode_image(worker.qr_image, spec.image_format)
+
+        render_cache = get_render_cache()
+        if render_cache is None:
+            content = produce()
+        else:
+            content = render_cache.get_or_render(
+                worker.render_spec(spec.kind, spec.image_format, options), produce
+            )
+        return RenderResult(spec.kind, spec.image_format.lower(), content)
+
+    def render_kind(
+        self, kind: str, image_format: str = "PNG", **options: Any
+    ) -> RenderResult:
+        """Shortcut for ``render(RenderSpec(kind, options, image_format))``."""
+        return self.render(RenderSpec(kind, options, image_format))
+
+
+_renderer: Optional[QRRenderer] = None
+_renderer_lock = threading.Lock()
+
+
+def get_renderer() -> QRRenderer:
+    """Returns the process-wide renderer, creating it on first use.
+
+    Returns:
+        QRRenderer: The shared renderer.
+    """
+    global _renderer
+    if _renderer is None:
+        with _renderer_lock:
+            if _renderer is None:
+                _renderer = QRRenderer()
+    return _renderer
+
+
+def render(spec: RenderSpec) -> RenderResult:
+    """Renders a spec with the process-wide renderer.
+
+    Args:
+        spec (RenderSpec): The payload and style to render.
+
+    Returns:
+        RenderResult: The encoded image.
+    """
+    return get_renderer().render(spec)
@@ -0,0 +1,345 @@
+import logging
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+import segno
+
+try:
+    from PIL import Image, ImageDraw
+except ImportError as exc:
+    raise ImportError("Install `pillow` package. Run `pip install pillow`.") from exc
+
+from sage_qrcode.helpers.type import HexCode
+from sage_qrcode.service.raster import (
+    DARK,
+    FINDER_DARK,
+    FINDER_SIZE,
+    LIGHT,
+    _import_numpy,
+    module_matrix,
+    to_rgba,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from sage_qrcode.service.fills import Fill
+
+logger = logging.getLogger(__name__)
+
+# Shapes are drawn this many times larger and averaged down, so sprite edges
+# are antialiased however small the scale.
+SPRITE_SUPERSAMPLE = 4
+SPRITE_CACHE_SIZE = 128
+# Sprite stacks of fills have one sprite per module color and are rebuilt
+# instead of cached.
+SPRITE_CACHE_MAX_COLORS = 8
+
+ShapeBuilder = Callable[[int], Image.Image]
+
+
+def _square_module(size: int) -> Image.Image:
+    return Image.new("L", (size, size), 255)
+
+
+def _dot_module(size: int) -> Image.Image:
+    mask = Image.new("L", (size, size), 0)
+    inset = size // 20
+    ImageDraw.Draw(mask).ellipse(
+        (inset, inset, size - 1 - inset, size - 1 - inset), fill=255
+    )
+    return mask
+
+
+def _rounded_module(size: int) -> Image.Image:
+    mask = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(mask).rounded_rectangle(
+        (0, 0, size - 1, size - 1), radius=size // 3, fill=255
+    )
+    return mask
+
+
+def _draw_finder(size: int, draw_shape: Callable, radii=(0, 0, 0)) -> Image.Image:
+    mask = Image.new("L", (size, size), 0)
+    draw = ImageDraw.Draw(mask)
+    module = size / FINDER_SIZE
+    for offset, fill, radius in zip((0, 1, 2), (255, 0, 255), radii):
+        start = round(offset * module)
+        end = size - 1 - start
+        draw_shape(draw, (start, start, end, end), radius * module, fill)
+    return mask
+
+
+def _square_finder(size: int) -> Image.Image:
+    return _draw_finder(
+        size, lambda draw, box, radius, fill: draw.rectangle(box, fill=fill)
+    )
+
+
+def _rounded_finder(size: int) -> Image.Image:
+    return _draw_finder(
+        size,
+        lambda draw, box, radius, fill: draw.rounded_rectangle(
+            box, radius=radius, fill=fill
+        ),
+        radii=(2, 1.5, 1),
+    )
+
+
+def _circle_finder(size: int) -> Image.Image:
+    return _draw_finder(
+        size, lambda draw, box, radius, fill: draw.ellipse(box, fill=fill)
+    )
+
+
+_module_shapes: Dict[str, ShapeBuilder] = {
+    "square": _square_module,
+    "dots": _dot_module,
+    "rounded": _rounded_module,
+}
+_finder_shapes: Dict[str, ShapeBuilder] = {
+    "square": _square_finder,
+    "rounded": _rounded_finder,
+    "circle": _circle_finder,
+}
+_shapes_lock = threading.Lock()
+
+
+def register_module_shape(name: str, builder: ShapeBuilder) -> None:
+    """Registers or replaces a module shape.
+
+    Args:
+        name (str): The shape name used as ``module_shape``.
+        builder (Callable): Takes a size in pixels and returns a square ``L``
+            or ``1`` mask of one module, 255 where it is dark.
+    """
+    with _shapes_lock:
+        _module_shapes[name] = builder
+    _clear_sprite_caches()
+    logger.debug("Registered module shape %s.", name)
+
+
+def register_finder_shape(name: str, builder: ShapeBuilder) -> None:
+    """Registers or replaces a finder pattern shape.
+
+    Args:
+        name (str): The shape name used as ``finder_shape``.
+        builder (Callable): Takes a size in pixels and returns a square ``L``
+            or ``1`` mask of the 7x7-module finder pattern, 255 where it is dark.
+    """
+    with _shapes_lock:
+        _finder_shapes[name] = builder
+    _clear_sprite_caches()
+    logger.debug("Registered finder shape %s.", name)
+
+
+def get_module_shapes() -> List[str]:
+    """Returns the names of the registered module shapes."""
+    return sorted(_module_shapes)
+
+
+def get_finder_shapes() -> List[str]:
+    """Returns the names of the registered finder pattern shapes."""
+    return sorted(_finder_shapes)
+
+
+def _clear_sprite_caches() -> None:
+    get_shape_mask.cache_clear()
+    _module_sprites.cache_clear()
+    get_finder_sprite.cache_clear()
+
+
+@lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def get_shape_mask(kind: str, shape: str, size: int) -> "np.ndarray":
+    """Returns the antialiased coverage of a shape, building it on first use.
+
+    Args:
+        kind (str): 'module' or 'finder'.
+        shape (str): The shape name. Unknown shapes fall back to 'square'.
+        size (int): The sprite size in pixels.
+
+    Returns:
+        np.ndarray: A read-only ``float32`` matrix between 0 and 1.
+    """
+    np = _import_numpy()
+    shapes = _module_shapes if kind == "module" else _finder_shapes
+    builder = shapes.get(shape)
+    if builder is None:
+        logger.warning("Unknown %s shape %s, using squares.", kind, shape)
+        builder = shapes["square"]
+
+    logger.debug("Building %s %s sprite at %spx.", shape, kind, size)
+    mask = builder(size * SPRITE_SUPERSAMPLE)
+    if mask.mode != "L":
+        mask = mask.convert("L")
+    mask = mask.resize((size, size), Image.BOX)
+    coverage = np.asarray(mask, dtype=np.float32) / 255
+    coverage.setflags(write=False)
+    return coverage
+
+
+def blend_sprites(coverage: "np.ndarray", colors: "np.ndarray", light: int):
+    """Paints one sprite per color over the light color.
+
+    Args:
+        coverage (np.ndarray): The shape coverage between 0 and 1.
+        colors (np.ndarray): ``uint32`` native RGBA colors.
+        light (int): The native RGBA background color.
+
+    Returns:
+        np.ndarray: A ``uint32`` stack with one sprite per color.
+    """
+    np = _import_numpy()
+    background = np.array([light], dtype=np.uint32).view(np.uint8).astype(np.float32)
+    foreground = np.asarray(colors, dtype=np.uint32).view(np.uint8)
+    foreground = foreground.reshape(-1, 1, 1, 4).astype(np.float32)
+    sprites = background + (foreground - background) * coverage[None, :, :, None]
+    return np.rint(sprites).astype(np.uint8).view(np.uint32)[..., 0]
+
+
+@lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def _module_sprites(shape: str, scale: int, colors: Tuple[int, ...], light: int):
+    np = _import_numpy()
+    sprites = blend_sprites(
+        get_shape_mask("module", shape, scale), np.array(colors, dtype=np.uint32), light
+    )
+    sprites.setflags(write=False)
+    return sprites
+
+
+def get_module_sprites(shape: str, scale: int, colors: "np.ndarray", light: int):
+    """Returns the sprites of a module shape for each color.
+
+    Sprites of a few colors, such as a flat palette, are cached per shape,
+    scale and colors; the many colors of a fill are blended on every call.
+
+    Args:
+        shape (str): The module shape.
+        scale (int): Pixels per module.
+        colors (np.ndarray): ``uint32`` native RGBA module colors.
+        light (int): The native RGBA background color.
+
+    Returns:
+        np.ndarray: A ``uint32`` stack of ``scale`` x ``scale`` sprites.
+    """
+    if len(colors) <= SPRITE_CACHE_MAX_COLORS:
+        return _module_sprites(shape, scale, tuple(colors.tolist()), light)
+    return blend_sprites(get_shape_mask("module", shape, scale), colors, light)
+
+
+@lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def get_finder_sprite(shape: str, scale: int, color: int, light: int):
+    """Returns the sprite of a whole finder pattern.
+
+    Args:
+        shape (str): The finder pattern shape.
+        scale (int): Pixels per module.
+        color (int): The native RGBA finder color.
+        light (int): The native RGBA background color.
+
+    Returns:
+        np.ndarray: A read-only ``uint32`` sprite covering 7x7 modules.
+    """
+    np = _import_numpy()
+    coverage = get_shape_mask("finder", shape, FINDER_SIZE * scale)
+    sprite = blend_sprites(coverage, np.array([color], dtype=np.uint32), light)[0]
+    sprite.setflags(write=False)
+    return sprite
+
+
+def finder_origins(qr_code: segno.QRCode, border: int) -> List[Tuple[int, int]]:
+    """Returns the top-left module of each finder pattern, including the border."""
+    height, width = len(qr_code.matrix), len(qr_code.matrix[0])
+    origins = [(border, border)]
+    if not qr_code.is_micro:
+        origins.append((border, border + width - FINDER_SIZE))
+        origins.append((border + height - FINDER_SIZE, border))
+    return origins
+
+
+def rasterize_shapes(
+    qr_code: segno.QRCode,
+    scale: int = 10,
+    dark: HexCode = "#000000",
+    light: HexCode = "#FFFFFF",
+    finder_dark: HexCode = "#000000",
+    border: Optional[int] = None,
+    fill: Optional["Fill"] = None,
+    module_shape: str = "square",
+    finder_shape: str = "square",
+) -> Image.Image:
+    """Renders a symbol with styled modules and finder patterns using NumPy.
+
+    Every module color gets one pre-rendered sprite of the module shape, and
+    the whole image is stamped at once by indexing the sprite stack with the
+    module matrix. The finder patterns are then pasted as cached sprites.
+
+    Args:
+        qr_code (segno.QRCode): The encoded symbol.
+        scale (int, optional): Pixels per module. Default is 10.
+        dark (str, optional): Color of dark modules. Default is '#000000'.
+        light (str, optional): Color of light modules. Default is '#FFFFFF'.
+        finder_dark (str, optional): Color of the finder patterns. Default is '#000000'.
+        border (int, optional): Quiet zone size in modules. Default is None.
+        fill (Fill, optional): A gradient or image fill replacing the dark
+            color. Default is None.
+        module_shape (str, optional): 'square', 'dots', 'rounded' or a
+            registered shape. Default is 'square'.
+        finder_shape (str, optional): 'square', 'rounded', 'circle' or a
+            registered shape. Default is 'square'.
+
+    Returns:
+        Image.Image: The rendered image in RGBA mode.
+
+    Raises:
+        ValueError: If a color cannot be parsed.
+        ImportError: If NumPy is not installed.
+    """
+    np = _import_numpy()
+    if np is None:
+        raise ImportError("Install `numpy` package. Run `pip install numpy`.")
+
+    if border is None:
+        border = qr_code.default_border_size
+    palette = (
+        np.array([to_rgba(light), to_rgba(dark), to_rgba(finder_dark)], dtype=np.uint8)
+        .view(np.uint32)
+        .ravel()
+    )
+    modules = module_matrix(qr_code, border)
+    height, width = modules.shape
+    logger.debug(
+        "Stamping %sx%s %s modules at scale %s.", width, height, module_shape, scale
+    )
+
+    colors, index = palette, modules
+    if fill is not None:
+        module_colors = np.where(
+            modules == DARK,
+            fill.module_colors(modules.shape, border),
+            palette[modules],
+        )
+        colors, index = np.unique(module_colors, return_inverse=True)
+        index = index.reshape(modules.shape)
+    light_value = int(palette[LIGHT])
+    sprites = get_module_sprites(module_shape, scale, colors, light_value)
+
+    # Pixel row ``i`` of every module row is gathered from row ``i`` of the
+    # sprites, so the stamped tiles never need a transposing copy.
+    buffer = np.empty((height, scale, width, scale), dtype=np.uint32)
+    for row in range(scale):
+        buffer[:, row] = sprites[:, row][index]
+    buffer = buffer.reshape(height * scale, width * scale)
+
+    finder = get_finder_sprite(
+        finder_shape, scale, int(palette[FINDER_DARK]), light_value
+    )
+    size = FINDER_SIZE * scale
+    for top, left in finder_origins(qr_code, border):
+        buffer[top * scale : top * scale + size, left * scale : left * scale + size] = (
+            finder
+        )
+    return Image.frombuffer(
+        "RGBA", (width * scale, height * scale), buffer, "raw", "RGBA", 0, 1
+    )
@@ -1,10 +1,10 @@
-import os
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Mapping, Optional
 
 from sage_qrcode.service.base import QRCodeBase
-from sage_qrcode.utils import add_text_to_image, add_icon_to_image, add_frame_to_image
+from sage_qrcode.utils import Caption, Frame, Icon, compose
+from sage_qrcode.utils.platforms import get_platform_registry
 from sage_qrcode.helpers.type import HexCode
 
 try:
@@ -18,6 +18,32 @@ class SocialMediaQRCode(QRCodeBase):
     """A class for generating QR codes that include social media icons and
     related functionality."""
 
+    batch_methods = {
+        **QRCodeBase.batch_methods,
+        "social_media": "create_social_media_url",
+        "url": "create_url",
+    }
+
+    def get_social_media_icon(self, url: str) -> Icon:
+        """Returns the icon decoration of the platform a URL belongs to.
+
+        Args:
+            url (str): The social media URL.
+        Returns:
+            Icon: The platform icon.
+        Raises:
+            ValueError: If the URL does not match any known social media platforms.
+        """
+        platform = get_platform_registry().resolve(url)
+        if platform is None:
+            logger.error("No matching icon found for URL: %s", url)
+            raise ValueError("Invalid social media link")
+
+        logger.info(
+            "Matching platform %s found, using icon %s.", platform.name, platform.icon
+        )
+        return Icon(platform.icon, bundled=platform.bundled_icon)
+
     def add_social_media_icon(self, url: str) -> Image.Image:
         """Adds an appropriate social media icon to the QR code based on the
         provided URL.
@@ -29,29 +55,7 @@ class SocialMediaQRCode(QRCodeBase):
             ValueError: If the URL does not match any known social media platforms.
         """
         logger.debug("Attempting to add a social media icon for URL: %s", url)
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        os.chdir(script_dir)
-        icon_paths = {
-            "instagram.com": "icons/instagram.png",
-            "whatsapp.com": "icons/logo.png",
-            "t.me": "icons/gram.png",
-            "facebook.com": "icons/meta.png",
-            "twitter.com": "icons/witter.png",
-            "linkedin.com": "icons/linkedin.png",
-            "snapchat.com": "icons/snapchat.png",
-            "tiktok.com": "icons/ti.png",
-            "skype.com": "icons/skype.png",
-        }
-
-        for key, path in icon_paths.items():
-            if key in url.lower():
-                logger.info("Matching icon found for %s, using icon at %s.", key, path)
-                image = add_icon_to_image(self.qr_image, path)
-                break
-        else:
-            logger.error("No matching icon found for URL: %s", url)
-            raise ValueError("Invalid social media link")
-
+        image = compose(self.qr_image, [self.get_social_media_icon(url)])
         logger.info("Social media icon added successfully.")
         return image
 
@@ -64,6 +68,8 @@ class SocialMediaQRCode(QRCodeBase):
         color2: HexCode = "#FFFFFF",
         color3: HexCode = "#000000",
         size: int = 10,
+        output_format: str = "png",
+        fill: Optional[Mapping[str, Any]] = None,
     ) -> None:
         """Generates a QR code for a social media URL and adds an appropriate
         icon.
@@ -75,20 +81,37 @@ class SocialMediaQRCode(QRCodeBase):
             color2 (str, optional): Background color of the QR code. Default is '#FFFFFF'.
             color3 (str, optional): Finder pattern color of the QR code. Default is '#000000'.
             size (int, optional): Scale factor for the QR code size. Default is 10.
+            output_format (str, optional): 'png', or 'svg', 'pdf' or 'eps' for vector
+                output without the icon and text. Default is 'png'.
+            fill (dict, optional): A linear, radial or image fill for the dark
+                modules. Default is None.
         """
         logger.debug("Creating QR code for social media URL: %s", url)
+        decorations = []
+        if not self.is_vector_format(output_format):
+            decorations.append(self.get_social_media_icon(url))
+            if frame_type:
+                decorations.append(Frame(frame_type))
+            decorations.append(Caption("Scan to view social media profile"))
         result = self.generate_qr_code(
-            data=url, custom=None, color=color, scale=size, color2=color2, color3=color3
+            data=url,
+            custom=None,
+            color=color,
+            scale=size,
+            color2=color2,
+            color3=color3,
+            output_format=output_format,
+            fill=fill,
+            decorations=decorations,
         )
+        if self.is_encoded:
+            self.show_qr_code(save)
+            return
         if not result:
             logger.info("QR code generated. Adding social media icon.")
-            self.qr_image = self.add_social_media_icon(url)
             if frame_type:
                 logger.info("Adding frame_type to QR code.")
-                self.qr_image = add_frame_to_image(self.qr_image, frame_type)
-            self.qr_image = add_text_to_image(
-                self.qr_image, "Scan to view social media profile"
-            )
+            self.qr_image = compose(self.qr_image, decorations)
         self.show_qr_code(save)
 
     def create_url(
@@ -101,6 +124,8 @@ class SocialMediaQRCode(QRCodeBase):
         size: int = 10,
         color2: HexCode = "#FFFFFF",
         color3: HexCode = "#000000",
+        output_format: str = "png",
+        fill: Optional[Mapping[str, Any]] = None,
     ) -> None:
         """Generates a QR code for a URL and adds optional customizations like
         frame_type and text.
@@ -113,6 +138,10 @@ class SocialMediaQRCode(QRCodeBase):
             size (int, optional): Scale factor for the QR code size. Default is 10.
             color2 (str, optional): Background color of the QR code. Default is '#FFFFFF'.
             color3 (str, optional): Finder pattern color of the QR code. Default is '#000000'.
+            output_format (str, optional): 'png', or 'svg', 'pdf' or 'eps' for vector
+                output without the frame. Default is 'png'.
+            fill (dict, optional): A linear, radial or image fill for the dark
+                modules. Default is None.
         """
         logger.debug("Creating QR code for URL: %s", playlist_url)
         self.generate_qr_code(
@@ -122,14 +151,20 @@ class SocialMediaQRCode(QRCodeBase):
             color=color,
             color2=color2,
             color3=color3,
+            output_format=output_format,
+            fill=fill,
+            decorations=[Frame(frame_type)] if frame_type else (),
         )
+        if self.is_encoded:
+            self.show_qr_code(save)
+            return
         if frame_type:
             logger.info("Adding frame_type to QR code.")
-            self.qr_image = add_frame_to_image(self.qr_image, frame_type)
+            self.qr_image = compose(self.qr_image, [Frame(frame_type)])
         if not self.generate_qr_code:
             logger.info("Adding text to QR code image.")
-            self.qr_image = add_text_to_image(
-                self.qr_image, "Scan to view social media profile"
+            self.qr_image = compose(
+                self.qr_image, [Caption("Scan to view social media profile")]
             )
             self.show_qr_code(save)
         else:
@@ -0,0 +1,151 @@
+import logging
+import struct
+import zlib
+from typing import IO, Optional, Tuple
+
+import segno
+
+from sage_qrcode.helpers.type import HexCode
+from sage_qrcode.service.png import PNG_SIGNATURE, png_chunk
+from sage_qrcode.service.raster import DARK, FINDER_DARK, palette_indices, to_rgba
+
+logger = logging.getLogger(__name__)
+
+# Width of a version 40 symbol including the recommended quiet zone.
+MAX_SYMBOL_WIDTH = 177 + 2 * 4
+
+DEFAULT_STREAMING_MIN_PIXELS = 25_000_000
+DEFAULT_IDAT_SIZE = 1024 * 1024
+DEFAULT_BAND_BYTES = 1024 * 1024
+
+_FILTER_NONE, _FILTER_UP = b"\x00", b"\x02"
+_FINDER_AS_DARK = bytes.maketrans(bytes([FINDER_DARK]), bytes([DARK]))
+
+
+def _pack_row(modules: bytes, scale: int, bit_depth: int) -> bytes:
+    """Packs one module row into a PNG scanline without its filter byte.
+
+    The row is spelled out as a string of bits and converted in one step,
+    so the cost per pixel stays in C even for very wide symbols.
+
+    Args:
+        modules (bytes): The palette index of each module.
+        scale (int): Pixels per module.
+        bit_depth (int): Bits per pixel, 1 or 2.
+
+    Returns:
+        bytes: The packed pixels, padded to whole bytes.
+    """
+    runs = {index: format(index, f"0{bit_depth}b") * scale for index in set(modules)}
+    bits = "".join(runs[index] for index in modules)
+    row_bytes = -(-len(bits) // 8)
+    bits = bits.ljust(row_bytes * 8, "0")
+    return int(bits, 2).to_bytes(row_bytes, "big")
+
+
+def stream_png(
+    qr_code: segno.QRCode,
+    target: IO[bytes],
+    scale: int = 10,
+    dark: HexCode = "#000000",
+    light: HexCode = "#FFFFFF",
+    finder_dark: HexCode = "#000000",
+    border: Optional[int] = None,
+    compresslevel: int = 6,
+    idat_size: int = DEFAULT_IDAT_SIZE,
+) -> Tuple[int, int]:
+    """Writes a symbol as a palette PNG straight from its module matrix.
+
+    Each module row is packed into a scanline once; the ``scale - 1``
+    pixel rows repeating it are written with PNG's "up" filter as zero
+    bytes, in bands of at most ``DEFAULT_BAND_BYTES``. Compressed data is
+    emitted in ``IDAT`` chunks as it is produced, so memory stays bounded by
+    a few scanlines however large the image is, and no PIL image is built.
+
+    Args:
+        qr_code (segno.QRCode): The encoded symbol.
+        target (IO[bytes]): A binary file the PNG is written to.
+        scale (int, optional): Pixels per module. Default is 10.
+        dark (str, optional): Color of dark modules. Default is '#000000'.
+        light (str, optional): Color of light modules. Default is '#FFFFFF'.
+        finder_dark (str, optional): Color of the finder patterns. Default is '#000000'.
+        border (int, optional): Quiet zone size in modules. Default is None.
+        compresslevel (int, optional): The zlib compression level. Default is 6.
+        idat_size (int, optional): The size of each ``IDAT`` chunk in bytes.
+
+    Returns:
+        tuple: The width and height of the image in pixels.
+
+    Raises:
+        ValueError: If a color cannot be parsed.
+    """
+    colors = [to_rgba(light), to_rgba(dark), to_rgba(finder_dark)]
+    width, height, indices = palette_indices(qr_code, border)
+    if colors[FINDER_DARK] == colors[DARK]:
+        colors = colors[:FINDER_DARK]
+        indices = indices.translate(_FINDER_AS_DARK)
+    bit_depth = 1 if len(colors) <= 2 else 2
+    pixel_width, pixel_height = width * scale, height * scale
+    logger.debug(
+        "Streaming %sx%s PNG at %s bits per pixel.",
+        pixel_width,
+        pixel_height,
+        bit_depth,
+    )
+
+    target.write(PNG_SIGNATURE)
+    target.write(
+        png_chunk(
+            b"IHDR",
+            struct.pack(">IIBBBBB", pixel_width, pixel_height, bit_depth, 3, 0, 0, 0),
+        )
+    )
+    target.write(
+        png_chunk(b"PLTE", bytes(channel for color in colors for channel in color[:3]))
+    )
+    if any(color[3] != 255 for color in colors):
+        target.write(png_chunk(b"tRNS", bytes(color[3] for color in colors)))
+
+    compressor = zlib.compressobj(compresslevel)
+    pending = bytearray()
+
+    def emit(data: bytes) -> None:
+        pending.extend(data)
+        while len(pending) >= idat_size:
+            target.write(png_chunk(b"IDAT", bytes(pending[:idat_size])))
+            del pending[:idat_size]
+
+    row_bytes = -(-pixel_width * bit_depth // 8)
+    repeat = _FILTER_UP + bytes(row_bytes)
+    band_rows = max(1, DEFAULT_BAND_BYTES // len(repeat))
+    band = repeat * min(band_rows, scale - 1)
+    for y in range(height):
+        modules = indices[y * width : (y + 1) * width]
+        emit(compressor.compress(_FILTER_NONE + _pack_row(modules, scale, bit_depth)))
+        remaining = scale - 1
+        while remaining:
+            rows = min(band_rows, remaining)
+            emit(compressor.compress(band[: rows * len(repeat)]))
+            remaining -= rows
+    emit(compressor.flush())
+    if pending:
+        target.write(png_chunk(b"IDAT", bytes(pending)))
+    target.write(png_chunk(b"IEND"))
+    return pixel_width, pixel_height
+
+
+def may_need_streaming(scale: int, min_pixels: Optional[int]) -> bool:
+    """Returns True if a symbol at this scale could reach the pixel limit.
+
+    The check assumes the largest symbol, so it needs no encoding and
+    ordinary scales skip the exact check entirely.
+
+    Args:
+        scale (int): Pixels per module.
+        min_pixels (int, optional): The pixel count from which rasters are
+            streamed; None or 0 disables streaming.
+
+    Returns:
+        bool: Whether the encoded symbol has to be checked.
+    """
+    return bool(min_pixels) and (MAX_SYMBOL_WIDTH * scale) ** 2 >= min_pixels
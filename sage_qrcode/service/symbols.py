@@ -0,0 +1,127 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import segno
+
+try:
+    from PIL import Image
+except ImportError as exc:
+    raise ImportError("Install `pillow` package. Run `pip install pillow`.") from exc
+
+from sage_qrcode.conf import get_setting
+from sage_qrcode.service.encoding import EncodingCache
+from sage_qrcode.service.raster import rasterize_template
+from sage_qrcode.utils.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+class SymbolCache:
+    """A bounded, thread-safe LRU cache of symbol templates.
+
+    A template holds the palette indices of a symbol at one pixel per
+    module, so a code whose colors or size change is served by swapping the
+    palette of its template and enlarging it: the payload is neither encoded
+    nor rasterized again.
+
+    Attributes:
+        templates (LRUCache): The templates keyed by payload, error level and
+            border.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initializes an empty cache with the given limits."""
+        self.templates = LRUCache(max_size, max_bytes)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether templates are cached at all."""
+        return self.templates.enabled
+
+    @staticmethod
+    def make_key(
+        data: Any, error: Optional[str], border: Optional[int] = None
+    ) -> Optional[Tuple[Hashable, ...]]:
+        """Builds the cache key of a template.
+
+        Returns:
+            Optional[tuple]: The key, or None if the payload is not hashable.
+        """
+        symbol_key = EncodingCache.make_key(data, error)
+        if symbol_key is None:
+            return None
+        return symbol_key + (border,)
+
+    def get_template(
+        self,
+        data: Any,
+        error: Optional[str],
+        make_qr_code: Callable[[], segno.QRCode],
+        border: Optional[int] = None,
+    ) -> Image.Image:
+        """Returns the template of a symbol, rendering it on a miss.
+
+        Args:
+            data (Any): The encoded payload.
+            error (str, optional): Error correction level.
+            make_qr_code (Callable): Encodes the payload; only called on a miss.
+            border (int, optional): Quiet zone size in modules. Default is None.
+
+        Returns:
+            Image.Image: The one-pixel-per-module ``P`` template. It is shared
+            and must not be mutated.
+        """
+        return self.templates.get_or_create(
+            self.make_key(data, error, border),
+            lambda: rasterize_template(make_qr_code(), border),
+            lambda template: template.width * template.height,
+        )
+
+    def clear(self) -> None:
+        """Drops all templates and resets the counters."""
+        self.templates.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the template cache counters for monitoring."""
+        return self.templates.stats()
+
+
+_symbol_cache: Optional[SymbolCache] = None
+_symbol_cache_lock = threading.Lock()
+
+
+def get_symbol_cache() -> SymbolCache:
+    """Returns the process-wide symbol cache, creating it on first use.
+
+    The limits are read from the ``SAGE_QRCODE_SYMBOL_CACHE_SIZE`` and
+    ``SAGE_QRCODE_SYMBOL_CACHE_MAX_BYTES`` settings.
+
+    Returns:
+        SymbolCache: The shared cache instance.
+    """
+    global _symbol_cache
+    if _symbol_cache is None:
+        with _symbol_cache_lock:
+            if _symbol_cache is None:
+                _symbol_cache = SymbolCache(
+                    max_size=get_setting("SYMBOL_CACHE_SIZE", DEFAULT_CACHE_SIZE),
+                    max_bytes=get_setting(
+                        "SYMBOL_CACHE_MAX_BYTES", DEFAULT_CACHE_MAX_BYTES
+                    ),
+                )
+    return _symbol_cache
+
+
+def reset_symbol_cache() -> None:
+    """Discards the shared cache so the next use re-reads the settings."""
+    global _symbol_cache
+    with _symbol_cache_lock:
+        _symbol_cache = None
@@ -0,0 +1,147 @@
+import pickle
+from unittest import mock
+
+import pytest
+import segno
+from django.test import override_settings
+from PIL import Image
+
+from sage_qrcode.service import QRCodeBase
+from sage_qrcode.service.admission import (
+    AdmissionControl,
+    RenderAdmitted,
+    RenderEstimate,
+    RenderLimitExceeded,
+    check_only,
+    estimate_render,
+    get_admission_control,
+    reset_admission_control,
+    unrestricted,
+)
+
+PAYLOAD = "https://example.com/admission"
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    reset_admission_control()
+    yield
+    reset_admission_control()
+
+
+class TestEstimateRender:
+
+    @pytest.mark.parametrize("error", ["l", "m", "q", "h"])
+    @pytest.mark.parametrize("length", [1, 17, 120, 700, 1200])
+    def test_version_matches_segno_for_byte_payloads(self, error, length):
+        payload = "x" * length
+        estimate = estimate_render(payload, error, scale=4)
+        qr_code = segno.make(payload, error=error, micro=False)
+        assert estimate.version == qr_code.version
+        assert estimate.width * estimate.scale == qr_code.symbol_size(scale=4)[0]
+
+    def test_counts_frames_of_custom_image(self, tmp_path):
+        path = tmp_path / "custom.gif"
+        frames = [Image.new("RGB", (8, 8), color) for color in ("red", "lime", "blue")]
+        frames[0].save(path, save_all=True, append_images=frames[1:])
+        estimate = estimate_render(PAYLOAD, "h", scale=40, custom=path)
+        assert estimate.frames == 3
+        assert estimate.scale == 8
+        assert estimate.nbytes == estimate.pixels * 3 * 4
+
+
+class TestAdmissionControl:
+
+    def test_reject(self):
+        control = AdmissionControl(max_pixels=10_000)
+        with pytest.raises(RenderLimitExceeded) as info:
+            control.admit(RenderEstimate(1, 10))
+        assert info.value.action == "reject"
+        assert info.value.limits == ["pixel"]
+        assert control.stats()["rejected"] == 1
+
+    def test_downscale(self):
+        control = AdmissionControl(max_bytes=29 * 29 * 4 * 9, action="downscale")
+        assert control.admit(RenderEstimate(1, 10)) == 3
+        assert control.stats()["downscaled"] == 1
+
+    def test_frames_are_never_downscaled(self):
+        control = AdmissionControl(max_frames=2, action="downscale")
+        with pytest.raises(RenderLimitExceeded):
+            control.admit(RenderEstimate(1, 8, frames=5))
+
+    def test_queue(self):
+        queue = mock.Mock()
+        control = AdmissionControl(max_pixels=10_000, action="queue", queue=queue)
+        with pytest.raises(RenderLimitExceeded) as info:
+            control.admit(RenderEstimate(1, 10))
+        assert info.value.action == "queue"
+        with pytest.raises(ValueError):
+            AdmissionControl(action="queue")
+
+    def test_unrestricted(self):
+        control = AdmissionControl(max_pixels=10_000)
+        with unrestricted():
+            assert control.admit(RenderEstimate(1, 10)) == 10
+        assert control.stats()["admitted"] == 1
+
+    def test_check_only(self):
+        control = AdmissionControl(max_pixels=100_000, action="downscale")
+        with check_only():
+            with pytest.raises(RenderAdmitted) as info:
+                control.admit(RenderEstimate(1, 20))
+        assert info.value.scale == 10
+        assert control.stats()["estimates"] == 0
+
+    def test_error_is_picklable(self):
+        control = AdmissionControl(max_pixels=10_000, action="queue", queue=mock.Mock())
+        with pytest.raises(RenderLimitExceeded) as info:
+            control.admit(RenderEstimate(1, 10))
+        error = pickle.loads(pickle.dumps(info.value))
+        assert error.action == "queue"
+        assert error.estimate == info.value.estimate
+
+    def test_stats(self):
+        control = AdmissionControl()
+        control.admit(RenderEstimate(1, 10))
+        control.admit(RenderEstimate(2, 10))
+        stats = control.stats()
+        assert stats["estimates"] == 2
+        assert stats["peak"]["pixels"] == 330**2
+        assert stats["total"]["pixels"] == 290**2 + 330**2
+
+
+class TestGenerateQrCode:
+
+    def test_estimated_before_encoding(self):
+        service = QRCodeBase()
+        limits = {"MAX_PIXELS": 100_000}
+        with override_settings(SAGE_QRCODE_RENDER_LIMITS=limits):
+            with mock.patch("segno.make") as make:
+                with pytest.raises(RenderLimitExceeded):
+                    service.generate_qr_code(PAYLOAD, scale=20)
+        make.assert_not_called()
+
+    def test_downscaled(self):
+        service = QRCodeBase()
+        limits = {"MAX_PIXELS": 100_000, "ACTION": "downscale"}
+        with override_settings(SAGE_QRCODE_RENDER_LIMITS=limits):
+            service.generate_qr_code(PAYLOAD, scale=20)
+        assert service.qr_image.width**2 <= 100_000
+        assert get_admission_control().stats()["downscaled"] == 1
+
+    def test_custom_image_is_downscaled(self, tmp_path):
+        path = tmp_path / "custom.png"
+        Image.new("RGB", (64, 64), "red").save(path)
+        limit = 200**2
+        service = QRCodeBase()
+        limits = {"MAX_PIXELS": limit, "ACTION": "downscale"}
+        with override_settings(SAGE_QRCODE_RENDER_LIMITS=limits):
+            service.generate_qr_code(PAYLOAD, custom=path)
+        assert service.qr_image.width**2 <= limit
+        assert get_admission_control().stats()["downscaled"] == 1
+
+    def test_vector_output_is_not_limited(self):
+        service = QRCodeBase()
+        with override_settings(SAGE_QRCODE_RENDER_LIMITS={"MAX_PIXELS": 1}):
+            assert service.generate_qr_code(PAYLOAD, output_format="svg")
@@ -0,0 +1,135 @@
+import os
+
+import pytest
+import segno
+from django.test import override_settings
+from PIL import Image
+
+from sage_qrcode.service import QRCodeBase
+
+
+class TestArtisticOverlay:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        self.base_qrcode = QRCodeBase()
+        self.workdir = tmp_path / "cwd"
+        self.workdir.mkdir()
+        monkeypatch.chdir(self.workdir)
+
+    @pytest.fixture
+    def png_background(self, tmp_path):
+        path = tmp_path / "background.png"
+        Image.new("RGB", (100, 100), color="red").save(path)
+        return str(path)
+
+    @pytest.fixture
+    def gif_background(self, tmp_path):
+        path = tmp_path / "background.gif"
+        frames = [Image.new("RGB", (60, 60), color) for color in ("red", "blue")]
+        frames[0].save(path, save_all=True, append_images=frames[1:], duration=100)
+        return str(path)
+
+    def test_in_memory_render_writes_no_files(self, png_background):
+        result = self.base_qrcode.generate_qr_code(
+            data="https://example.com", custom=png_background
+        )
+        assert result is True
+        assert self.base_qrcode.qr_image.format == "PNG"
+        assert os.listdir(self.workdir) == []
+
+    def test_in_memory_render_keeps_animation_frames(self, gif_background):
+        image = self.base_qrcode.customize_qr_code(
+            segno.make("https://example.com"), gif_background
+        )
+        assert image.format == "GIF"
+        assert image.n_frames == 2
+        image.seek(1)
+        assert os.listdir(self.workdir) == []
+
+    def test_spooled_buffer_stays_in_memory_below_threshold(
+        self, gif_background, settings_spool
+    ):
+        buffer = self.base_qrcode._artistic_buffer()
+        segno.make("payload").to_artistic(
+            background=gif_background, target=buffer, kind="gif", scale=8
+        )
+        assert buffer._rolled is False
+
+    def test_disk_mode_is_still_available(self, png_background):
+        self.base_qrcode.customize_qr_code(
+            segno.make("payload"), png_background, in_memory=False
+        )
+        assert len(os.listdir(self.workdir)) == 1
+
+    @pytest.fixture
+    def settings_spool(self):
+        with override_settings(SAGE_QRCODE_ARTISTIC_SPOOL_MAX_SIZE=1024 * 1024):
+            yield
+
+
+class TestGenerateMany:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.base_qrcode = QRCodeBase()
+
+    def test_yields_encoded_images_in_order(self):
+        specs = [
+            {"data": f"https://example.com/{index}", "scale": 2} for index in range(5)
+        ]
+        results = list(self.base_qrcode.generate_many(specs))
+        assert len(results) == 5
+        assert all(result.startswith(b"\x89PNG") for result in results)
+        assert self.base_qrcode.qr_image is None
+
+    def test_is_lazy(self):
+        def specs():
+            yield {"data": "first"}
+            raise AssertionError("consumed too eagerly")
+
+        generator = self.base_qrcode.generate_many(specs())
+        assert next(generator).startswith(b"\x89PNG")
+
+    def test_image_format(self):
+        result = next(
+            self.base_qrcode.generate_many([{"data": "x"}], image_format="GIF")
+        )
+        assert result.startswith(b"GIF")
+
+    def test_unsupported_kind(self):
+        with pytest.raises(ValueError):
+            list(self.base_qrcode.generate_many([{"kind": "unknown", "data": "x"}]))
+
+
+class TestVectorOutput:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.base_qrcode = QRCodeBase()
+
+    @pytest.mark.parametrize(
+        "output_format, signature",
+        [
+            ("svg", b"<?xml"),
+            ("pdf", b"%PDF"),
+            ("eps", b"%!PS"),
+        ],
+    )
+    def test_vector_output_skips_rasterization(self, output_format, signature):
+        result = self.base_qrcode.generate_qr_code(
+            data="https://example.com", color3="#FF0000", output_format=output_format
+        )
+        assert result is True
+        assert self.base_qrcode.qr_image is None
+        assert self.base_qrcode.qr_vector.startswith(signature)
+        assert self.base_qrcode.show_qr_code() == self.base_qrcode.qr_vector
+
+    def test_raster_output_clears_vector(self):
+        self.base_qrcode.generate_qr_code(data="payload", output_format="svg")
+        self.base_qrcode.generate_qr_code(data="payload")
+        assert self.base_qrcode.qr_vector is None
+        assert self.base_qrcode.qr_image is not None
+
+    def test_generate_many_vector(self):
+        results = list(
+            self.base_qrcode.generate_many([{"data": "a"}, {"data": "b"}], "SVG")
+        )
+        assert all(result.startswith(b"<?xml") for result in results)
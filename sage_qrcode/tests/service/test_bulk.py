@@ -0,0 +1,71 @@
+import os
+import pickle
+
+import pytest
+
+from sage_qrcode.service import RenderSpec, render
+from sage_qrcode.service.bulk import BulkRenderer
+
+
+def shared_memory_blocks():
+    if not os.path.isdir("/dev/shm"):
+        return set()
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")}
+
+
+@pytest.fixture
+def specs(sample_epc_data):
+    return [
+        RenderSpec("wifi", {"ssid": f"Network {index}", "password": "secret"})
+        for index in range(5)
+    ] + [
+        RenderSpec("epc", sample_epc_data),
+        RenderSpec("url", {"playlist_url": "https://example.com"}, "svg"),
+    ]
+
+
+class TestBulkRenderer:
+    def test_spec_is_picklable(self, specs):
+        assert pickle.loads(pickle.dumps(specs[0])) == specs[0]
+
+    def test_ordered_results_match_single_renders(self, specs):
+        expected = [render(spec).content for spec in specs]
+        before = shared_memory_blocks()
+        with BulkRenderer(max_workers=2, chunksize=2) as renderer:
+            results = list(renderer.render_many(specs))
+        assert [position for position, _ in results] == list(range(len(specs)))
+        assert [result.content for _, result in results] == expected
+        assert results[-1][1].image_format == "svg"
+        assert shared_memory_blocks() == before
+
+    def test_unordered_results_cover_all_specs(self, specs):
+        expected = [render(spec).content for spec in specs]
+        with BulkRenderer(max_workers=2, ordered=False) as renderer:
+            results = dict(renderer.render_many(specs))
+        assert [results[position].content for position in range(len(specs))] == expected
+
+    def test_abandoned_results_are_released(self, specs):
+        before = shared_memory_blocks()
+        with BulkRenderer(max_workers=2, chunksize=3) as renderer:
+            results = renderer.render_many(specs)
+            next(results)
+            results.close()
+        assert shared_memory_blocks() == before
+
+    def test_errors_are_raised_in_the_parent(self):
+        with BulkRenderer(max_workers=1) as renderer:
+            with pytest.raises(ValueError):
+                list(renderer.render_many([RenderSpec("unknown")]))
+
+    def test_failed_chunk_releases_its_results(self, specs):
+        before = shared_memory_blocks()
+        with BulkRenderer(max_workers=1, chunksize=3) as renderer:
+            with pytest.raises(ValueError):
+                list(renderer.render_many(specs[:2] + [RenderSpec("unknown")]))
+        assert shared_memory_blocks() == before
+
+    def test_in_flight_chunks_are_bounded(self, specs):
+        expected = [render(spec).content for spec in specs]
+        with BulkRenderer(max_workers=2, max_in_flight=1) as renderer:
+            results = list(renderer.render_many(specs))
+        assert [result.content for _, result in results] == expected
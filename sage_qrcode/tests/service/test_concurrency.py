@@ -0,0 +1,84 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sage_qrcode.service import (
+    ContactQRCode,
+    PaymentQRCode,
+    QRRenderer,
+    RenderSpec,
+    SocialMediaQRCode,
+)
+from sage_qrcode.utils.icons import get_icon_cache
+
+THREADS = 16
+ROUNDS = 4
+
+
+@pytest.fixture
+def mixed_specs(sample_epc_data, sample_bitcoin_data):
+    specs = []
+    for index in range(6):
+        specs += [
+            RenderSpec("social_media", {"url": f"https://instagram.com/user{index}"}),
+            RenderSpec("social_media", {"url": f"https://t.me/user{index}"}),
+            RenderSpec("url", {"playlist_url": f"https://example.com/{index}"}),
+            RenderSpec("wifi", {"ssid": f"Network {index}", "password": "secret"}),
+            RenderSpec("vcard", {"name": f"Doe;John {index}", "email": "a@b.c"}),
+            RenderSpec("epc", {**sample_epc_data, "amount": 10.0 + index}),
+            RenderSpec("bitcoin", sample_bitcoin_data),
+        ]
+    return specs
+
+
+class TestConcurrentRendering:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        self.workdir = os.getcwd()
+        get_icon_cache().clear()
+
+    def test_social_icon_does_not_change_working_directory(self):
+        SocialMediaQRCode().create_social_media_url("https://instagram.com/test")
+        assert os.getcwd() == self.workdir
+
+    def test_shared_renderer_from_many_threads(self, mixed_specs):
+        renderer = QRRenderer()
+        expected = [renderer.render(spec).content for spec in mixed_specs]
+        get_icon_cache().clear()
+
+        start = threading.Barrier(THREADS)
+
+        def render_all(offset):
+            start.wait()
+            rotated = mixed_specs[offset:] + mixed_specs[:offset]
+            return offset, [renderer.render(spec).content for spec in rotated]
+
+        for _ in range(ROUNDS):
+            with ThreadPoolExecutor(max_workers=THREADS) as pool:
+                for offset, contents in pool.map(render_all, range(THREADS)):
+                    assert contents == expected[offset:] + expected[:offset]
+        assert os.getcwd() == self.workdir
+        assert os.listdir(self.workdir) == []
+
+    def test_service_instances_per_thread(self, sample_epc_data):
+        social = {"url": "https://linkedin.com/in/x"}
+        wifi = {"ssid": "Office", "password": "secret"}
+        jobs = [
+            (SocialMediaQRCode, "create_social_media_url", social),
+            (ContactQRCode, "generate_wifi_qr_code", wifi),
+            (PaymentQRCode, "generate_epc_qr_code", sample_epc_data),
+        ] * 20
+
+        def run(job):
+            service_class, method_name, options = job
+            service = service_class()
+            getattr(service, method_name)(**options)
+            return service.qr_image.tobytes()
+
+        sequential = [run(job) for job in jobs]
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            assert list(pool.map(run, jobs)) == sequential
+        assert os.getcwd() == self.workdir
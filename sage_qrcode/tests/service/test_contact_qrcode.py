@@ -103,3 +103,20 @@ class TestContactQRCodeGeneration:
             custom=temp_image
         )
         assert self.contact_qrcode.qr_image is not None
+
+    def test_generate_many(self, sample_wifi_data, sample_mecard_data):
+        specs = [
+            {"kind": "wifi", **sample_wifi_data},
+            {"kind": "mecard", **sample_mecard_data},
+            {"kind": "vcard", "name": "John Doe", "size": 4},
+        ]
+        results = list(self.contact_qrcode.generate_many(specs))
+        assert len(results) == 3
+        assert all(result.startswith(b"\x89PNG") for result in results)
+
+    def test_generate_wifi_qr_code_as_svg(self, sample_wifi_data):
+        self.contact_qrcode.generate_wifi_qr_code(
+            **sample_wifi_data, frame_type="simple", output_format="svg"
+        )
+        assert self.contact_qrcode.qr_image is None
+        assert self.contact_qrcode.qr_vector.startswith(b"<?xml")
@@ -0,0 +1,114 @@
+from unittest import mock
+
+import pytest
+import segno
+from django.test import override_settings
+
+from sage_qrcode.service.encoding import (
+    EncodingCache,
+    get_encoding_cache,
+    make_qr_code,
+    reset_encoding_cache,
+    shared_encoding,
+)
+
+
+class TestEncodingCache:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.cache = EncodingCache(max_size=2, max_bytes=1024 * 1024)
+
+    def test_hit_returns_same_symbol(self):
+        first = self.cache.get_or_make("https://example.com", error="h")
+        second = self.cache.get_or_make("https://example.com", error="H")
+        assert first is second
+        assert self.cache.stats()["hits"] == 1
+        assert self.cache.stats()["misses"] == 1
+
+    def test_symbol_matches_segno(self):
+        qr_code = self.cache.get_or_make("payload", error="m")
+        expected = segno.make("payload", error="m", micro=False)
+        assert qr_code.matrix == expected.matrix
+
+    def test_short_payloads_are_regular_qr_codes(self):
+        assert not self.cache.get_or_make("12345", error="l").is_micro
+        assert self.cache.get_or_make("12345", error="l", micro=True).is_micro
+        assert self.cache.stats()["size"] == 2
+
+    def test_key_includes_error_version_and_mask(self):
+        self.cache.max_size = 10
+        self.cache.get_or_make("payload", error="h")
+        self.cache.get_or_make("payload", error="l")
+        self.cache.get_or_make("payload", error="l", mask=2)
+        self.cache.get_or_make("payload", error="l", version=5)
+        assert self.cache.stats()["misses"] == 4
+        assert self.cache.stats()["size"] == 4
+
+    def test_lru_eviction_by_size(self):
+        self.cache.get_or_make("a")
+        self.cache.get_or_make("b")
+        self.cache.get_or_make("a")
+        self.cache.get_or_make("c")
+        stats = self.cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["size"] == 2
+        self.cache.get_or_make("a")
+        assert self.cache.stats()["hits"] == 2
+
+    def test_eviction_by_bytes(self):
+        cache = EncodingCache(max_size=100, max_bytes=500)
+        cache.get_or_make("a")
+        cache.get_or_make("b")
+        stats = cache.stats()
+        assert stats["bytes"] <= 500
+        assert stats["evictions"] >= 1
+
+    def test_disabled_cache(self):
+        cache = EncodingCache(max_size=0)
+        cache.get_or_make("a")
+        cache.get_or_make("a")
+        assert cache.stats()["hits"] == 0
+        assert cache.stats()["size"] == 0
+
+    def test_clear_resets_counters(self):
+        self.cache.get_or_make("a")
+        self.cache.clear()
+        assert self.cache.stats()["misses"] == 0
+        assert self.cache.stats()["size"] == 0
+
+
+class TestSharedEncodingCache:
+    def test_limits_read_from_settings(self, settings_override):
+        reset_encoding_cache()
+        cache = get_encoding_cache()
+        assert cache.max_size == 7
+        assert cache.max_bytes == 4096
+        reset_encoding_cache()
+
+    @pytest.fixture
+    def settings_override(self):
+        with override_settings(
+            SAGE_QRCODE_ENCODING_CACHE_SIZE=7,
+            SAGE_QRCODE_ENCODING_CACHE_MAX_BYTES=4096,
+        ):
+            yield
+
+
+class TestSharedEncoding:
+    @pytest.fixture(autouse=True)
+    def uncached(self):
+        with override_settings(SAGE_QRCODE_ENCODING_CACHE_SIZE=0):
+            reset_encoding_cache()
+            yield
+        reset_encoding_cache()
+
+    def test_encodes_once_inside_block(self):
+        with mock.patch("segno.make", wraps=segno.make) as make:
+            with shared_encoding():
+                first = make_qr_code("payload")
+                with shared_encoding():
+                    second = make_qr_code("payload", error="H")
+            third = make_qr_code("payload")
+        assert first is second
+        assert third is not first
+        assert make.call_count == 2
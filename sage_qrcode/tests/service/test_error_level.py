@@ -0,0 +1,82 @@
+import pytest
+from django.test import override_settings
+
+from sage_qrcode.service import QRCodeBase, SocialMediaQRCode
+from sage_qrcode.service.admission import estimate_version, payload_length
+from sage_qrcode.service.error_level import (
+    ERROR_RECOVERY,
+    choose_error_level,
+    overlay_coverage,
+    resolve_error_level,
+)
+from sage_qrcode.utils import Caption, Frame, Icon
+
+PAYLOAD = "https://example.com/error-level"
+ICON = Icon("instagram.png", bundled=True)
+
+
+class TestOverlayCoverage:
+
+    def test_no_decorations(self):
+        assert overlay_coverage([], 25, 10) == 0.0
+
+    def test_frame_and_caption_in_quiet_zone(self):
+        assert overlay_coverage([Frame("simple"), Caption("Scan me")], 25, 10) == 0.0
+
+    def test_frame_over_symbol_at_small_scale(self):
+        coverage = overlay_coverage([Frame("simple", width=10)], 25, 2)
+        # A 10 pixel frame reaches one module into the symbol.
+        assert coverage == pytest.approx(1 - 23**2 / 25**2)
+
+    def test_centered_icon(self):
+        coverage = overlay_coverage([ICON], 33, 10)
+        assert 0.05 < coverage < 0.1
+
+
+class TestChooseErrorLevel:
+
+    def test_plain_code_gets_lowest_level(self):
+        assert choose_error_level(PAYLOAD) == "l"
+
+    def test_icon_leaves_margin(self):
+        error = choose_error_level(PAYLOAD, [ICON])
+        assert error in ("m", "q", "h")
+        modules = 17 + 4 * estimate_version(payload_length(PAYLOAD), error)
+        coverage = overlay_coverage([ICON], modules, 10)
+        assert ERROR_RECOVERY[error] - coverage >= 0.05
+
+    def test_margin_setting(self):
+        with override_settings(SAGE_QRCODE_ERROR_SAFETY_MARGIN=0.2):
+            assert choose_error_level(PAYLOAD) == "q"
+
+    def test_explicit_level_is_kept(self):
+        assert resolve_error_level("Q", PAYLOAD, [ICON]) == "q"
+        with override_settings(SAGE_QRCODE_ERROR_LEVEL="auto"):
+            assert resolve_error_level(None, PAYLOAD) == "l"
+        assert resolve_error_level(None, PAYLOAD) == "h"
+
+
+class TestGenerateQrCode:
+
+    def test_auto_shrinks_plain_codes(self):
+        service = QRCodeBase()
+        service.generate_qr_code(PAYLOAD, scale=4)
+        default_width = service.qr_image.width
+        service.generate_qr_code(PAYLOAD, scale=4, error="auto")
+        assert service.qr_image.width < default_width
+
+    @pytest.mark.parametrize("payload", ["12345", "https://t.me/ab"])
+    def test_short_payloads_stay_regular_qr_codes(self, payload):
+        service = QRCodeBase()
+        service.generate_qr_code(payload, scale=1, error="auto")
+        assert choose_error_level(payload) == "l"
+        # A version 1 symbol with its quiet zone, not a Micro QR code.
+        assert service.qr_image.width == 21 + 2 * 4
+
+    def test_social_codes_account_for_icon(self):
+        service = SocialMediaQRCode()
+        with override_settings(SAGE_QRCODE_ERROR_LEVEL="auto"):
+            service.create_social_media_url("https://instagram.com/test_profile")
+            plain = QRCodeBase()
+            plain.generate_qr_code("https://instagram.com/test_profile")
+        assert service.qr_image.width >= plain.qr_image.width
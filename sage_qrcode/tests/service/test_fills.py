@@ -0,0 +1,150 @@
+import time
+from unittest import mock
+
+import pytest
+import segno
+from PIL import Image
+
+from sage_qrcode.service import QRCodeBase, render_key
+from sage_qrcode.service.fills import Fill
+from sage_qrcode.service.raster import DARK, module_matrix, rasterize
+
+np = pytest.importorskip("numpy")
+
+SYMBOL = segno.make("https://example.com/fills", error="h")
+BORDER = SYMBOL.default_border_size
+
+
+def dark_pixels(image, scale):
+    """Returns the colors of the dark, non-finder modules keyed by position."""
+    modules = module_matrix(SYMBOL, BORDER)
+    pixels = np.asarray(image)
+    return {
+        (y, x): tuple(pixels[y * scale, x * scale])
+        for y, x in zip(*np.nonzero(modules == DARK))
+    }
+
+
+class TestFill:
+
+    def test_from_value(self):
+        fill = Fill.from_value({"type": "linear", "colors": ["red", "blue"]})
+        assert fill == Fill("linear", ("red", "blue"))
+        assert Fill.from_value(fill) is fill
+        assert Fill.from_value({"type": "solid"}) is None
+        assert Fill.from_value(None) is None
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"type": "conic", "colors": ["red", "blue"]},
+            {"type": "linear", "colors": ["red"]},
+            {"type": "image"},
+        ],
+    )
+    def test_invalid_fill(self, value):
+        with pytest.raises(ValueError):
+            Fill.from_value(value)
+
+    def test_linear_gradient_endpoints(self):
+        fill = Fill("linear", ("#FF0000", "#0000FF"), angle=0)
+        colors = fill.module_colors((21 + 2 * BORDER, 21 + 2 * BORDER), BORDER)
+        rgba = colors.view(np.uint8).reshape(colors.shape + (4,))
+        left, right = rgba[BORDER, BORDER], rgba[BORDER, -BORDER - 1]
+        assert left[0] > 240 and left[2] < 15
+        assert right[2] > 240 and right[0] < 15
+        # Horizontal gradients do not change along a column.
+        assert (rgba[:, BORDER + 3] == rgba[BORDER + 3, BORDER + 3]).all()
+
+    def test_radial_gradient(self):
+        fill = Fill("radial", ("#FFFFFF", "#000000"))
+        size = 25 + 2 * BORDER
+        colors = fill.module_colors((size, size), BORDER)
+        rgba = colors.view(np.uint8).reshape(colors.shape + (4,))
+        center = size // 2
+        assert rgba[center, center, 0] > 240
+        assert rgba[BORDER, BORDER, 0] < 15
+        assert rgba[center, BORDER, 0] == rgba[BORDER, center, 0]
+
+    def test_image_fill_samples_per_module(self, tmp_path):
+        path = tmp_path / "fill.png"
+        source = Image.new("RGB", (100, 100), "red")
+        source.paste((0, 0, 255), (50, 0, 100, 100))
+        source.save(path)
+
+        image = rasterize(SYMBOL, 4, fill=Fill("image", image=str(path)))
+        width = len(SYMBOL.matrix)
+        colors = dark_pixels(image, 4)
+        assert colors[min(colors)] == (255, 0, 0, 255)
+        right = [c for (y, x), c in colors.items() if x >= BORDER + width - 3]
+        assert set(right) == {(0, 0, 255, 255)}
+
+    def test_finder_and_light_modules_keep_flat_colors(self):
+        fill = Fill("linear", ("#FF0000", "#0000FF"))
+        flat = rasterize(SYMBOL, 3, dark="#FF0000", finder_dark="#00FF00")
+        filled = rasterize(SYMBOL, 3, dark="#FF0000", finder_dark="#00FF00", fill=fill)
+        modules = np.repeat(
+            np.repeat(module_matrix(SYMBOL, BORDER), 3, axis=0), 3, axis=1
+        )
+        keep = modules != DARK
+        assert (np.asarray(flat)[keep] == np.asarray(filled)[keep]).all()
+        assert not (np.asarray(flat)[~keep] == np.asarray(filled)[~keep]).all()
+
+    def test_gradient_costs_about_as_much_as_flat(self):
+        fill = Fill("radial", ("#112233", "#AA00FF", "#FF8800"))
+
+        def best_of(**options):
+            timings = []
+            for _ in range(15):
+                start = time.perf_counter()
+                rasterize(SYMBOL, 20, dark="#112233", **options)
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        assert best_of(fill=fill) < best_of() * 3
+
+
+class TestServiceFill:
+
+    def test_generate_qr_code_with_fill(self):
+        service = QRCodeBase()
+        service.generate_qr_code(
+            "https://example.com/fills",
+            scale=4,
+            fill={"type": "linear", "colors": ["#FF0000", "#0000FF"]},
+        )
+        assert service.qr_image.mode == "RGBA"
+        colors = set(dark_pixels(service.qr_image, 4).values())
+        assert len(colors) > 10
+
+    def test_falls_back_to_flat_color_without_numpy(self):
+        service = QRCodeBase()
+        with mock.patch("sage_qrcode.service.base.numpy_available", return_value=False):
+            service.generate_qr_code(
+                "https://example.com/fills",
+                scale=4,
+                color="#FF0000",
+                fill={"type": "linear", "colors": ["#FF0000", "#0000FF"]},
+            )
+        assert set(dark_pixels(service.qr_image, 4).values()) == {(255, 0, 0, 255)}
+
+    def test_vector_output_ignores_fill(self):
+        service = QRCodeBase()
+        service.generate_qr_code(
+            "https://example.com/fills",
+            output_format="svg",
+            fill={"type": "radial", "colors": ["#FF0000", "#0000FF"]},
+        )
+        assert service.qr_vector.startswith(b"<?xml")
+
+    def test_render_key_digests_fill_image(self, tmp_path):
+        first, second = tmp_path / "a.png", tmp_path / "b.png"
+        Image.new("RGB", (8, 8), "red").save(first)
+        Image.new("RGB", (8, 8), "red").save(second)
+
+        def key(path):
+            return render_key({"fill": {"type": "image", "image": str(path)}})
+
+        assert key(first) == key(second)
+        Image.new("RGB", (8, 8), "blue").save(second)
+        assert key(first) != key(second)
@@ -84,3 +84,12 @@ class TestPaymentQRCodeGeneration:
             save=False
         )
         assert self.payment_qrcode.qr_image is not None
+
+    def test_generate_many(self, sample_epc_data, sample_bitcoin_data):
+        specs = [
+            {"kind": "epc", **sample_epc_data},
+            {"kind": "bitcoin", **sample_bitcoin_data},
+        ]
+        results = list(self.payment_qrcode.generate_many(specs))
+        assert len(results) == 2
+        assert all(result.startswith(b"\x89PNG") for result in results)
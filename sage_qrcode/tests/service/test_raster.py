@@ -0,0 +1,127 @@
+import pytest
+import segno
+from django.test import override_settings
+from PIL import ImageChops, ImageColor
+
+from sage_qrcode.service import ContactQRCode, QRCodeBase, SocialMediaQRCode
+from sage_qrcode.service.raster import (
+    DARK,
+    FINDER_DARK,
+    LIGHT,
+    module_matrix,
+    rasterize,
+    rasterize_indexed,
+)
+from sage_qrcode.utils import encode_image
+
+pytest.importorskip("numpy")
+
+
+class TestRasterizer:
+    @pytest.mark.parametrize("data", ["a", "https://example.com", "x" * 300])
+    @pytest.mark.parametrize(
+        "colors",
+        [
+            ("#000000", "#FFFFFF", "#000000"),
+            ("#112233", "#FFEEDD", "#FF0000"),
+            ("#112233", None, "#00FF00"),
+        ],
+    )
+    def test_matches_to_pil(self, data, colors):
+        qr_code = segno.make(data, error="h")
+        dark, light, finder_dark = colors
+        expected = qr_code.to_pil(
+            scale=7, dark=dark, light=light, finder_dark=finder_dark
+        ).convert("RGBA")
+        result = rasterize(qr_code, 7, dark, light, finder_dark)
+        assert result.mode == "RGBA"
+        assert result.size == expected.size
+        assert ImageChops.difference(result, expected).getbbox() is None
+
+    def test_module_matrix_marks_finder_patterns(self):
+        qr_code = segno.make("https://example.com", error="h", micro=False)
+        modules = module_matrix(qr_code, border=0)
+        assert modules[0, 0] == FINDER_DARK
+        assert modules[0, -1] == FINDER_DARK
+        assert modules[-1, 0] == FINDER_DARK
+        assert set(modules.ravel()) == {LIGHT, DARK, FINDER_DARK}
+
+    def test_result_is_drawable(self):
+        qr_code = segno.make("payload")
+        result = rasterize(qr_code, 4)
+        result.paste((255, 0, 0, 255), (0, 0, 4, 4))
+        assert result.getpixel((0, 0)) == (255, 0, 0, 255)
+
+    def test_invalid_color_raises_value_error(self):
+        with pytest.raises(ValueError):
+            rasterize(segno.make("payload"), 4, dark="not-a-color")
+
+
+class TestBaseNumpyRasterizer:
+    def test_generate_qr_code_with_numpy_rasterizer(self):
+        service = QRCodeBase()
+        service.generate_qr_code("https://example.com", scale=5, rasterizer="numpy")
+        numpy_image = service.qr_image
+        service.generate_qr_code("https://example.com", scale=5, rasterizer="pil")
+        assert numpy_image.mode == "RGBA"
+        assert ImageChops.difference(numpy_image, service.qr_image).getbbox() is None
+
+    def test_invalid_color_falls_back_to_default(self):
+        service = QRCodeBase()
+        service.generate_qr_code("payload", color="bogus", rasterizer="numpy")
+        assert service.qr_image.mode == "RGBA"
+
+
+class TestIndexedRasterizer:
+    @pytest.mark.parametrize(
+        "colors",
+        [
+            ("#112233", "#FFEEDD", "#FF0000"),
+            ("#112233", None, "#00FF00"),
+        ],
+    )
+    def test_palette_image_matches_rgba(self, colors):
+        qr_code = segno.make("https://example.com", error="h")
+        result = rasterize_indexed(qr_code, 5, *colors)
+        assert result.mode == "P"
+        assert result.getpalette()[:3] == list(
+            ImageColor.getrgb(colors[1] or "#000000")
+        )
+        expected = rasterize(qr_code, 5, *colors)
+        assert ImageChops.difference(result.convert("RGBA"), expected).getbbox() is None
+
+    def test_black_and_white_is_one_bit(self):
+        qr_code = segno.make("https://example.com", error="h")
+        result = rasterize_indexed(qr_code, 5)
+        assert result.mode == "1"
+        expected = rasterize(qr_code, 5)
+        assert ImageChops.difference(result.convert("RGBA"), expected).getbbox() is None
+
+    def test_palette_png_is_smaller(self):
+        qr_code = segno.make("https://example.com", error="h")
+        colors = ("#112233", "#FFEEDD", "#FF0000")
+        indexed = encode_image(rasterize_indexed(qr_code, 10, *colors))
+        rgba = encode_image(rasterize(qr_code, 10, *colors))
+        assert len(indexed) < len(rgba)
+
+
+class TestBaseImageMode:
+    def test_auto_mode_keeps_palette_through_frame_and_caption(self):
+        service = ContactQRCode()
+        with override_settings(SAGE_QRCODE_IMAGE_MODE="auto"):
+            service.generate_wifi_qr_code(
+                ssid="TestSSID", password="secret", color="#112233", frame_type="simple"
+            )
+        assert service.qr_image.mode == "P"
+        assert service.qr_image.getpalette("RGBA")[12:16] == [0, 0, 0, 255]
+
+    def test_auto_mode_black_and_white(self):
+        service = QRCodeBase()
+        service.generate_qr_code("payload", image_mode="auto")
+        assert service.qr_image.mode == "1"
+
+    def test_icon_falls_back_to_rgba(self):
+        service = SocialMediaQRCode()
+        with override_settings(SAGE_QRCODE_IMAGE_MODE="auto"):
+            service.create_social_media_url(url="https://instagram.com/test_profile")
+        assert service.qr_image.mode == "RGBA"
@@ -0,0 +1,123 @@
+import os
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+from PIL import Image
+
+from sage_qrcode.service import ContactQRCode
+from sage_qrcode.service.render_cache import (
+    DirectoryBackend,
+    DjangoCacheBackend,
+    RenderCache,
+    build_render_cache,
+    get_render_cache,
+    render_key,
+    reset_render_cache,
+)
+
+
+class TestRenderKey:
+    def test_key_is_stable_and_order_independent(self):
+        first = render_key({"data": "payload", "scale": 10, "color": "#000000"})
+        second = render_key({"color": "#000000", "scale": 10, "data": "payload"})
+        assert first == second
+
+    def test_key_changes_with_style(self):
+        base = {"data": "payload", "scale": 10, "color": "#000000"}
+        assert render_key(base) != render_key({**base, "color": "#FF0000"})
+        assert render_key(base) != render_key({**base, "scale": 12})
+
+    def test_custom_image_is_keyed_by_content(self, tmp_path):
+        first, second = tmp_path / "first.png", tmp_path / "second.png"
+        Image.new("RGB", (4, 4), "red").save(first)
+        Image.new("RGB", (4, 4), "red").save(second)
+        assert render_key({"custom": first}) == render_key({"custom": second})
+
+        Image.new("RGB", (4, 4), "blue").save(second)
+        assert render_key({"custom": first}) != render_key({"custom": second})
+
+
+class TestRenderCache:
+    def test_hit_skips_rendering(self):
+        cache = RenderCache(DjangoCacheBackend(key_prefix="test:hit:"))
+        render = mock.Mock(return_value=b"image")
+        assert cache.get_or_render({"data": "hit"}, render) == b"image"
+        assert cache.get_or_render({"data": "hit"}, render) == b"image"
+        assert render.call_count == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_get_and_set(self):
+        cache = RenderCache(DjangoCacheBackend(key_prefix="test:get:"))
+        assert cache.get({"data": "get"}) is None
+        cache.set({"data": "get"}, b"image")
+        assert cache.get({"data": "get"}) == b"image"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_directory_backend_round_trip(self, tmp_path):
+        cache = RenderCache(DirectoryBackend(tmp_path))
+        cache.get_or_render({"data": "disk"}, lambda: b"bytes")
+        assert cache.backend.get(render_key({"data": "disk"})) == b"bytes"
+
+    def test_directory_backend_evicts_least_recently_used(self, tmp_path):
+        backend = DirectoryBackend(tmp_path, max_entries=2)
+        backend.set("aa01", b"1")
+        backend.set("bb02", b"2")
+        os.utime(backend._path("aa01"), ns=(1, 1))
+        os.utime(backend._path("bb02"), ns=(2, 2))
+        backend.get("aa01")
+        backend.set("cc03", b"3")
+        assert backend.get("bb02") is None
+        assert backend.get("aa01") == b"1"
+        assert backend.evictions == 1
+
+    def test_directory_backend_evicts_by_size(self, tmp_path):
+        backend = DirectoryBackend(tmp_path, max_bytes=10)
+        backend.set("aa01", b"x" * 6)
+        os.utime(backend._path("aa01"), ns=(1, 1))
+        backend.set("bb02", b"y" * 6)
+        assert backend.get("aa01") is None
+        assert backend.get("bb02") == b"y" * 6
+
+    def test_build_from_settings(self, tmp_path):
+        assert build_render_cache(None) is None
+        cache = build_render_cache({"BACKEND": "directory", "LOCATION": tmp_path})
+        assert isinstance(cache.backend, DirectoryBackend)
+        with pytest.raises(ValueError):
+            build_render_cache({"BACKEND": "unknown"})
+
+
+class TestGenerateManyRenderCache:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        config = {"BACKEND": "directory", "LOCATION": str(tmp_path)}
+        with override_settings(SAGE_QRCODE_RENDER_CACHE=config):
+            reset_render_cache()
+            yield
+        reset_render_cache()
+
+    def test_repeated_spec_is_served_from_cache(self):
+        spec = {"kind": "wifi", "ssid": "Cached", "password": "secret"}
+        service = ContactQRCode()
+        first = list(service.generate_many([spec]))
+        with mock.patch("sage_qrcode.service.base.make_qr_code") as make:
+            second = list(service.generate_many([spec]))
+        make.assert_not_called()
+        assert first == second
+        assert get_render_cache().stats() == {"hits": 1, "misses": 1, "evictions": 0}
+
+    def test_different_styles_are_rendered_separately(self):
+        specs = [
+            {"kind": "wifi", "ssid": "Cached", "password": "secret"},
+            {
+                "kind": "wifi",
+                "ssid": "Cached",
+                "password": "secret",
+                "color": "#FF0000",
+            },
+        ]
+        first, second = ContactQRCode().generate_many(specs)
+        assert first != second
+        assert get_render_cache().stats()["misses"] == 2
@@ -0,0 +1,100 @@
+import dataclasses
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image
+
+from sage_qrcode.service import (
+    ContactQRCode,
+    QRRenderer,
+    RenderResult,
+    RenderSpec,
+    get_renderer,
+    render,
+)
+
+
+class TestRenderSpec:
+    def test_spec_is_immutable(self):
+        options = {"ssid": "Office", "password": "secret"}
+        spec = RenderSpec("wifi", options)
+        options["ssid"] = "Changed"
+        assert spec.options["ssid"] == "Office"
+        with pytest.raises(TypeError):
+            spec.options["ssid"] = "Changed"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            spec.kind = "vcard"
+
+
+class TestQRRenderer:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.renderer = QRRenderer()
+
+    def test_registers_kinds_of_all_services(self):
+        for kind in (
+            "qr_code",
+            "wifi",
+            "vcard",
+            "epc",
+            "bitcoin",
+            "url",
+            "barcode_text",
+        ):
+            assert kind in self.renderer.kinds
+
+    def test_render_returns_encoded_image(self):
+        result = self.renderer.render(
+            RenderSpec("wifi", {"ssid": "Office", "password": "secret"})
+        )
+        assert isinstance(result, RenderResult)
+        assert result.content_type == "image/png"
+        assert Image.open(io.BytesIO(result.content)).format == "PNG"
+
+    def test_render_matches_service_output(self):
+        expected = next(
+            ContactQRCode().generate_many(
+                [{"kind": "wifi", "ssid": "A", "password": "B"}]
+            )
+        )
+        result = self.renderer.render_kind("wifi", ssid="A", password="B")
+        assert result.content == expected
+
+    def test_render_vector(self):
+        result = self.renderer.render(
+            RenderSpec("url", {"playlist_url": "https://example.com"}, "svg")
+        )
+        assert result.image_format == "svg"
+        assert result.content_type == "image/svg+xml"
+        assert result.content.startswith(b"<?xml")
+
+    def test_render_barcode(self, sample_text):
+        result = self.renderer.render_kind("barcode_text", text=sample_text)
+        assert Image.open(io.BytesIO(result.content)).format == "PNG"
+
+    def test_barcode_rejects_vector_output(self, sample_text):
+        with pytest.raises(ValueError):
+            self.renderer.render(
+                RenderSpec("barcode_text", {"text": sample_text}, "svg")
+            )
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            self.renderer.render(RenderSpec("unknown"))
+
+    def test_shared_renderer_across_threads(self, sample_epc_data):
+        specs = [
+            RenderSpec("wifi", {"ssid": f"Network {index}", "password": "secret"})
+            for index in range(6)
+        ] + [
+            RenderSpec("epc", sample_epc_data),
+            RenderSpec("vcard", {"name": "Doe;John"}),
+        ]
+        expected = [self.renderer.render(spec).content for spec in specs]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(render, specs * 3))
+        assert [result.content for result in results] == expected * 3
+
+    def test_process_wide_renderer(self):
+        assert get_renderer() is get_renderer()
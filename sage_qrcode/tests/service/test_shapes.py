@@ -0,0 +1,123 @@
+from unittest import mock
+
+import pytest
+import segno
+from PIL import Image, ImageDraw
+
+from sage_qrcode.service import QRCodeBase
+from sage_qrcode.service.fills import Fill
+from sage_qrcode.service.raster import FINDER_SIZE, rasterize
+from sage_qrcode.service.shapes import (
+    get_finder_sprite,
+    get_module_shapes,
+    get_shape_mask,
+    rasterize_shapes,
+    register_module_shape,
+)
+
+np = pytest.importorskip("numpy")
+
+SYMBOL = segno.make("https://example.com/shapes", error="h")
+BORDER = SYMBOL.default_border_size
+
+
+def module_center(image, y, x, scale):
+    return image.getpixel((x * scale + scale // 2, y * scale + scale // 2))
+
+
+class TestShapes:
+
+    @pytest.mark.parametrize("micro", [False, True])
+    def test_squares_match_flat_rasterizer(self, micro):
+        qr_code = segno.make("shapes", micro=micro)
+        colors = {"dark": "#112233", "light": "#FFEEDD", "finder_dark": "#FF0000"}
+        expected = rasterize(qr_code, 6, **colors)
+        assert rasterize_shapes(qr_code, 6, **colors).tobytes() == expected.tobytes()
+
+    def test_dots_keep_module_centers_and_clear_corners(self):
+        scale = 12
+        flat = rasterize(SYMBOL, scale, dark="#112233")
+        dots = rasterize_shapes(SYMBOL, scale, dark="#112233", module_shape="dots")
+        matrix = SYMBOL.matrix
+        for y in range(FINDER_SIZE + 1, len(matrix) - FINDER_SIZE - 1):
+            for x in range(FINDER_SIZE + 1, len(matrix) - FINDER_SIZE - 1):
+                top, left = y + BORDER, x + BORDER
+                assert module_center(dots, top, left, scale) == module_center(
+                    flat, top, left, scale
+                )
+                corner = dots.getpixel((left * scale, top * scale))
+                assert corner == (255, 255, 255, 255)
+
+    def test_circle_finder(self):
+        scale = 10
+        image = rasterize_shapes(
+            SYMBOL, scale, finder_dark="#FF0000", finder_shape="circle"
+        )
+        origin = BORDER * scale
+        size = FINDER_SIZE * scale
+        assert image.getpixel((origin, origin)) == (255, 255, 255, 255)
+        assert image.getpixel((origin + size // 2, origin)) == (255, 0, 0, 255)
+        assert image.getpixel((origin + size // 2,) * 2) == (255, 0, 0, 255)
+
+    def test_fill_with_shapes(self):
+        fill = Fill("linear", ("#FF0000", "#0000FF"), angle=0)
+        image = rasterize_shapes(SYMBOL, 8, fill=fill, module_shape="rounded")
+        pixels = np.asarray(image).reshape(-1, 4)
+        assert len(np.unique(pixels.view(np.uint32))) > 20
+
+    def test_sprites_are_cached(self):
+        assert get_finder_sprite("rounded", 9, 0xFF000000, 0xFFFFFFFF) is (
+            get_finder_sprite("rounded", 9, 0xFF000000, 0xFFFFFFFF)
+        )
+        assert get_shape_mask("module", "dots", 9) is get_shape_mask(
+            "module", "dots", 9
+        )
+
+    def test_unknown_shape_falls_back_to_squares(self):
+        expected = rasterize(SYMBOL, 4)
+        result = rasterize_shapes(SYMBOL, 4, module_shape="stars", finder_shape="stars")
+        assert result.tobytes() == expected.tobytes()
+
+    def test_register_module_shape(self):
+        from sage_qrcode.service import shapes
+
+        def diamond(size):
+            mask = Image.new("L", (size, size), 0)
+            half = size // 2
+            ImageDraw.Draw(mask).polygon(
+                [(half, 0), (size, half), (half, size), (0, half)], fill=255
+            )
+            return mask
+
+        registered = dict(shapes._module_shapes)
+        try:
+            register_module_shape("diamond", diamond)
+            assert "diamond" in get_module_shapes()
+            image = rasterize_shapes(SYMBOL, 10, module_shape="diamond")
+            assert image.tobytes() != rasterize(SYMBOL, 10).tobytes()
+        finally:
+            shapes._module_shapes.clear()
+            shapes._module_shapes.update(registered)
+            shapes._clear_sprite_caches()
+
+
+class TestServiceShapes:
+
+    def test_generate_qr_code_with_shapes(self):
+        service = QRCodeBase()
+        service.generate_qr_code(
+            "https://example.com/shapes",
+            scale=8,
+            module_shape="dots",
+            image_mode="auto",
+        )
+        assert service.qr_image.mode == "RGBA"
+        assert service.qr_image.tobytes() != rasterize(SYMBOL, 8).tobytes()
+
+    def test_falls_back_to_squares_without_numpy(self):
+        service = QRCodeBase()
+        with mock.patch("sage_qrcode.service.base.numpy_available", return_value=False):
+            service.generate_qr_code(
+                "https://example.com/shapes", scale=4, module_shape="dots"
+            )
+        assert service.qr_image.tobytes() == rasterize(SYMBOL, 4).tobytes()
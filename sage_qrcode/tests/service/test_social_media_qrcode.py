@@ -26,3 +26,16 @@ class TestSocialMediaQRCodeGeneration:
                 save=False
             )
         assert str(exc_info.value) == "Invalid social media link"
+
+    def test_generate_many(self, sample_social_media_url, sample_playlist_url):
+        specs = [
+            {"kind": "social_media", "url": sample_social_media_url},
+            {
+                "kind": "url",
+                "playlist_url": sample_playlist_url,
+                "frame_type": "simple",
+            },
+        ]
+        results = list(self.social_qrcode.generate_many(specs))
+        assert len(results) == 2
+        assert all(result.startswith(b"\x89PNG") for result in results)
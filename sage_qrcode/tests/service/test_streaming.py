@@ -0,0 +1,81 @@
+import io
+
+import pytest
+import segno
+from django.test import override_settings
+from PIL import Image
+
+from sage_qrcode.service import ContactQRCode, QRCodeBase
+from sage_qrcode.service.raster import rasterize_indexed
+from sage_qrcode.service.streaming import may_need_streaming, stream_png
+
+PAYLOAD = "https://example.com/print"
+
+
+def streamed(qr_code, *args, **kwargs):
+    buffer = io.BytesIO()
+    size = stream_png(qr_code, buffer, *args, **kwargs)
+    image = Image.open(io.BytesIO(buffer.getvalue()))
+    image.load()
+    assert image.size == size
+    return image
+
+
+class TestStreamPng:
+
+    @pytest.mark.parametrize(
+        "colors",
+        [
+            ("#000000", "#FFFFFF", "#000000"),
+            ("#112233", "#FFEEDD", "#FF0000"),
+            ("#112233", None, "#00FF00"),
+        ],
+    )
+    def test_matches_rasterize_indexed(self, colors):
+        qr_code = segno.make(PAYLOAD, error="h")
+        expected = rasterize_indexed(qr_code, 7, *colors).convert("RGBA")
+        result = streamed(qr_code, 7, *colors, idat_size=512).convert("RGBA")
+        assert result.tobytes() == expected.tobytes()
+
+    def test_two_colors_use_one_bit(self):
+        image = streamed(segno.make(PAYLOAD), 3, "#1D4ED8", "#FFFFFF", "#1D4ED8")
+        assert image.mode == "P"
+        assert len(image.getpalette()) == 6
+
+    def test_invalid_color(self):
+        with pytest.raises(ValueError):
+            stream_png(segno.make(PAYLOAD), io.BytesIO(), 3, "not-a-color")
+
+
+class TestStreamingGuard:
+
+    def test_ordinary_scales_skip_the_check(self):
+        assert not may_need_streaming(10, 25_000_000)
+        assert may_need_streaming(1000, 25_000_000)
+        assert not may_need_streaming(1000, None)
+
+    def test_oversized_raster_is_streamed(self):
+        service = QRCodeBase()
+        with override_settings(SAGE_QRCODE_STREAMING_MIN_PIXELS=100_000):
+            assert service.generate_qr_code(PAYLOAD, scale=20, error="h") is True
+        assert service.qr_image is None
+        assert service.qr_vector is None
+        image = Image.open(service.show_qr_code())
+        qr_code = segno.make(PAYLOAD, error="h")
+        assert image.size == qr_code.symbol_size(scale=20)
+
+    def test_decorated_raster_is_not_streamed(self):
+        service = ContactQRCode()
+        with override_settings(SAGE_QRCODE_STREAMING_MIN_PIXELS=100_000):
+            service.generate_wifi_qr_code(
+                "Office", "secret", size=20, frame_type="simple"
+            )
+        assert service.qr_file is None
+        assert service.qr_image is not None
+
+    def test_small_raster_is_not_streamed(self):
+        service = QRCodeBase()
+        with override_settings(SAGE_QRCODE_STREAMING_MIN_PIXELS=100_000):
+            assert service.generate_qr_code(PAYLOAD, scale=2) is False
+        assert service.qr_file is None
+        assert service.qr_image is not None
@@ -0,0 +1,142 @@
+from unittest import mock
+
+import pytest
+import segno
+from django.test import override_settings
+from PIL import ImageChops
+
+from sage_qrcode.service import ContactQRCode, QRCodeBase
+from sage_qrcode.service.raster import (
+    colorize_template,
+    rasterize_indexed,
+    rasterize_template,
+)
+from sage_qrcode.service.symbols import (
+    SymbolCache,
+    get_symbol_cache,
+    reset_symbol_cache,
+)
+from sage_qrcode.utils.lru import LRUCache
+
+PAYLOAD = "https://example.com/recolor"
+
+
+class TestLRUCache:
+
+    def test_eviction_by_size_and_bytes(self):
+        cache = LRUCache(max_size=2, max_bytes=10)
+        cache.put("a", 1, 4)
+        cache.put("b", 2, 4)
+        assert cache.get("a") == 1
+        cache.put("c", 3, 4)
+        assert cache.get("b") is None
+        cache.put("d", 4, 8)
+        assert cache.stats()["size"] == 1
+        assert cache.stats()["evictions"] == 3
+
+    def test_disabled(self):
+        cache = LRUCache(max_size=0, max_bytes=10)
+        assert cache.get_or_create("a", lambda: 1, lambda value: 1) == 1
+        assert cache.stats()["size"] == 0
+
+
+class TestColorizeTemplate:
+
+    @pytest.mark.parametrize(
+        "colors",
+        [
+            ("#000000", "#FFFFFF", "#000000"),
+            ("#112233", "#FFEEDD", "#FF0000"),
+            ("#112233", None, "#00FF00"),
+        ],
+    )
+    def test_matches_rasterize_indexed(self, colors):
+        qr_code = segno.make(PAYLOAD, error="h")
+        expected = rasterize_indexed(qr_code, 6, *colors)
+        result = colorize_template(rasterize_template(qr_code), *colors, 6)
+        assert result.mode == expected.mode
+        assert result.tobytes() == expected.tobytes()
+        assert result.getpalette() == expected.getpalette()
+
+    def test_template_is_not_modified(self):
+        template = rasterize_template(segno.make(PAYLOAD))
+        before = template.tobytes()
+        colorize_template(template, "#FF0000").putpixel((0, 0), 2)
+        assert template.tobytes() == before
+
+
+class TestRecolorFastPath:
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        reset_symbol_cache()
+        yield
+        reset_symbol_cache()
+
+    def test_recolor_skips_encoding_and_rasterization(self):
+        service = ContactQRCode()
+        service.generate_wifi_qr_code("Office", "secret", color="#112233")
+        with mock.patch("segno.make") as make, mock.patch(
+            "sage_qrcode.service.symbols.rasterize_template"
+        ) as rasterize:
+            service.generate_wifi_qr_code("Office", "secret", color="#FF0000")
+        make.assert_not_called()
+        rasterize.assert_not_called()
+        assert get_symbol_cache().stats()["hits"] == 1
+
+        expected = ContactQRCode()
+        with override_settings(SAGE_QRCODE_SYMBOL_CACHE_SIZE=0):
+            reset_symbol_cache()
+            expected.generate_wifi_qr_code("Office", "secret", color="#FF0000")
+        assert (
+            ImageChops.difference(service.qr_image, expected.qr_image).getbbox() is None
+        )
+
+    def test_matches_uncached_render(self):
+        options = {"color": "#112233", "color2": "#FFEEDD", "color3": "#FF0000"}
+        cached = QRCodeBase()
+        cached.generate_qr_code(PAYLOAD, scale=5, **options)
+        with override_settings(SAGE_QRCODE_SYMBOL_CACHE_SIZE=0):
+            reset_symbol_cache()
+            uncached = QRCodeBase()
+            uncached.generate_qr_code(PAYLOAD, scale=5, **options)
+        assert cached.qr_image.mode == uncached.qr_image.mode == "RGBA"
+        assert cached.qr_image.tobytes() == uncached.qr_image.tobytes()
+
+    def test_auto_mode_keeps_palette(self):
+        service = QRCodeBase()
+        service.generate_qr_code(PAYLOAD, color="#112233", image_mode="auto")
+        assert service.qr_image.mode == "P"
+        service.generate_qr_code(PAYLOAD, image_mode="auto")
+        assert service.qr_image.mode == "1"
+
+    def test_invalid_color_falls_back_to_defaults(self):
+        service = QRCodeBase()
+        service.generate_qr_code(PAYLOAD, scale=2, color="bogus")
+        assert service.qr_image.getpixel((0, 0)) == (255, 255, 255, 255)
+
+    def test_rescale_skips_encoding_and_rasterization(self):
+        service = QRCodeBase()
+        service.generate_qr_code(PAYLOAD, scale=4, color="#112233")
+        with mock.patch("segno.make") as make, mock.patch(
+            "sage_qrcode.service.symbols.rasterize_template"
+        ) as rasterize:
+            service.generate_qr_code(PAYLOAD, scale=9, color="#112233")
+        make.assert_not_called()
+        rasterize.assert_not_called()
+
+        with override_settings(SAGE_QRCODE_SYMBOL_CACHE_SIZE=0):
+            reset_symbol_cache()
+            expected = QRCodeBase()
+            expected.generate_qr_code(PAYLOAD, scale=9, color="#112233")
+        assert service.qr_image.size == expected.qr_image.size
+        assert service.qr_image.tobytes() == expected.qr_image.tobytes()
+
+    def test_templates_are_shared_across_scales(self):
+        cache = SymbolCache()
+        make = mock.Mock(return_value=segno.make(PAYLOAD))
+        first = cache.get_template(PAYLOAD, "h", make)
+        assert cache.get_template(PAYLOAD, "H", make) is first
+        assert cache.get_template(PAYLOAD, "h", make, border=2) is not first
+        assert first.size == segno.make(PAYLOAD).symbol_size(scale=1)
+        assert make.call_count == 2
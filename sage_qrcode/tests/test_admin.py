@@ -0,0 +1,130 @@
+import io
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from PIL import Image
+
+from sage_qrcode.models import VCardQRCode, WifiQRCode
+from sage_qrcode.service.admission import reset_admission_control
+from sage_qrcode.utils.renditions import get_renditions
+
+
+def image_upload(name, image_format, color="red"):
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), color=color).save(buffer, format=image_format)
+    return SimpleUploadedFile(
+        name, buffer.getvalue(), content_type=f"image/{image_format.lower()}"
+    )
+
+
+@pytest.fixture
+def media_root(settings, tmp_path, monkeypatch):
+    settings.MEDIA_ROOT = str(tmp_path / "media")
+    # The admin forms copy custom GIFs below the working directory.
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def render_limits(settings):
+    settings.SAGE_QRCODE_RENDER_LIMITS = {"MAX_PIXELS": 100}
+    reset_admission_control()
+    yield
+    reset_admission_control()
+
+
+def vcard_form_data(**extra):
+    return {
+        "full_name": "John Doe",
+        "email": "john.doe@example.com",
+        "fill_type": "solid",
+        "gradient_angle": 45,
+        **extra,
+    }
+
+
+@pytest.mark.django_db
+class TestQRCodeAdminSave:
+    # ``VCardQRCodeAdmin`` is a polymorphic child admin, so its add and
+    # change views take the model form directly.
+
+    def test_custom_gif_is_rendered_for_new_object(self, admin_client, media_root):
+        response = admin_client.post(
+            reverse("admin:sage_qrcode_vcardqrcode_add"),
+            vcard_form_data(custom_gif=image_upload("custom.gif", "GIF")),
+        )
+        assert response.status_code == 302
+        obj = VCardQRCode.objects.get()
+        assert obj.custom_gif
+        assert obj.qr_code_image.name.endswith(f"{obj.pk}_qr.png")
+        with obj.qr_code_image.open("rb") as stored:
+            assert Image.open(stored).size[0] > 0
+
+    def test_fill_image_is_rendered_for_new_object(self, admin_client, media_root):
+        response = admin_client.post(
+            reverse("admin:sage_qrcode_vcardqrcode_add"),
+            vcard_form_data(
+                fill_type="image", fill_image=image_upload("fill.png", "PNG", "blue")
+            ),
+        )
+        assert response.status_code == 302
+        obj = VCardQRCode.objects.get()
+        assert obj.fill_image
+        with obj.qr_code_image.open("rb") as stored:
+            colors = Image.open(stored).convert("RGB").getcolors()
+        assert (0, 0, 255) in [color for _, color in colors]
+
+    def test_rejected_edit_is_not_saved(self, admin_client, media_root, render_limits):
+        obj = VCardQRCode.objects.create(full_name="John Doe")
+        response = admin_client.post(
+            reverse("admin:sage_qrcode_vcardqrcode_change", args=[obj.pk]),
+            vcard_form_data(full_name="Jane Doe"),
+        )
+        assert response.status_code == 200
+        assert "render exceeds the pixel limit" in response.content.decode()
+        obj.refresh_from_db()
+        assert obj.full_name == "John Doe"
+
+
+@pytest.mark.django_db
+class TestRegenerateQrCodes:
+
+    def test_parent_admin_regenerates_child_codes(self, admin_client, media_root):
+        obj = WifiQRCode.objects.create(ssid="TestSSID", password="TestPassword")
+        assert not obj.qr_code_image
+        response = admin_client.post(
+            reverse("admin:sage_qrcode_qrcode_changelist"),
+            {"action": "regenerate_qr_codes", "_selected_action": [obj.pk]},
+            follow=True,
+        )
+        assert "Regenerated 1 QR codes" in response.content.decode()
+        obj.refresh_from_db()
+        assert obj.qr_code_image.name.endswith(f"{obj.pk}_qr.png")
+
+    def test_renditions_are_regenerated(self, admin_client, media_root, settings):
+        settings.SAGE_QRCODE_RENDITIONS = {"print": {"SIZE": 4, "DPI": 300}}
+        obj = WifiQRCode.objects.create(ssid="TestSSID", password="TestPassword")
+        admin_client.post(
+            reverse("admin:sage_qrcode_qrcode_changelist"),
+            {"action": "regenerate_qr_codes", "_selected_action": [obj.pk]},
+        )
+        name = get_renditions()["print"].get_name(obj)
+        with obj.qr_code_image.storage.open(name) as stored:
+            printed = Image.open(stored)
+            assert printed.info["dpi"] == pytest.approx((300, 300), abs=0.1)
+
+    def test_codes_over_limits_are_skipped(
+        self, admin_client, media_root, render_limits
+    ):
+        obj = WifiQRCode.objects.create(ssid="TestSSID", password="TestPassword")
+        response = admin_client.post(
+            reverse("admin:sage_qrcode_qrcode_changelist"),
+            {"action": "regenerate_qr_codes", "_selected_action": [obj.pk]},
+            follow=True,
+        )
+        content = response.content.decode()
+        assert "Regenerated 0 QR codes" in content
+        assert "1 QR codes over the render limits were skipped" in content
+        obj.refresh_from_db()
+        assert not obj.qr_code_image
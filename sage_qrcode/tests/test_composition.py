@@ -0,0 +1,195 @@
+from unittest import mock
+
+import pytest
+import segno
+from PIL import Image, ImageDraw
+
+from sage_qrcode.service.raster import rasterize_indexed
+from sage_qrcode.utils import (
+    Caption,
+    Frame,
+    Icon,
+    add_bundled_icon_to_image,
+    add_frame_to_image,
+    add_text_to_image,
+    compose,
+)
+from sage_qrcode.utils.composition import (
+    compile_plan,
+    get_frame_mask,
+    get_frame_styles,
+    register_frame_style,
+    split_mask,
+)
+from sage_qrcode.utils.layers import LayerCache
+
+SYMBOL = segno.make("https://example.com/compose")
+
+
+def symbols():
+    yield rasterize_indexed(SYMBOL, scale=10)
+    yield rasterize_indexed(SYMBOL, scale=10, dark="#112233", light="#FFEEDD")
+    yield SYMBOL.to_pil(scale=10, dark="#336699").convert("RGBA")
+    yield SYMBOL.to_pil(scale=8).convert("RGB")
+
+
+def paint(overlay, size):
+    image = Image.new("L", size, 0)
+    draw = ImageDraw.Draw(image)
+    for (left, top, right, bottom), piece in overlay:
+        if piece is None:
+            draw.rectangle((left, top, right - 1, bottom - 1), fill=255)
+        else:
+            draw.bitmap((left, top), piece, fill=255)
+    return image
+
+
+def pixels(image):
+    palette = image.getpalette("RGBA") if image.mode == "P" else None
+    return image.mode, image.tobytes(), palette
+
+
+class TestCompose:
+
+    @pytest.mark.parametrize("image", list(symbols()), ids=lambda im: im.mode)
+    @pytest.mark.parametrize("frame_type", ["simple", "rounded"])
+    def test_matches_the_separate_helpers(self, image, frame_type):
+        expected = add_bundled_icon_to_image(image.copy(), "linkedin.png")
+        expected = add_frame_to_image(expected, frame_type)
+        expected = add_text_to_image(expected, "Scan to view VCard")
+
+        decorations = [
+            Icon("linkedin.png", bundled=True),
+            Frame(frame_type),
+            Caption("Scan to view VCard"),
+        ]
+        assert pixels(compose(image.copy(), decorations)) == pixels(expected)
+
+    def test_icon_needs_a_single_conversion(self):
+        image = rasterize_indexed(SYMBOL, scale=10, dark="#112233")
+        decorations = [Icon("logo.png", bundled=True), Frame(), Caption("Scan me")]
+        compose(image.copy(), decorations)  # decode and scale the icon
+        with mock.patch.object(
+            Image.Image, "convert", autospec=True, side_effect=Image.Image.convert
+        ) as convert:
+            result = compose(image, decorations)
+        assert result.mode == "RGBA"
+        assert convert.call_count == 1
+
+    def test_indexed_symbol_is_drawn_in_place(self):
+        image = rasterize_indexed(SYMBOL, scale=10, dark="#112233")
+        result = compose(image, [Frame("rounded"), Caption("Scan me")])
+        assert result is image
+        assert result.mode == "P"
+
+    def test_no_decorations(self):
+        image = rasterize_indexed(SYMBOL)
+        assert compose(image, []) is image
+
+
+class TestCompilePlan:
+
+    def test_every_decoration_is_a_layer(self):
+        decorations = [Frame(), Caption("Scan me", "red"), Frame("rounded")]
+        plan = compile_plan(decorations, (370, 370), "RGBA")
+        assert [color for color, _ in plan.overlays] == ["black", "red", "black"]
+
+    def test_overlays_are_cached(self):
+        layers = LayerCache()
+        with mock.patch(
+            "sage_qrcode.utils.composition.get_layer_cache", return_value=layers
+        ):
+            for _ in range(3):
+                compile_plan([Frame(), Caption("Scan me")], (290, 290), "RGBA")
+            plan = compile_plan([Frame(color="red")], (290, 290), "RGBA")
+        stats = layers.stats()
+        assert (stats["frame"]["misses"], stats["frame"]["hits"]) == (1, 3)
+        assert (stats["caption"]["misses"], stats["caption"]["hits"]) == (1, 2)
+        assert plan.overlays[0][0] == "red"
+
+    def test_overlay_matches_direct_drawing(self):
+        size = (250, 250)
+        expected = Image.new("L", size, 0)
+        ImageDraw.Draw(expected).rectangle([(0, 0), size], outline=255, width=10)
+        ((_, overlay),) = compile_plan([Frame()], size, "RGBA").overlays
+        assert paint(overlay, size).tobytes() == expected.tobytes()
+
+    def test_modes(self):
+        assert compile_plan([Frame()], (10, 10), "RGBA").mode is None
+        assert compile_plan([Frame()], (10, 10), "P", indexed=True).mode is None
+        assert compile_plan([Frame()], (10, 10), "RGB").mode == "RGBA"
+        assert compile_plan([Caption("x")], (10, 10), "RGB").mode is None
+        assert compile_plan([Icon("a.png")], (10, 10), "1", indexed=True).mode == "RGBA"
+
+
+class TestSplitMask:
+
+    def test_frame_becomes_opaque_boxes(self):
+        mask = get_frame_mask("simple", (300, 300))
+        overlay = split_mask(mask)
+        assert all(piece is None for _, piece in overlay)
+        assert len(overlay) == 4
+        assert paint(overlay, mask.size).tobytes() == mask.tobytes()
+
+    def test_antialiased_caption(self):
+        mask = Image.new("L", (300, 300), 0)
+        ImageDraw.Draw(mask).text((20, 250), "Scan to view VCard", fill=255)
+        overlay = split_mask(mask)
+        assert any(piece is not None for _, piece in overlay)
+        assert paint(overlay, mask.size).tobytes() == mask.tobytes()
+
+    def test_empty_mask(self):
+        assert split_mask(Image.new("L", (10, 10), 0)) == ()
+
+
+class TestFrameStyles:
+
+    @pytest.fixture(autouse=True)
+    def restore_styles(self):
+        from sage_qrcode.utils import composition
+
+        styles = dict(composition._frame_styles)
+        yield
+        composition._frame_styles.clear()
+        composition._frame_styles.update(styles)
+        get_frame_mask.cache_clear()
+
+    def test_masks_are_cached_per_style_size_and_width(self):
+        mask = get_frame_mask("rounded", (370, 370))
+        assert get_frame_mask("rounded", (370, 370)) is mask
+        assert get_frame_mask("rounded", (370, 370), 4) is not mask
+        assert get_frame_mask("simple", (370, 370)) is not mask
+
+    def test_register_mask_builder(self):
+        def corners(size, width):
+            mask = Image.new("1", size, 0)
+            draw = ImageDraw.Draw(mask)
+            draw.rectangle((0, 0, width * 3, width * 3), fill=1)
+            draw.rectangle((size[0] - width * 3, size[1] - width * 3) + size, fill=1)
+            return mask
+
+        register_frame_style("corners", corners)
+        assert "corners" in get_frame_styles()
+        image = compose(Image.new("RGBA", (200, 200), "white"), [Frame("corners")])
+        assert image.getpixel((5, 5)) == (0, 0, 0, 255)
+        assert image.getpixel((100, 5)) == (255, 255, 255, 255)
+        assert image.getpixel((195, 195)) == (0, 0, 0, 255)
+
+    def test_register_mask_image(self):
+        template = Image.new("L", (10, 10), 0)
+        template.paste(255, (0, 0, 10, 1))
+        register_frame_style("top", template)
+        image = rasterize_indexed(SYMBOL, scale=10, dark="#112233")
+        result = compose(image, [Frame("top", color="red")])
+        assert result is image
+        assert result.convert("RGB").getpixel((image.width // 2, 0)) == (255, 0, 0)
+
+    def test_unknown_style_is_skipped(self):
+        assert compile_plan([Frame("missing")], (100, 100), "RGBA").overlays == ()
+
+    def test_service_frame_type(self, contact_qr_service):
+        register_frame_style("top", lambda size, width: Image.new("L", size, 255))
+        contact_qr_service.generate_wifi_qr_code(
+            "Office", "secret", frame_type="top", color="#FF0000"
+        )
+        assert contact_qr_service.qr_image.getpixel((0, 0)) == (0, 0, 0, 255)
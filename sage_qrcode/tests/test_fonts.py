@@ -0,0 +1,79 @@
+import pytest
+from django.test import override_settings
+from PIL import Image, ImageDraw, ImageFont
+
+from sage_qrcode.utils import add_text_to_image
+from sage_qrcode.utils.fonts import FontRegistry, get_font_registry, reset_font_registry
+
+
+@pytest.fixture
+def font_file(tmp_path):
+    # Pillow's built-in font is a TrueType font held in memory.
+    default = ImageFont.load_default()
+    if not isinstance(default, ImageFont.FreeTypeFont):
+        pytest.skip("Pillow was built without FreeType support.")
+    path = tmp_path / "caption.ttf"
+    path.write_bytes(default.path.getvalue())
+    return str(path)
+
+
+class TestFontRegistry:
+
+    def test_fonts_are_loaded_once_per_family_and_size(self, font_file):
+        registry = FontRegistry({"caption": font_file})
+        font = registry.get_font("caption", 18)
+        assert registry.get_font("caption", 18) is font
+        assert registry.get_font("caption", 24) is not font
+        assert font.size == 18
+
+    def test_default_family(self):
+        registry = FontRegistry()
+        assert registry.get_font() is registry.get_font("default")
+
+    def test_unknown_family(self):
+        with pytest.raises(ValueError):
+            FontRegistry().get_font("missing", 12)
+
+    def test_text_bbox_matches_imagedraw(self):
+        registry = FontRegistry()
+        font = registry.get_font()
+        for mode in ("1", "P", "RGBA"):
+            draw = ImageDraw.Draw(Image.new(mode, (200, 200)))
+            expected = draw.textbbox((0, 0), "Scan to view VCard", font=font)
+            assert (
+                registry.text_bbox(font, "Scan to view VCard", draw.fontmode)
+                == expected
+            )
+
+    def test_text_bbox_is_memoized(self):
+        registry = FontRegistry()
+        font = registry.get_font()
+        registry.text_bbox(font, "Scan for EPC payment")
+        registry.text_bbox(font, "Scan for EPC payment")
+        assert registry.text_bbox.cache_info().hits == 1
+
+    def test_register_replaces_family(self, font_file):
+        registry = FontRegistry({"caption": font_file})
+        font = registry.get_font("caption", 12)
+        registry.register("caption", font_file)
+        assert registry.get_font("caption", 12) is not font
+
+
+class TestCaptionFontSettings:
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        reset_font_registry()
+        yield
+        reset_font_registry()
+
+    def test_caption_uses_configured_font(self, font_file):
+        with override_settings(
+            SAGE_QRCODE_FONTS={"caption": font_file},
+            SAGE_QRCODE_CAPTION_FONT_FAMILY="caption",
+            SAGE_QRCODE_CAPTION_FONT_SIZE=20,
+        ):
+            registry = get_font_registry()
+            add_text_to_image(Image.new("RGB", (200, 200), "white"), "Caption")
+            assert registry.get_font().size == 20
+            assert registry.text_bbox.cache_info().currsize == 1
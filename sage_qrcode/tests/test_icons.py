@@ -0,0 +1,116 @@
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+from PIL import Image
+
+from sage_qrcode.utils import add_bundled_icon_to_image, add_icon_to_image
+from sage_qrcode.utils.icons import (
+    BUNDLED_ICONS_DIR,
+    IconCache,
+    bundled_icon_names,
+    get_icon_cache,
+    read_bundled_icon,
+    reset_icon_cache,
+)
+
+
+@pytest.fixture
+def icon_path(tmp_path):
+    path = tmp_path / "icon.png"
+    Image.new("RGBA", (32, 32), (0, 0, 255, 255)).save(path)
+    return str(path)
+
+
+class TestIconCache:
+
+    def test_icon_is_decoded_once(self, icon_path):
+        cache = IconCache()
+        with mock.patch(
+            "sage_qrcode.utils.icons.Image.open", wraps=Image.open
+        ) as opened:
+            first = cache.get(icon_path)
+            second = cache.get(icon_path)
+        assert first is second
+        assert first.mode == "RGBA"
+        assert opened.call_count == 1
+
+    def test_scaled_copy_is_a_fraction_of_the_qr_code(self, icon_path):
+        cache = IconCache(ratio=0.25)
+        icon = cache.get_scaled(icon_path, 400)
+        assert icon.size == (100, 100)
+        assert cache.get_scaled(icon_path, 400) is icon
+        assert cache.get_scaled(icon_path, 200).size == (50, 50)
+
+    def test_native_size_without_ratio(self, icon_path):
+        cache = IconCache(ratio=None)
+        assert cache.get_scaled(icon_path, 400) is cache.get(icon_path)
+
+    def test_replaced_file_is_decoded_again(self, icon_path):
+        cache = IconCache()
+        cache.get(icon_path)
+        Image.new("RGBA", (16, 16), "red").save(icon_path)
+        assert cache.get(icon_path).size == (16, 16)
+
+    def test_premultiplied_scaling_keeps_edges_clean(self, tmp_path):
+        path = tmp_path / "edge.png"
+        icon = Image.new("RGBA", (8, 8), (0, 0, 0, 0))
+        icon.paste((255, 255, 255, 255), (0, 0, 4, 8))
+        icon.save(path)
+        scaled = IconCache(ratio=1).get_scaled(str(path), 20)
+        for x in range(20):
+            red, green, blue, alpha = scaled.getpixel((x, 10))
+            if alpha:
+                assert min(red, green, blue) >= 250
+
+    def test_bundled_icons_skip_the_file_check(self):
+        cache = IconCache()
+        cache.preload()
+        with mock.patch("sage_qrcode.utils.icons.os.stat") as stat:
+            cache.get_scaled(str(BUNDLED_ICONS_DIR / "instagram.png"), 370)
+        stat.assert_not_called()
+
+
+class TestAddIconSettings:
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        reset_icon_cache()
+        yield
+        reset_icon_cache()
+
+    def test_icon_ratio_setting(self, icon_path):
+        with override_settings(SAGE_QRCODE_ICON_SIZE_RATIO=0.5):
+            image = add_icon_to_image(Image.new("RGBA", (200, 200), "white"), icon_path)
+            assert get_icon_cache().ratio == 0.5
+        assert image.getpixel((51, 51)) == (0, 0, 255, 255)
+        assert image.getpixel((49, 49)) == (255, 255, 255, 255)
+
+
+class TestBundledIcons:
+
+    def test_bundled_icon_names(self):
+        names = bundled_icon_names()
+        assert "instagram.png" in names
+        assert names == sorted(path.name for path in BUNDLED_ICONS_DIR.glob("*.png"))
+
+    def test_read_bundled_icon(self):
+        assert (
+            read_bundled_icon("youtube.png")
+            == (BUNDLED_ICONS_DIR / "youtube.png").read_bytes()
+        )
+
+    def test_read_missing_icon(self):
+        with pytest.raises(FileNotFoundError):
+            read_bundled_icon("missing.png")
+
+    def test_bundled_icon_ignores_working_directory(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        cache = IconCache()
+        assert cache.get_bundled("linkedin.png") is cache.get(
+            str(BUNDLED_ICONS_DIR / "linkedin.png")
+        )
+        image = add_bundled_icon_to_image(
+            Image.new("RGBA", (200, 200), "white"), "linkedin.png"
+        )
+        assert image.getpixel((100, 100)) != (255, 255, 255, 255)
@@ -0,0 +1,91 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Modules that must only be imported on the first render. NumPy is left out:
+# Pillow's typing helpers import it whenever colorfield loads ``PIL.Image``.
+LAZY_MODULES = (
+    "segno",
+    "PIL.ImageDraw",
+    "PIL.ImageFont",
+    "barcode",
+    "barcode.writer",
+    "pyshorteners",
+    "sage_qrcode.service.base",
+    "sage_qrcode.utils.qrcode",
+)
+
+# Extra import time ``django.setup()`` may spend because sage_qrcode is
+# installed, measured with ``python -X importtime``.
+IMPORT_BUDGET_MS = float(os.environ.get("SAGE_QRCODE_IMPORT_BUDGET_MS", 250))
+
+SETUP_SCRIPT = """
+import django
+from django.conf import settings
+
+apps = ["django.contrib.contenttypes", "django.contrib.auth",
+        "django.contrib.admin", "polymorphic", "colorfield"]
+if {installed!r}:
+    apps.append("sage_qrcode")
+settings.configure(
+    INSTALLED_APPS=apps,
+    DATABASES={{"default": {{"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}}}},
+    USE_TZ=True,
+)
+django.setup()
+"""
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def import_times(installed: bool) -> dict:
+    """Runs ``django.setup()`` in a fresh interpreter and parses -X importtime.
+
+    Returns:
+        dict: The self import time in microseconds of every imported module.
+    """
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            SETUP_SCRIPT.format(installed=installed),
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(self_time)
+    return times
+
+
+@pytest.fixture(scope="module")
+def installed_times():
+    return import_times(installed=True)
+
+
+class TestImportTime:
+    def test_app_is_loaded(self, installed_times):
+        assert "sage_qrcode.admin.base" in installed_times
+
+    def test_heavy_modules_are_imported_lazily(self, installed_times):
+        assert [name for name in LAZY_MODULES if name in installed_times] == []
+
+    def test_import_cost_of_app_is_within_budget(self, installed_times):
+        baseline = import_times(installed=False)
+        extra = sum(
+            self_time
+            for name, self_time in installed_times.items()
+            if name not in baseline
+        )
+        assert extra / 1000 < IMPORT_BUDGET_MS
@@ -0,0 +1,86 @@
+import pytest
+from django.test import override_settings
+from PIL import Image
+
+from sage_qrcode.service import ContactQRCode, QRCodeBase
+from sage_qrcode.utils import Caption, Frame, compose
+from sage_qrcode.utils.layers import LayerCache, get_layer_cache, reset_layer_cache
+
+PAYLOAD = "https://example.com/layers"
+
+
+def misses():
+    return {
+        layer: stats["misses"] for layer, stats in get_layer_cache().stats().items()
+    }
+
+
+class TestLayerCache:
+
+    def test_stats_report_hit_rate(self):
+        cache = LayerCache()
+        for _ in range(3):
+            cache.get_or_create("frame", "key", lambda: (), lambda overlay: 1)
+        stats = cache.stats()
+        assert stats["frame"]["hit_rate"] == pytest.approx(2 / 3)
+        assert stats["caption"]["hit_rate"] == 0.0
+
+    def test_clear_one_layer(self):
+        cache = LayerCache()
+        cache.get_or_create("frame", "key", lambda: (), lambda overlay: 1)
+        cache.get_or_create("caption", "key", lambda: (), lambda overlay: 1)
+        cache.clear("frame")
+        assert cache.stats()["frame"]["size"] == 0
+        assert cache.stats()["caption"]["size"] == 1
+
+    def test_unknown_layer(self):
+        with pytest.raises(ValueError):
+            LayerCache().get_or_create("shadow", "key", lambda: None)
+
+
+class TestLayeredRendering:
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        reset_layer_cache()
+        yield
+        reset_layer_cache()
+
+    def test_new_caption_renders_only_the_caption_layer(self):
+        image = Image.new("RGBA", (290, 290), "white")
+        compose(image.copy(), [Frame("rounded"), Caption("Scan me")])
+        before = misses()
+        compose(image.copy(), [Frame("rounded"), Caption("Scan me now", "red")])
+        after = misses()
+        assert after["frame"] == before["frame"]
+        assert after["caption"] == before["caption"] + 1
+
+    def test_new_frame_reuses_base_and_caption(self):
+        service = ContactQRCode()
+        service.generate_wifi_qr_code("Office", "secret", frame_type="simple")
+        before = misses()
+        service.generate_wifi_qr_code("Office", "secret", frame_type="rounded")
+        after = misses()
+        assert after["base"] == before["base"]
+        assert after["caption"] == before["caption"]
+        assert after["frame"] == before["frame"] + 1
+
+    def test_base_layer_is_not_shared(self):
+        service = QRCodeBase()
+        service.generate_qr_code(PAYLOAD, scale=3)
+        expected = service.qr_image.tobytes()
+        service.qr_image.paste((255, 0, 0, 255), (0, 0, 20, 20))
+        service.generate_qr_code(PAYLOAD, scale=3)
+        assert get_layer_cache().stats()["base"]["hits"] == 1
+        assert service.qr_image.tobytes() == expected
+
+    def test_disabled(self):
+        with override_settings(SAGE_QRCODE_LAYER_CACHE_SIZE=0):
+            reset_layer_cache()
+            service = ContactQRCode()
+            service.generate_wifi_qr_code("Office", "secret", frame_type="simple")
+            uncached = service.qr_image
+            assert get_layer_cache().stats()["base"]["size"] == 0
+        reset_layer_cache()
+        service.generate_wifi_qr_code("Office", "secret", frame_type="simple")
+        assert service.qr_image.tobytes() == uncached.tobytes()
@@ -0,0 +1,133 @@
+import pytest
+from django.core.exceptions import ValidationError
+from django.test import override_settings
+from PIL import Image
+
+from sage_qrcode.service import SocialMediaQRCode
+from sage_qrcode.utils import Icon
+from sage_qrcode.utils.platforms import (
+    Platform,
+    PlatformRegistry,
+    build_platform_registry,
+    get_hostname,
+    get_platform_registry,
+    reset_platform_registry,
+)
+
+
+def validate_example(url):
+    if not url.startswith("https://"):
+        raise ValidationError("Enter a secure URL.")
+
+
+class TestPlatformRegistry:
+
+    @pytest.mark.parametrize(
+        "url, name",
+        [
+            ("https://www.instagram.com/username", "instagram"),
+            ("https://t.me/username", "telegram"),
+            ("HTTPS://WWW.LinkedIn.com/in/username", "linkedin"),
+            ("facebook.com/username", "facebook"),
+            ("https://m.facebook.com./username", "facebook"),
+            ("https://twitter.com/username", "x"),
+        ],
+    )
+    def test_resolve(self, url, name):
+        assert PlatformRegistry().resolve(url).name == name
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://start.me/username",
+            "https://example.com/t.me/username",
+            "https://instagram.com.example.com/username",
+            "https://notinstagram.com/username",
+            "not a url",
+            "",
+        ],
+    )
+    def test_unknown_hosts(self, url):
+        assert PlatformRegistry().resolve(url) is None
+
+    def test_most_specific_host_wins(self):
+        registry = PlatformRegistry(
+            [
+                Platform("blogs", ("blogs.example.com",), "social.png"),
+                Platform("example", ("example.com",), "logo.png"),
+            ]
+        )
+        assert registry.resolve("https://a.blogs.example.com").name == "blogs"
+        assert registry.resolve("https://www.example.com").name == "example"
+
+    def test_register_replaces_platform(self):
+        registry = PlatformRegistry()
+        registry.register(Platform("x", ("x.com",), "witter.png"))
+        assert registry.resolve("https://x.com/username").name == "x"
+        assert registry.resolve("https://twitter.com/username") is None
+
+    def test_validator(self):
+        platform = PlatformRegistry().resolve("https://instagram.com/username")
+        platform.validate("https://instagram.com/username")
+        with pytest.raises(ValidationError):
+            platform.validate("https://instagram.com/")
+
+    def test_get_hostname(self):
+        assert get_hostname(" https://User@Example.COM:8080/path ") == "example.com"
+        assert get_hostname("https://[::1/") == ""
+
+
+class TestPlatformSettings:
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        reset_platform_registry()
+        yield
+        reset_platform_registry()
+
+    def test_configured_platform(self):
+        config = {
+            "mastodon": {
+                "HOSTS": ["mastodon.social", "fosstodon.org"],
+                "ICON": "social.png",
+                "VALIDATOR": "sage_qrcode.tests.test_platforms.validate_example",
+                "MODEL": "sage_qrcode.MediaUrl",
+            },
+            "skype": None,
+        }
+        with override_settings(SAGE_QRCODE_PLATFORMS=config):
+            registry = get_platform_registry()
+        platform = registry.resolve("https://fosstodon.org/@user")
+        assert platform.name == "mastodon"
+        assert platform.validator is validate_example
+        assert platform.model == "sage_qrcode.MediaUrl"
+        assert registry.resolve("https://skype.com/username") is None
+
+    def test_missing_icon(self):
+        with pytest.raises(ValueError):
+            build_platform_registry({"mastodon": {"HOSTS": ["mastodon.social"]}})
+
+
+class TestSocialMediaIcon:
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        reset_platform_registry()
+        yield
+        reset_platform_registry()
+
+    def test_lookalike_host_is_rejected(self):
+        with pytest.raises(ValueError, match="Invalid social media link"):
+            SocialMediaQRCode().create_social_media_url("https://start.me/username")
+
+    def test_icon_file_of_configured_platform(self, tmp_path):
+        icon_path = tmp_path / "mastodon.png"
+        Image.new("RGBA", (32, 32), "purple").save(icon_path)
+        config = {"mastodon": {"HOSTS": "mastodon.social", "ICON": str(icon_path)}}
+        service = SocialMediaQRCode()
+        with override_settings(SAGE_QRCODE_PLATFORMS=config):
+            icon = service.get_social_media_icon("https://mastodon.social/@user")
+            service.create_social_media_url("https://mastodon.social/@user")
+        assert icon == Icon(str(icon_path))
+        center = service.qr_image.width // 2
+        assert service.qr_image.getpixel((center, center)) == (128, 0, 128, 255)
@@ -0,0 +1,64 @@
+import io
+
+import pytest
+from django.test import override_settings
+from PIL import Image
+
+from sage_qrcode.service import QRCodeBase
+from sage_qrcode.service.png import set_png_dpi
+from sage_qrcode.utils import encode_image
+from sage_qrcode.utils.renditions import (
+    Rendition,
+    get_renditions,
+    rendition_from_setting,
+)
+
+RENDITIONS = {
+    "thumbnail": {"SIZE": 2},
+    "print": {"SIZE": 40, "DPI": 300, "PATH": "print/"},
+    "vector": {"FORMAT": "SVG"},
+}
+
+
+class TestRenditionSettings:
+
+    def test_renditions_read_from_settings(self):
+        with override_settings(SAGE_QRCODE_RENDITIONS=RENDITIONS):
+            renditions = get_renditions()
+        assert list(renditions) == ["thumbnail", "print", "vector"]
+        assert renditions["thumbnail"] == Rendition(
+            "thumbnail", 2, None, None, "qr_codes/renditions/thumbnail"
+        )
+        assert renditions["print"].path == "print"
+        assert renditions["vector"].extension == "svg"
+
+    def test_no_renditions_by_default(self):
+        assert get_renditions() == {}
+
+    def test_dpi_requires_png(self):
+        with pytest.raises(ValueError):
+            rendition_from_setting("vector", {"FORMAT": "svg", "DPI": 300})
+
+
+class TestSetPngDpi:
+
+    def test_records_resolution(self):
+        service = QRCodeBase()
+        service.generate_qr_code("https://example.com/print", scale=2)
+        content = encode_image(service.qr_image, "PNG")
+        printed = Image.open(io.BytesIO(set_png_dpi(content, 300)))
+        assert printed.info["dpi"] == pytest.approx((300, 300), abs=0.1)
+        assert printed.tobytes() == service.qr_image.tobytes()
+
+    def test_replaces_existing_resolution(self):
+        buffer = io.BytesIO()
+        Image.new("1", (4, 4)).save(buffer, format="PNG", dpi=(72, 72))
+        content = set_png_dpi(set_png_dpi(buffer.getvalue(), 600), 300)
+        assert content.count(b"pHYs") == 1
+        assert Image.open(io.BytesIO(content)).info["dpi"][0] == pytest.approx(
+            300, abs=0.1
+        )
+
+    def test_rejects_other_formats(self):
+        with pytest.raises(ValueError):
+            set_png_dpi(b"<svg/>", 300)
@@ -1,3 +1,54 @@
-from .qrcode import add_frame_to_image, add_icon_to_image, add_text_to_image
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["add_frame_to_image", "add_icon_to_image", "add_text_to_image"]
+if TYPE_CHECKING:
+    from .composition import Caption, Frame, Icon, compose
+    from .qrcode import (
+        add_bundled_icon_to_image,
+        add_frame_to_image,
+        add_icon_to_image,
+        add_text_to_image,
+        encode_image,
+        load_icon,
+    )
+
+# The image helpers import Pillow's drawing and font modules, so they are
+# loaded on first use rather than with ``sage_qrcode.utils.admin``.
+_LAZY_ATTRIBUTES = {
+    "Caption": ".composition",
+    "Frame": ".composition",
+    "Icon": ".composition",
+    "compose": ".composition",
+    "add_bundled_icon_to_image": ".qrcode",
+    "add_frame_to_image": ".qrcode",
+    "add_icon_to_image": ".qrcode",
+    "add_text_to_image": ".qrcode",
+    "encode_image": ".qrcode",
+    "load_icon": ".qrcode",
+}
+
+__all__ = [
+    "Caption",
+    "Frame",
+    "Icon",
+    "compose",
+    "add_bundled_icon_to_image",
+    "add_frame_to_image",
+    "add_icon_to_image",
+    "add_text_to_image",
+    "encode_image",
+    "load_icon",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
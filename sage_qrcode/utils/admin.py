@@ -1,19 +1,54 @@
 import io
+import logging
+import mimetypes
+import os
 import time
 import zipfile
-from django.core.files.base import ContentFile
+from collections import deque
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from django.apps import apps
+from django.core.files.base import ContentFile, File
+from django.db.models.fields.files import FieldFile
 from django.http import HttpResponse
 from django.contrib import messages
 
-from sage_qrcode.service import (
-    ContactQRCode,
-    SocialMediaQRCode,
-    PaymentQRCode,
-    QRCodeBase,
-    BarcodeProxy,
+from sage_qrcode.conf import get_setting
+from sage_qrcode.helpers.validators import validate_size
+from sage_qrcode.service.admission import (
+    RenderAdmitted,
+    RenderLimitExceeded,
+    check_only,
+    get_admission_control,
+    unrestricted,
 )
+from sage_qrcode.service.render_cache import get_render_cache, stream_digest
+from sage_qrcode.utils.platforms import get_platform_registry
+from sage_qrcode.utils.renditions import get_renditions
+
+# The services pull in segno, Pillow and python-barcode, so they are imported
+# inside the functions below and admin autodiscovery stays cheap.
+if TYPE_CHECKING:
+    from PIL import Image
+
+    from sage_qrcode.service import BarcodeProxy, QRCodeBase
+    from sage_qrcode.service.renderer import RenderSpec
 
 from sage_qrcode.models import (
+    QRCode,
     VCardQRCode,
     WifiQRCode,
     TikTokQRCode,
@@ -32,129 +67,745 @@ from sage_qrcode.models import (
     BarcodeUrl,
 )
 
+logger = logging.getLogger(__name__)
 
-def generate_qr_code(obj: QRCodeBase) -> bytes:
-    """Generates a QR code image based on the type of object passed.
+
+def get_output_format(output_format: Optional[str] = None) -> str:
+    """Returns the requested output format or the configured default.
 
     Args:
-        obj (QRCodeBase): An instance of a subclass of QRCodeBase containing data to generate a QR code.
+        output_format (str, optional): 'png', 'svg', 'pdf' or 'eps'.
 
     Returns:
-        bytes: The generated QR code image in bytes.
+        str: The lower-cased output format, ``SAGE_QRCODE_OUTPUT_FORMAT`` or 'png'.
+    """
+    return (output_format or get_setting("OUTPUT_FORMAT", "png")).lower()
+
+
+# Fields that never change the rendered image; ``custom_gif`` and
+# ``fill_image`` enter the render spec as content digests instead.
+RENDER_SPEC_EXCLUDED_FIELDS = (
+    "id",
+    "qrcode_ptr_id",
+    "polymorphic_ctype_id",
+    "qr_code_image",
+    "custom_gif",
+    "fill_image",
+    "title",
+    "created",
+    "modified",
+)
+
+
+def apply_style_defaults(obj: "QRCodeBase") -> None:
+    """Fills in the default size and colors of a QR code object.
 
+    Args:
+        obj (QRCodeBase): An instance of a subclass of QRCodeBase.
     """
-    proxy = QRCodeBase()
-    custom_gif_path = obj.custom_gif_path if obj.custom_gif else None
     obj.size = obj.size or 10
     if not obj.second_color:
         obj.second_color = "#FFFFFF"
     if not obj.third_color:
         obj.third_color = "#000000"
 
-    media_classes = (
-        TikTokQRCode,
-        TelegramQRCode,
-        InstagramQRCode,
-        SnapchatQRCode,
-        SkypeQRCode,
-        WhatsAppQRCode,
-        FacebookQRCode,
-        LinkedInQRCode,
-        XQRCode,
+
+def get_stored_path(field_file: FieldFile) -> Optional[str]:
+    """Returns the local path of a file committed to its storage.
+
+    Args:
+        field_file (FieldFile): The file of an image field.
+
+    Returns:
+        Optional[str]: The path, or None for empty fields, uploads not yet
+        written to the storage and storages without local paths.
+    """
+    if not field_file or not field_file._committed:
+        return None
+    try:
+        return field_file.path
+    except NotImplementedError:
+        logger.warning("%s is not stored in a local file.", field_file.name)
+        return None
+
+
+def get_custom_gif_path(obj: "QRCodeBase") -> Optional[str]:
+    """Returns the local path of the custom GIF of a QR code object.
+
+    The admin forms copy a new upload to ``custom_gif_path`` before the
+    object is saved; otherwise the committed ``custom_gif`` file is used.
+
+    Args:
+        obj (QRCodeBase): An instance of a subclass of QRCodeBase.
+
+    Returns:
+        Optional[str]: The path, or None if there is no readable GIF.
+    """
+    return getattr(obj, "custom_gif_path", None) or get_stored_path(obj.custom_gif)
+
+
+def field_file_digest(field_file: FieldFile) -> Optional[str]:
+    """Returns the SHA-256 hex digest of the content of an image field.
+
+    The content is read through ``open``, so new uploads and files in
+    storages without local paths are hashed alike.
+
+    Args:
+        field_file (FieldFile): The file of an image field.
+
+    Returns:
+        Optional[str]: The hex digest, or None for empty fields.
+    """
+    if not field_file:
+        return None
+    committed = field_file._committed
+    field_file.open("rb")
+    try:
+        return stream_digest(field_file)
+    finally:
+        if committed:
+            field_file.close()
+        else:
+            field_file.seek(0)
+
+
+def get_render_spec(
+    obj: "QRCodeBase", output_format: Optional[str] = None, size: Optional[int] = None
+) -> Dict[str, Any]:
+    """Describes everything that determines the rendered QR code of an object.
+
+    The model fixes the frame, caption and icon, while its concrete fields
+    carry the payload, size and colors.
+
+    Args:
+        obj (QRCodeBase): An instance of a subclass of QRCodeBase.
+        output_format (str, optional): 'png', 'svg', 'pdf' or 'eps'.
+        size (int, optional): A size replacing the object's own.
+
+    Returns:
+        dict: The render spec used as the render cache key.
+    """
+    apply_style_defaults(obj)
+    fields = {
+        field.attname: field.value_from_object(obj)
+        for field in obj._meta.concrete_fields
+        if field.attname not in RENDER_SPEC_EXCLUDED_FIELDS
+    }
+    if size is not None:
+        fields["size"] = size
+    return {
+        "model": obj._meta.label,
+        "fields": fields,
+        "custom_digest": field_file_digest(obj.custom_gif),
+        "fill_image_digest": field_file_digest(obj.fill_image),
+        "format": get_output_format(output_format),
+        "image_mode": get_setting("IMAGE_MODE", "RGBA"),
+        "error_level": get_setting("ERROR_LEVEL", "h"),
+        "error_margin": get_setting("ERROR_SAFETY_MARGIN"),
+    }
+
+
+def render_qr_code(
+    obj: "QRCodeBase", output_format: Optional[str] = None, size: Optional[int] = None
+) -> Union[bytes, IO[bytes]]:
+    """Returns the encoded QR code file of an object.
+
+    When ``SAGE_QRCODE_RENDER_CACHE`` is configured, identical payload and
+    style combinations are rendered once and then served from the cache.
+    Without it, PNGs streamed by ``stream_png`` are returned as the
+    temporary file they were written to.
+
+    Args:
+        obj (QRCodeBase): An instance of a subclass of QRCodeBase.
+        output_format (str, optional): 'png', 'svg', 'pdf' or 'eps'. Defaults
+            to the ``SAGE_QRCODE_OUTPUT_FORMAT`` setting.
+        size (int, optional): Renders at this size instead of the object's
+            own, e.g. to serve several sizes of one code.
+
+    Returns:
+        Union[bytes, IO[bytes]]: The encoded PNG image or vector document,
+        or the temporary file of a streamed PNG.
+
+    Raises:
+        ValidationError: If the size is out of range.
+    """
+    from sage_qrcode.utils.qrcode import encode_image
+
+    output_format = get_output_format(output_format)
+    if size is not None:
+        validate_size(size)
+
+    def render() -> Union[bytes, IO[bytes]]:
+        qr_image = generate_qr_code(obj, output_format, size)
+        if isinstance(qr_image, bytes) or hasattr(qr_image, "read"):
+            return qr_image
+        return encode_image(qr_image, "PNG")
+
+    render_cache = get_render_cache()
+    if render_cache is None:
+        return render()
+    return render_cache.get_or_render(
+        get_render_spec(obj, output_format, size),
+        lambda: read_content(render()),
     )
 
+
+def read_content(content: Union[bytes, IO[bytes]]) -> bytes:
+    """Returns the bytes of an encoded file, closing temporary files.
+
+    Args:
+        content (Union[bytes, IO[bytes]]): Encoded bytes, or an open file.
+
+    Returns:
+        bytes: The encoded file.
+    """
+    if isinstance(content, bytes):
+        return content
+    with content:
+        return content.read()
+
+
+def render_qr_code_sizes(
+    obj: "QRCodeBase", sizes: Iterable[int], output_format: Optional[str] = None
+) -> Dict[int, Union[bytes, IO[bytes]]]:
+    """Returns the encoded QR code file of an object at several sizes.
+
+    The symbol is encoded and rasterized once at one pixel per module; every
+    size is derived from that template by nearest-neighbour enlargement.
+
+    Args:
+        obj (QRCodeBase): An instance of a subclass of QRCodeBase.
+        sizes (Iterable[int]): The sizes to render.
+        output_format (str, optional): 'png', 'svg', 'pdf' or 'eps'.
+
+    Returns:
+        dict: The encoded file for each size.
+
+    Raises:
+        ValidationError: If a size is out of range.
+    """
+    return {size: render_qr_code(obj, output_format, size) for size in sizes}
+
+
+def render_qr_code_renditions(
+    obj: "QRCodeBase",
+) -> Dict[str, Union[bytes, IO[bytes]]]:
+    """Returns the encoded files of the ``SAGE_QRCODE_RENDITIONS`` of an object.
+
+    The payload is encoded once for all renditions, and PNG renditions with
+    a ``DPI`` have the resolution recorded without re-encoding.
+
+    Args:
+        obj (QRCodeBase): An instance of a subclass of QRCodeBase.
+
+    Returns:
+        dict: The encoded file for each rendition alias.
+
+    Raises:
+        ValidationError: If a rendition size is out of range.
+    """
+    from sage_qrcode.service.encoding import shared_encoding
+    from sage_qrcode.service.png import set_png_dpi
+
+    contents = {}
+    with shared_encoding():
+        for alias, rendition in get_renditions().items():
+            content = render_qr_code(obj, rendition.extension, rendition.size)
+            if rendition.dpi and rendition.extension == "png":
+                content = set_png_dpi(read_content(content), rendition.dpi)
+            contents[alias] = content
+    return contents
+
+
+def render_qr_code_files(
+    obj: "QRCodeBase",
+) -> Tuple[Union[bytes, IO[bytes]], Dict[str, Union[bytes, IO[bytes]]]]:
+    """Returns the QR code file of an object together with its renditions.
+
+    Args:
+        obj (QRCodeBase): An instance of a subclass of QRCodeBase.
+
+    Returns:
+        tuple: The encoded ``qr_code_image`` file and the rendition files,
+        all rendered from a single encoded symbol.
+    """
+    from sage_qrcode.service.encoding import shared_encoding
+
+    with shared_encoding():
+        return render_qr_code(obj), render_qr_code_renditions(obj)
+
+
+MEDIA_CLASSES = (
+    TikTokQRCode,
+    TelegramQRCode,
+    InstagramQRCode,
+    SnapchatQRCode,
+    SkypeQRCode,
+    WhatsAppQRCode,
+    FacebookQRCode,
+    LinkedInQRCode,
+    XQRCode,
+)
+
+
+def get_fill(obj: "QRCodeBase") -> Optional[Dict[str, Any]]:
+    """Describes the fill of a QR code object as a render option.
+
+    Args:
+        obj (QRCodeBase): An instance of a subclass of QRCodeBase.
+
+    Returns:
+        Optional[dict]: The fill options, or None for solid fills and fills
+        missing their gradient color or a committed image, which is sampled
+        from its stored file.
+    """
+    if obj.fill_type in ("linear", "radial") and obj.gradient_color:
+        return {
+            "type": obj.fill_type,
+            "colors": [obj.color or "#000000", obj.gradient_color],
+            "angle": obj.gradient_angle,
+        }
+    if obj.fill_type == "image":
+        path = get_stored_path(obj.fill_image)
+        if path:
+            return {"type": "image", "image": path}
+    return None
+
+
+def get_model_for_url(url: str) -> Optional[Type[QRCode]]:
+    """Returns the QR code model for a pasted social media URL.
+
+    Args:
+        url (str): A profile URL, with or without a scheme.
+
+    Returns:
+        Optional[Type[QRCode]]: The model of the platform the URL belongs to,
+        or None for unknown hosts and platforms without a model.
+    """
+    platform = get_platform_registry().resolve(url)
+    if platform is None:
+        return None
+    return platform.get_model()
+
+
+def get_qr_code_spec(
+    obj: "QRCodeBase", output_format: Optional[str] = None, size: Optional[int] = None
+) -> Optional["RenderSpec"]:
+    """Describes the QR code of an object as a render spec.
+
+    Args:
+        obj (QRCodeBase): An instance of a subclass of QRCodeBase.
+        output_format (str, optional): 'png', 'svg', 'pdf' or 'eps'. Defaults
+            to the ``SAGE_QRCODE_OUTPUT_FORMAT`` setting.
+        size (int, optional): A size replacing the object's own.
+
+    Returns:
+        Optional[RenderSpec]: The spec, or None for unsupported objects.
+    """
+    from sage_qrcode.service.renderer import RenderSpec
+
+    output_format = get_output_format(output_format)
+    custom_gif_path = get_custom_gif_path(obj)
+    apply_style_defaults(obj)
+    style = {
+        "color": obj.color,
+        "size": size or obj.size,
+        "color2": obj.second_color,
+        "color3": obj.third_color,
+    }
+    fill = get_fill(obj)
+    if fill is not None:
+        style["fill"] = fill
+
     if isinstance(obj, VCardQRCode):
-        contact_proxy = ContactQRCode()
-        contact_proxy.generate_vcard_qr_code(
-            name=obj.full_name,
-            displayname=obj.display_name,
-            email=obj.email,
-            phone=obj.phone,
-            url=obj.url,
-            address=obj.address,
-            org=obj.org,
-            custom=custom_gif_path,
-            color=obj.color,
-            size=obj.size,
-            color2=obj.second_color,
-            color3=obj.third_color,
-        )
-        proxy.qr_image = contact_proxy.qr_image
+        kind, options = "vcard", {
+            "name": obj.full_name,
+            "displayname": obj.display_name,
+            "email": obj.email,
+            "phone": obj.phone,
+            "url": obj.url,
+            "address": obj.address,
+            "org": obj.org,
+            "custom": custom_gif_path,
+            **style,
+        }
     elif isinstance(obj, WifiQRCode):
-        contact_proxy = ContactQRCode()
-        contact_proxy.generate_wifi_qr_code(
-            ssid=obj.ssid,
-            password=obj.password,
-            security_type=obj.security,
-            custom=custom_gif_path,
-            color=obj.color,
-            color2=obj.second_color,
-            color3=obj.third_color,
-            size=obj.size,
-        )
-        proxy.qr_image = contact_proxy.qr_image
-    elif isinstance(obj, media_classes):
-        social_proxy = SocialMediaQRCode()
-        social_proxy.create_social_media_url(
-            url=obj.url,
-            color=obj.color,
-            size=obj.size,
-            color2=obj.second_color,
-            color3=obj.third_color,
-        )
-        proxy.qr_image = social_proxy.qr_image
+        kind, options = "wifi", {
+            "ssid": obj.ssid,
+            "password": obj.password,
+            "security_type": obj.security,
+            "custom": custom_gif_path,
+            **style,
+        }
+    elif isinstance(obj, MEDIA_CLASSES):
+        kind, options = "social_media", {"url": obj.url, **style}
     elif isinstance(obj, MediaUrl):
-        social_proxy = SocialMediaQRCode()
-        social_proxy.create_url(
-            playlist_url=obj.url,
-            custom=custom_gif_path,
-            color=obj.color,
-            size=obj.size,
-            color2=obj.second_color,
-            color3=obj.third_color,
-        )
-        proxy.qr_image = social_proxy.qr_image
+        kind, options = "url", {
+            "playlist_url": obj.url,
+            "custom": custom_gif_path,
+            **style,
+        }
     elif isinstance(obj, EPCQRCode):
-        payment_proxy = PaymentQRCode()
-        payment_proxy.generate_epc_qr_code(
-            name=obj.name,
-            iban=obj.iban,
-            color=obj.color,
-            size=obj.size,
-            amount=obj.amount,
-            text=obj.text,
-            custom=custom_gif_path,
-            color2=obj.second_color,
-            color3=obj.third_color,
-        )
-        proxy.qr_image = payment_proxy.qr_image
+        kind, options = "epc", {
+            "name": obj.name,
+            "iban": obj.iban,
+            "amount": obj.amount,
+            "text": obj.text,
+            "custom": custom_gif_path,
+            **style,
+        }
     elif isinstance(obj, BitcoinQRCode):
-        payment_proxy = PaymentQRCode()
-        payment_proxy.generate_bitcoin_qr_code(
-            address=obj.bitcoin_address,
-            amount=obj.amount,
-            label=obj.label,
-            message=obj.message,
-            color2=obj.second_color,
-            color3=obj.third_color,
-        )
-        proxy.qr_image = payment_proxy.qr_image
+        kind, options = "bitcoin", {
+            "address": obj.bitcoin_address,
+            "amount": obj.amount,
+            "label": obj.label,
+            "message": obj.message,
+            "color2": obj.second_color,
+            "color3": obj.third_color,
+        }
+        if fill is not None:
+            options["fill"] = fill
+        if size is not None:
+            options["scale"] = size
+    else:
+        return None
+    return RenderSpec(kind, options, output_format)
+
+
+def generate_qr_code(
+    obj: "QRCodeBase", output_format: Optional[str] = None, size: Optional[int] = None
+) -> Union[bytes, IO[bytes], "Image.Image"]:
+    """Generates a QR code image based on the type of object passed.
+
+    Args:
+        obj (QRCodeBase): An instance of a subclass of QRCodeBase containing data to generate a QR code.
+        output_format (str, optional): 'png', or 'svg', 'pdf' or 'eps' to skip
+            rasterization. Defaults to the ``SAGE_QRCODE_OUTPUT_FORMAT`` setting.
+        size (int, optional): A size replacing the object's own.
+
+    Returns:
+        Union[bytes, IO[bytes], Image.Image]: The generated QR code image,
+        vector document, or temporary file of a streamed PNG.
+
+    """
+    from sage_qrcode.service import QRCodeBase, get_renderer
+
+    spec = get_qr_code_spec(obj, output_format, size)
+    if spec is None:
+        return QRCodeBase().show_qr_code(save=False)
+
+    service_class, method_name = get_renderer().kinds[spec.kind]
+    proxy = service_class()
+    getattr(proxy, method_name)(**spec.options, output_format=spec.image_format)
     return proxy.show_qr_code(save=False)
 
 
-def save_qr_code_image(obj: QRCodeBase, qr_image: bytes) -> None:
+def check_render_limits(obj: "QRCodeBase") -> None:
+    """Checks the QR code of an object against ``SAGE_QRCODE_RENDER_LIMITS``.
+
+    The code and each rendition are rendered only up to admission, before
+    anything is encoded, so forms can reject them before the object is
+    saved. Custom and fill images not yet written to the storage are taken
+    from the upload.
+
+    Args:
+        obj (QRCodeBase): An instance of a subclass of QRCodeBase.
+
+    Raises:
+        RenderLimitExceeded: If a render would be rejected or queued.
+    """
+    from sage_qrcode.service import get_renderer
+
+    sizes = [(None, None)] + [
+        (rendition.extension, rendition.size) for rendition in get_renditions().values()
+    ]
+    upload = None
+    if obj.custom_gif and not obj.custom_gif._committed:
+        upload = obj.custom_gif
+    for output_format, size in sizes:
+        spec = get_qr_code_spec(obj, output_format, size)
+        if spec is None:
+            return
+        options = dict(spec.options)
+        if upload is not None and "custom" in options:
+            upload.seek(0)
+            options["custom"] = upload.file
+        if obj.fill_type == "image" and obj.fill_image and "fill" not in options:
+            # Fills are sampled after admission; the name only marks the fill.
+            options["fill"] = {"type": "image", "image": obj.fill_image.name}
+        service_class, method_name = get_renderer().kinds[spec.kind]
+        try:
+            with check_only():
+                getattr(service_class(), method_name)(
+                    **options, output_format=spec.image_format
+                )
+        except RenderAdmitted:
+            pass
+        finally:
+            if upload is not None:
+                upload.seek(0)
+
+
+def _generate_files(
+    objs: Iterable["QRCodeBase"],
+    files: Sequence[Tuple[Optional[str], Optional[str], Optional[int]]],
+    max_workers: Optional[int],
+    chunksize: Optional[int],
+    ordered: bool,
+) -> Iterator[Tuple["QRCodeBase", Dict[Optional[str], bytes]]]:
+    """Renders several files of many objects in one bulk render run.
+
+    Files found in the render cache are taken from it in this process and
+    never reach the pool; rendered files are stored in it under the same
+    keys as ``render_qr_code`` uses.
+
+    Args:
+        objs (Iterable[QRCodeBase]): Instances of subclasses of QRCodeBase.
+        files (Sequence[tuple]): The name, output format and size of each file
+            to render per object.
+        max_workers (int, optional): Number of worker processes.
+        chunksize (int, optional): Files sent to a worker at a time.
+        ordered (bool): Yield objects in input order.
+
+    Yields:
+        tuple: Each object and its encoded files by name, once all of them
+        are ready. Unsupported objects are skipped.
+    """
+    from sage_qrcode.service.bulk import BulkRenderer
+
+    render_cache = get_render_cache()
+    # Each pending entry holds the object, its files and the number missing.
+    pending: Deque[list] = deque()
+    specs, targets = [], []
+    for obj in objs:
+        if type(obj) is QRCode:
+            obj = obj.get_real_instance()
+        entry = [obj, {}, 0]
+        for name, output_format, size in files:
+            spec = get_qr_code_spec(obj, output_format, size)
+            if spec is None:
+                break
+            cache_spec = None
+            if render_cache is not None:
+                cache_spec = get_render_spec(obj, output_format, size)
+                content = render_cache.get(cache_spec)
+                if content is not None:
+                    entry[1][name] = content
+                    continue
+            specs.append(spec)
+            targets.append((entry, name, cache_spec))
+            entry[2] += 1
+        else:
+            if ordered:
+                pending.append(entry)
+            elif not entry[2]:
+                yield entry[0], entry[1]
+
+    def completed() -> Iterator[Tuple["QRCodeBase", Dict[Optional[str], bytes]]]:
+        while pending and not pending[0][2]:
+            obj, contents, _ = pending.popleft()
+            yield obj, contents
+
+    yield from completed()
+    with BulkRenderer(max_workers, chunksize, ordered) as renderer:
+        for position, result in renderer.render_many(specs):
+            entry, name, cache_spec = targets[position]
+            targets[position] = None
+            if cache_spec is not None:
+                render_cache.set(cache_spec, result.content)
+            entry[1][name] = result.content
+            entry[2] -= 1
+            if ordered:
+                yield from completed()
+            elif not entry[2]:
+                yield entry[0], entry[1]
+
+
+def generate_qr_codes(
+    objs: Iterable["QRCodeBase"],
+    output_format: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    ordered: bool = True,
+) -> Iterator[Tuple["QRCodeBase", bytes]]:
+    """Generates the QR code files of many objects on a process pool.
+
+    When ``SAGE_QRCODE_RENDER_CACHE`` is configured, files already rendered
+    are served from the cache without reaching the pool.
+
+    Args:
+        objs (Iterable[QRCodeBase]): Instances of subclasses of QRCodeBase.
+            Plain ``QRCode`` rows, e.g. of a ``non_polymorphic`` queryset,
+            are replaced by their concrete objects.
+        output_format (str, optional): 'png', 'svg', 'pdf' or 'eps'. Defaults
+            to the ``SAGE_QRCODE_OUTPUT_FORMAT`` setting.
+        max_workers (int, optional): Number of worker processes. Defaults to
+            ``SAGE_QRCODE_BULK_MAX_WORKERS`` or the CPU count.
+        chunksize (int, optional): Objects sent to a worker at a time.
+            Defaults to ``SAGE_QRCODE_BULK_CHUNKSIZE`` or 1.
+        ordered (bool, optional): Yield in input order rather than as soon as
+            each file is ready. Default is True.
+
+    Yields:
+        tuple: Each object and its encoded PNG image or vector document.
+        Unsupported objects are skipped.
+    """
+    files = [(None, output_format, None)]
+    for obj, contents in _generate_files(objs, files, max_workers, chunksize, ordered):
+        yield obj, contents[None]
+
+
+def generate_qr_code_files(
+    objs: Iterable["QRCodeBase"],
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    ordered: bool = True,
+) -> Iterator[Tuple["QRCodeBase", bytes, Dict[str, bytes]]]:
+    """Generates the QR code files and renditions of many objects on a pool.
+
+    The ``qr_code_image`` file and every ``SAGE_QRCODE_RENDITIONS`` entry
+    are separate specs of one bulk render run, and the render cache is
+    consulted as in ``generate_qr_codes``.
+
+    Args:
+        objs (Iterable[QRCodeBase]): Instances of subclasses of QRCodeBase.
+        max_workers (int, optional): Number of worker processes. Defaults to
+            ``SAGE_QRCODE_BULK_MAX_WORKERS`` or the CPU count.
+        chunksize (int, optional): Files sent to a worker at a time.
+            Defaults to ``SAGE_QRCODE_BULK_CHUNKSIZE`` or 1.
+        ordered (bool, optional): Yield in input order rather than as soon as
+            each object is ready. Default is True.
+
+    Yields:
+        tuple: Each object, its encoded ``qr_code_image`` file and the
+        rendition files, as returned by ``render_qr_code_files``.
+        Unsupported objects are skipped.
+    """
+    from sage_qrcode.service.png import set_png_dpi
+
+    renditions = get_renditions()
+    files = [(None, None, None)] + [
+        (alias, rendition.extension, rendition.size)
+        for alias, rendition in renditions.items()
+    ]
+    for obj, contents in _generate_files(objs, files, max_workers, chunksize, ordered):
+        content = contents.pop(None)
+        for alias, rendition in renditions.items():
+            if rendition.dpi and rendition.extension == "png":
+                contents[alias] = set_png_dpi(contents[alias], rendition.dpi)
+        yield obj, content, contents
+
+
+def save_qr_code_image(
+    obj: "QRCodeBase",
+    qr_image: Union[bytes, IO[bytes], "Image.Image"],
+    output_format: Optional[str] = None,
+) -> None:
     """Saves the generated QR code image to the database.
 
+    Raster images are encoded as PNG. Vector documents produced by
+    ``generate_qr_code`` are written to the storage file unchanged, and
+    streamed PNGs are copied from their temporary file in chunks.
+
     Args:
         obj (QRCodeBase): An instance of a subclass of QRCodeBase.
-        qr_image (bytes): The generated QR code image in bytes.
+        qr_image (bytes): The generated QR code image, the encoded document,
+            or the temporary file of a streamed PNG, which is closed.
+        output_format (str, optional): 'png', 'svg', 'pdf' or 'eps'. Defaults to
+            the ``SAGE_QRCODE_OUTPUT_FORMAT`` setting.
 
     """
-    buffer = io.BytesIO()
-    qr_image.save(buffer, format="PNG")
-    obj.qr_code_image.save(
-        f"{obj.pk}_qr.png", ContentFile(buffer.getvalue()), save=False
-    )
+    from sage_qrcode.utils.qrcode import encode_image
+
+    output_format = get_output_format(output_format)
+    if isinstance(qr_image, bytes) or hasattr(qr_image, "read"):
+        content = qr_image
+    else:
+        output_format = "png"
+        content = encode_image(qr_image, "PNG")
+    with as_file(content) as upload:
+        obj.qr_code_image.save(f"{obj.pk}_qr.{output_format}", upload, save=False)
+
+
+def as_file(content: Union[bytes, IO[bytes]]) -> File:
+    """Wraps an encoded file for storage, without reading open files.
+
+    Args:
+        content (Union[bytes, IO[bytes]]): Encoded bytes, or an open file.
+
+    Returns:
+        File: A Django file; closing it closes an open file.
+    """
+    if isinstance(content, bytes):
+        return ContentFile(content)
+    return File(content)
+
+
+def save_qr_code_renditions(
+    obj: "QRCodeBase", contents: Dict[str, Union[bytes, IO[bytes]]]
+) -> None:
+    """Writes rendition files to the storage of ``qr_code_image``.
+
+    Each rendition replaces the previous file at its path, so the object
+    must be saved first for its primary key to name the files.
+
+    Args:
+        obj (QRCodeBase): An instance of a subclass of QRCodeBase.
+        contents (dict): The encoded file for each rendition alias, as
+            returned by ``render_qr_code_renditions``.
+    """
+    storage = obj.qr_code_image.storage
+    renditions = get_renditions()
+    for alias, content in contents.items():
+        name = renditions[alias].get_name(obj)
+        if storage.exists(name):
+            storage.delete(name)
+        with as_file(content) as upload:
+            storage.save(name, upload)
+
+
+def enqueue_qr_code(obj: "QRCodeBase") -> None:
+    """Hands a saved object to the ``QUEUE`` of ``SAGE_QRCODE_RENDER_LIMITS``.
+
+    The queue receives the model label and primary key, and its worker is
+    expected to call ``render_queued_qr_code`` with them.
+
+    Args:
+        obj (QRCodeBase): A saved instance of a subclass of QRCodeBase.
+    """
+    get_admission_control().queue(obj._meta.label, obj.pk)
+
+
+def render_queued_qr_code(model_label: str, pk: Any) -> None:
+    """Renders and stores a QR code whose render was queued.
+
+    The render limits do not apply here, as this runs outside request
+    handling.
+
+    Args:
+        model_label (str): The label of the QR code model.
+        pk (Any): The primary key of the object.
+    """
+    obj = apps.get_model(model_label).objects.get(pk=pk)
+    with unrestricted():
+        qr_image, renditions = render_qr_code_files(obj)
+    save_qr_code_image(obj, qr_image)
+    obj.save(update_fields=["qr_code_image"])
+    save_qr_code_renditions(obj, renditions)
+
+
+def _stored_file_info(obj: "QRCodeBase") -> tuple:
+    """Returns the download name and content type of a stored QR code file.
+
+    Args:
+        obj (QRCodeBase): An instance of a subclass of QRCodeBase.
+
+    Returns:
+        tuple: The file name and its content type.
+    """
+    extension = os.path.splitext(obj.qr_code_image.name)[1] or ".png"
+    content_type = mimetypes.guess_type(f"file{extension}")[0]
+    return f"{obj.pk}_qr{extension}", content_type or "application/octet-stream"
 
 
 def handle_qr_code(request: HttpResponse, queryset) -> HttpResponse:
@@ -174,8 +825,9 @@ def handle_qr_code(request: HttpResponse, queryset) -> HttpResponse:
         return HttpResponse("Please select at least one QR code to download.")
     elif queryset.count() == 1:
         obj = queryset.first()
-        response = HttpResponse(content_type="image/png")
-        response["Content-Disposition"] = f"attachment; filename={obj.pk}_qr.png"
+        filename, content_type = _stored_file_info(obj)
+        response = HttpResponse(content_type=content_type)
+        response["Content-Disposition"] = f"attachment; filename={filename}"
         with obj.qr_code_image.open("rb") as img_file:
             response.write(img_file.read())
         return response
@@ -183,8 +835,9 @@ def handle_qr_code(request: HttpResponse, queryset) -> HttpResponse:
         zip_buffer = io.BytesIO()
         with zipfile.ZipFile(zip_buffer, "w") as zip_file:
             for obj in queryset:
+                filename, _ = _stored_file_info(obj)
                 with obj.qr_code_image.open("rb") as img_file:
-                    zip_file.writestr(f"{obj.pk}_qr.png", img_file.read())
+                    zip_file.writestr(filename, img_file.read())
 
         zip_buffer.seek(0)
         response = HttpResponse(zip_buffer, content_type="application/zip")
@@ -208,7 +861,58 @@ def download_qr_code(self, request, queryset):
     return response
 
 
-def generate_barcode_image(obj: BarcodeProxy) -> bytes:
+def regenerate_qr_codes(self, request, queryset):
+    """Re-renders the selected QR codes on the bulk render process pool.
+
+    The parent admin lists plain ``QRCode`` rows, so the concrete objects
+    are fetched first, in one query per QR code type. Their renditions are
+    rendered on the pool alongside them. Codes over
+    ``SAGE_QRCODE_RENDER_LIMITS`` are queued or skipped before the pool
+    starts.
+    """
+    start_time = time.time()
+    count = 0
+    admitted, queued, rejected = [], 0, 0
+    for obj in queryset.get_real_instances():
+        try:
+            check_render_limits(obj)
+        except RenderLimitExceeded as error:
+            if error.action == "queue":
+                enqueue_qr_code(obj)
+                queued += 1
+            else:
+                rejected += 1
+            continue
+        admitted.append(obj)
+    for obj, content, renditions in generate_qr_code_files(admitted, ordered=False):
+        save_qr_code_image(obj, content)
+        obj.save(update_fields=["qr_code_image"])
+        save_qr_code_renditions(obj, renditions)
+        count += 1
+    self.message_user(
+        request,
+        "Regenerated {} QR codes in {:.2f} seconds.".format(
+            count, time.time() - start_time
+        ),
+    )
+    if queued:
+        self.message_user(
+            request,
+            "{} QR codes over the render limits are rendered in the "
+            "background.".format(queued),
+        )
+    if rejected:
+        self.message_user(
+            request,
+            "{} QR codes over the render limits were skipped.".format(rejected),
+            messages.WARNING,
+        )
+
+
+regenerate_qr_codes.short_description = "Regenerate selected QR codes"
+
+
+def generate_barcode_image(obj: "BarcodeProxy") -> bytes:
     """Generates a barcode image based on the type of object passed.
 
     Args:
@@ -218,6 +922,8 @@ def generate_barcode_image(obj: BarcodeProxy) -> bytes:
         bytes: The generated barcode image in bytes.
 
     """
+    from sage_qrcode.service import BarcodeProxy
+
     proxy = BarcodeProxy()
     if not obj.color:
         obj.color = "black"
@@ -232,7 +938,7 @@ def generate_barcode_image(obj: BarcodeProxy) -> bytes:
     return proxy.show_barcode(save=False)
 
 
-def save_barcode_image(obj: BarcodeProxy, barcode_image: bytes) -> None:
+def save_barcode_image(obj: "BarcodeProxy", barcode_image: bytes) -> None:
     """Saves the generated barcode image to the database.
 
     Args:
@@ -0,0 +1,472 @@
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    from PIL import Image, ImageColor, ImageDraw
+except ImportError as exc:
+    raise ImportError("Install `pillow` package. Run `pip install pillow`.") from exc
+
+from sage_qrcode.utils.fonts import Font, get_font_registry
+from sage_qrcode.utils.icons import get_icon_cache
+from sage_qrcode.utils.layers import get_layer_cache
+
+logger = logging.getLogger(__name__)
+
+# Set by the palette rasterizer to the number of leading symbol color entries.
+PALETTE_RESERVED_KEY = "sage_qrcode_palette"
+FRAME_WIDTH = 10
+FRAME_RADIUS = 20
+CAPTION_MARGIN = 10
+OVERLAY_GAP = 32
+FRAME_CACHE_SIZE = 256
+
+Size = Tuple[int, int]
+FrameMaskBuilder = Callable[[Size, int], Image.Image]
+Box = Tuple[int, int, int, int]
+# Boxes covering a mask, each with its piece of the mask or None if opaque.
+Overlay = Tuple[Tuple[Box, Optional[Image.Image]], ...]
+
+
+@dataclass(frozen=True)
+class Frame:
+    """A frame drawn along the border of the image.
+
+    Attributes:
+        style (str): 'simple', 'rounded' or a style added with
+            ``register_frame_style``.
+        color (str): The frame color.
+        width (int): The frame width in pixels.
+    """
+
+    style: str = "simple"
+    color: str = "black"
+    width: int = FRAME_WIDTH
+
+
+@dataclass(frozen=True)
+class Icon:
+    """An icon pasted onto the center of the image.
+
+    Attributes:
+        source (str): The path to the icon, or the file name of a bundled icon.
+        bundled (bool): Whether ``source`` names a bundled icon.
+    """
+
+    source: str
+    bundled: bool = False
+
+
+@dataclass(frozen=True)
+class Caption:
+    """A line of text centered along the bottom of the image.
+
+    Attributes:
+        text (str): The caption.
+        color (str): The text color.
+    """
+
+    text: str
+    color: str = "black"
+
+
+Decoration = Union[Frame, Icon, Caption]
+
+
+def is_indexed_symbol(image: Image.Image) -> bool:
+    """Returns True for 1-bit or palette images made by the QR rasterizer.
+
+    Such images can take frames and captions without a mode conversion.
+
+    Args:
+        image (Image): The image to check.
+
+    Returns:
+        bool: Whether the image may be drawn on in its current mode.
+    """
+    return image.mode == "1" or (
+        image.mode == "P" and PALETTE_RESERVED_KEY in image.info
+    )
+
+
+def get_ink(image: Image.Image, color: str) -> Union[int, str]:
+    """Returns the fill value to draw a decoration color onto an image.
+
+    Palette images from the QR rasterizer get a dedicated palette entry after
+    the symbol colors, so decorations never share an entry with the light,
+    dark or finder modules and recoloring the symbol leaves them untouched.
+
+    Args:
+        image (Image): The image that will be drawn on.
+        color (str): The decoration color.
+
+    Returns:
+        Union[int, str]: A palette index, or the color itself for other images.
+    """
+    reserved = image.info.get(PALETTE_RESERVED_KEY)
+    if image.mode != "P" or reserved is None:
+        return color
+
+    rgba = list(ImageColor.getcolor(color, "RGBA"))
+    palette = image.getpalette("RGBA")
+    for index in range(reserved, len(palette) // 4):
+        if palette[index * 4 : index * 4 + 4] == rgba:
+            return index
+    image.putpalette(palette + rgba, rawmode="RGBA")
+    return len(palette) // 4
+
+
+def get_font_mode(mode: str) -> str:
+    """Returns the text antialiasing ``ImageDraw`` uses for an image mode."""
+    return "1" if mode in ("1", "P", "I", "F") else "L"
+
+
+def _simple_frame(size: Size, width: int) -> Image.Image:
+    mask = Image.new("L", size, 0)
+    ImageDraw.Draw(mask).rectangle([(0, 0), size], outline=255, width=width)
+    return mask
+
+
+def _rounded_frame(size: Size, width: int) -> Image.Image:
+    mask = Image.new("L", size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle(
+        [(0, 0), size], radius=FRAME_RADIUS, outline=255, width=width
+    )
+    return mask
+
+
+_frame_styles: Dict[str, Union[FrameMaskBuilder, Image.Image]] = {
+    "simple": _simple_frame,
+    "rounded": _rounded_frame,
+}
+_frame_styles_lock = threading.Lock()
+
+
+def register_frame_style(name: str, mask: Union[FrameMaskBuilder, Image.Image]) -> None:
+    """Registers or replaces a frame style.
+
+    Args:
+        name (str): The style name used as ``Frame.style`` or ``frame_type``.
+        mask (Union[Callable, Image]): A callable taking the image size and
+            the frame width and returning an ``L`` or ``1`` mask of that size,
+            or a mask image that is stretched to each image size.
+    """
+    with _frame_styles_lock:
+        _frame_styles[name] = mask
+    get_frame_mask.cache_clear()
+    get_layer_cache().clear("frame")
+    logger.debug("Registered frame style %s.", name)
+
+
+def get_frame_styles() -> List[str]:
+    """Returns the names of the registered frame styles."""
+    return sorted(_frame_styles)
+
+
+@lru_cache(maxsize=FRAME_CACHE_SIZE)
+def get_frame_mask(
+    style: str, size: Size, width: int = FRAME_WIDTH
+) -> Optional[Image.Image]:
+    """Returns the coverage mask of a frame, building it on first use.
+
+    Masks only depend on the style, image size and frame width, so each is
+    drawn once and shared by every image of that size.
+
+    Args:
+        style (str): The frame style.
+        size (tuple): The image width and height.
+        width (int, optional): The frame width in pixels. Default is 10.
+
+    Returns:
+        Optional[Image.Image]: An ``L`` mask, 255 where the frame is opaque,
+        or None for unknown styles. It is shared and must not be mutated.
+    """
+    source = _frame_styles.get(style)
+    if source is None:
+        logger.warning("Unknown frame style %s, skipping it.", style)
+        return None
+
+    logger.debug("Building %s frame mask at %s, width %s.", style, size, width)
+    if isinstance(source, Image.Image):
+        mask = source.resize(size, Image.NEAREST)
+    else:
+        mask = source(size, width)
+    return mask if mask.mode == "L" else mask.convert("L")
+
+
+def _draw_caption(
+    draw: ImageDraw.ImageDraw, caption: Caption, size: Size, font: Font
+) -> None:
+    text_bbox = get_font_registry().text_bbox(font, caption.text, draw.fontmode)
+    text_width = text_bbox[2] - text_bbox[0]
+    text_height = text_bbox[3] - text_bbox[1]
+    logger.debug("Text dimensions: width=%s, height=%s", text_width, text_height)
+    position = (
+        (size[0] - text_width) // 2,
+        size[1] - text_height - CAPTION_MARGIN,
+    )
+    draw.text(position, caption.text, fill=255, font=font)
+
+
+def _column_runs(row: bytes, gap: int) -> List[Tuple[int, int]]:
+    """Returns the covered column ranges of a row, joining close ranges."""
+    runs: List[Tuple[int, int]] = []
+    for match in re.finditer(rb"[^\x00]+", row):
+        if runs and match.start() - runs[-1][1] < gap:
+            runs[-1] = (runs[-1][0], match.end())
+        else:
+            runs.append((match.start(), match.end()))
+    return runs
+
+
+def split_mask(mask: Image.Image, gap: int = OVERLAY_GAP) -> Overlay:
+    """Cuts a mask into boxes that cover its content.
+
+    Drawing a full-size mask blends every pixel of the image, while frames
+    and captions cover only a thin border and a line of text. Each row is
+    split into its covered column ranges, and ranges repeated by the rows
+    below are joined into one box. Fully opaque boxes are later painted as
+    plain rectangles; only the others keep their mask.
+
+    Args:
+        mask (Image): An ``L`` mask.
+        gap (int, optional): Covered ranges closer than this are joined.
+            Default is 32.
+
+    Returns:
+        Overlay: The boxes and their masks, or None for opaque boxes.
+    """
+    bbox = mask.getbbox()
+    if bbox is None:
+        return ()
+    width = mask.width
+    data = mask.tobytes()
+    boxes: List[List[int]] = []
+    open_boxes: Dict[Tuple[int, int], int] = {}
+    previous = None
+    for y in range(bbox[1], bbox[3]):
+        row = data[y * width : (y + 1) * width]
+        if row == previous:
+            for index in open_boxes.values():
+                boxes[index][3] = y + 1
+            continue
+        previous = row
+        next_open = {}
+        for run in _column_runs(row, gap):
+            index = open_boxes.get(run)
+            if index is None:
+                index = len(boxes)
+                boxes.append([run[0], y, run[1], y + 1])
+            else:
+                boxes[index][3] = y + 1
+            next_open[run] = index
+        open_boxes = next_open
+
+    pieces = []
+    for box in map(tuple, boxes):
+        piece = mask.crop(box)
+        pieces.append((box, None if piece.getextrema()[0] == 255 else piece))
+    return tuple(pieces)
+
+
+def overlay_nbytes(overlay: Overlay) -> int:
+    """Returns the approximate memory held by an overlay."""
+    return sum(
+        64 + (0 if piece is None else piece.width * piece.height)
+        for _, piece in overlay
+    )
+
+
+def render_layer(
+    decoration: Union[Frame, Caption],
+    size: Size,
+    font_mode: str,
+    font: Optional[Font] = None,
+) -> Overlay:
+    """Draws a frame or caption into a coverage overlay.
+
+    Args:
+        decoration (Union[Frame, Caption]): The frame or caption. Its color
+            is applied when the overlay is painted.
+        size (tuple): The image width and height.
+        font_mode (str): '1' for aliased or 'L' for antialiased text.
+        font (optional): The caption font.
+
+    Returns:
+        Overlay: The boxes covering an ``L`` mask that is 255 where the
+        decoration is opaque.
+    """
+    if isinstance(decoration, Frame):
+        frame_mask = get_frame_mask(decoration.style, size, decoration.width)
+        return () if frame_mask is None else split_mask(frame_mask)
+
+    logger.debug("Rendering caption layer at %s.", size)
+    mask = Image.new("L", size, 0)
+    draw = ImageDraw.Draw(mask)
+    draw.fontmode = font_mode
+    _draw_caption(draw, decoration, size, font)
+    return split_mask(mask)
+
+
+def get_layer(
+    decoration: Union[Frame, Caption],
+    size: Size,
+    font_mode: str,
+    font: Optional[Font] = None,
+) -> Overlay:
+    """Returns the overlay of a frame or caption from the layer cache.
+
+    Frames are keyed by style, width and image size, and captions by text,
+    image size, font and antialiasing. Neither key holds the color, so
+    recoloring a decoration reuses its layer.
+
+    Args:
+        decoration (Union[Frame, Caption]): The frame or caption.
+        size (tuple): The image width and height.
+        font_mode (str): '1' for aliased or 'L' for antialiased text.
+        font (optional): The caption font.
+
+    Returns:
+        Overlay: The cached overlay. It is shared and must not be mutated.
+    """
+    if isinstance(decoration, Frame):
+        layer, key = "frame", (decoration.style, decoration.width, size)
+    else:
+        layer, key = "caption", (decoration.text, size, font_mode, font)
+    return get_layer_cache().get_or_create(
+        layer,
+        key,
+        lambda: render_layer(decoration, size, font_mode, font),
+        overlay_nbytes,
+    )
+
+
+@dataclass(frozen=True)
+class CompositionPlan:
+    """Decorations compiled for one image size and mode.
+
+    Attributes:
+        mode (Optional[str]): The mode the image is converted to first, or
+            None to draw in the current mode.
+        icons (tuple): Icons pasted in order, before the overlays.
+        overlays (tuple): Pairs of a color and the cached layer drawn in it.
+    """
+
+    mode: Optional[str]
+    icons: Tuple[Icon, ...]
+    overlays: Tuple[Tuple[str, Overlay], ...]
+
+    def apply(self, image: Image.Image) -> Image.Image:
+        """Applies the plan with at most one conversion of the image.
+
+        Args:
+            image (Image): The QR code image. It is drawn on in place unless
+                a conversion is needed.
+
+        Returns:
+            Image.Image: The decorated image.
+        """
+        if self.mode is not None and image.mode != self.mode:
+            logger.info("Converting image to %s mode for composition.", self.mode)
+            image = image.convert(self.mode)
+
+        for icon in self.icons:
+            scaled = get_icon_layer(icon, image.width)
+            position = (image.width - scaled.width) // 2
+            image.paste(scaled, (position, position), scaled)
+
+        if self.overlays:
+            draw = ImageDraw.Draw(image)
+            for color, overlay in self.overlays:
+                ink = get_ink(image, color)
+                for (left, top, right, bottom), piece in overlay:
+                    if piece is None:
+                        draw.rectangle((left, top, right - 1, bottom - 1), fill=ink)
+                    else:
+                        draw.bitmap((left, top), piece, fill=ink)
+        return image
+
+
+def get_icon_layer(icon: Icon, width: int) -> Image.Image:
+    """Returns an icon scaled for an image width from the layer cache.
+
+    Args:
+        icon (Icon): The icon.
+        width (int): The width of the QR code image in pixels.
+
+    Returns:
+        Image.Image: The scaled RGBA icon. It is shared and must not be mutated.
+    """
+    icon_cache = get_icon_cache()
+    if icon.bundled:
+        key = icon_cache.make_key(icon.source, bundled=True)
+        scale = partial(icon_cache.get_bundled_scaled, icon.source, width)
+    else:
+        key = icon_cache.make_key(icon.source)
+        scale = partial(icon_cache.get_scaled, icon.source, width)
+    return get_layer_cache().get_or_create(
+        "icon", (key, width, icon_cache.ratio), scale
+    )
+
+
+def compile_plan(
+    decorations: Sequence[Decoration], size: Size, mode: str, indexed: bool = False
+) -> CompositionPlan:
+    """Compiles decorations into a plan for images of one size and mode.
+
+    Icons need alpha, so they switch the plan to RGBA; frames need it too
+    unless the image is an indexed QR symbol. Every frame and caption is a
+    separate layer taken from the layer cache, so changing one decoration
+    renders only that layer again.
+
+    Args:
+        decorations (Sequence[Decoration]): Icons, frames and captions. Icons
+            are pasted first, then frames and captions in the given order.
+        size (tuple): The image width and height.
+        mode (str): The image mode.
+        indexed (bool, optional): Whether the image is a palette or 1-bit
+            symbol from the QR rasterizer. Default is False.
+
+    Returns:
+        CompositionPlan: The compiled plan.
+    """
+    icons = tuple(item for item in decorations if isinstance(item, Icon))
+    drawn = [item for item in decorations if not isinstance(item, Icon)]
+
+    target_mode = None
+    if mode != "RGBA" and (
+        icons or (not indexed and any(isinstance(item, Frame) for item in drawn))
+    ):
+        target_mode = "RGBA"
+    font_mode = get_font_mode(target_mode or mode)
+    font = None
+    if any(isinstance(item, Caption) for item in drawn):
+        font = get_font_registry().get_font()
+
+    overlays = tuple(
+        (item.color, overlay)
+        for item, overlay in (
+            (item, get_layer(item, size, font_mode, font)) for item in drawn
+        )
+        if overlay
+    )
+    return CompositionPlan(target_mode, icons, overlays)
+
+
+def compose(image: Image.Image, decorations: Sequence[Decoration]) -> Image.Image:
+    """Applies decorations to a QR code image in a single pass.
+
+    Args:
+        image (Image): The QR code image.
+        decorations (Sequence[Decoration]): Icons, frames and captions.
+
+    Returns:
+        Image.Image: The decorated image.
+    """
+    if not decorations:
+        return image
+    plan = compile_plan(decorations, image.size, image.mode, is_indexed_symbol(image))
+    return plan.apply(image)
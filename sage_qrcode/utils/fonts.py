@@ -0,0 +1,145 @@
+import logging
+import threading
+from functools import lru_cache
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+try:
+    from PIL import ImageFont
+except ImportError as exc:
+    raise ImportError("Install `pillow` package. Run `pip install pillow`.") from exc
+
+from sage_qrcode.conf import get_setting
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FAMILY = "default"
+DEFAULT_TRUETYPE_SIZE = 12
+TEXT_BBOX_CACHE_SIZE = 4096
+
+Font = Union[ImageFont.ImageFont, ImageFont.FreeTypeFont]
+BBox = Tuple[int, int, int, int]
+
+
+class FontRegistry:
+    """Loads caption fonts once per process and memoizes text metrics.
+
+    Fonts are registered by family name and loaded lazily per
+    ``(family, size)``. The ``default`` family is Pillow's built-in font.
+
+    Attributes:
+        families (Dict[str, str]): Maps a family name to a TrueType file.
+    """
+
+    def __init__(self, families: Optional[Mapping[str, str]] = None) -> None:
+        """Initializes the registry with the given TrueType families.
+
+        Args:
+            families (Mapping[str, str], optional): Family names and the paths
+                of their ``.ttf`` or ``.otf`` files.
+        """
+        self.families: Dict[str, str] = dict(families or {})
+        self._lock = threading.Lock()
+        self._fonts: Dict[Tuple[str, Optional[int]], Font] = {}
+        self.text_bbox = lru_cache(maxsize=TEXT_BBOX_CACHE_SIZE)(self._text_bbox)
+
+    def register(self, family: str, path: str) -> None:
+        """Registers or replaces a TrueType family.
+
+        Args:
+            family (str): The family name used to look the font up.
+            path (str): The font file.
+        """
+        with self._lock:
+            self.families[family] = path
+            for key in [key for key in self._fonts if key[0] == family]:
+                del self._fonts[key]
+        self.text_bbox.cache_clear()
+
+    def get_font(
+        self, family: Optional[str] = None, size: Optional[int] = None
+    ) -> Font:
+        """Returns the font of a family and size, loading it on first use.
+
+        Args:
+            family (str, optional): A registered family or 'default'. Defaults
+                to the ``SAGE_QRCODE_CAPTION_FONT_FAMILY`` setting.
+            size (int, optional): The font size in pixels. Defaults to the
+                ``SAGE_QRCODE_CAPTION_FONT_SIZE`` setting.
+
+        Returns:
+            The loaded font. It is shared and must not be mutated.
+
+        Raises:
+            ValueError: If the family is not registered.
+        """
+        family = family or get_setting("CAPTION_FONT_FAMILY", DEFAULT_FAMILY)
+        size = size or get_setting("CAPTION_FONT_SIZE")
+        key = (family, size)
+        font = self._fonts.get(key)
+        if font is None:
+            with self._lock:
+                font = self._fonts.get(key)
+                if font is None:
+                    font = self._fonts[key] = self._load(family, size)
+        return font
+
+    def _load(self, family: str, size: Optional[int]) -> Font:
+        """Loads a font from disk or Pillow's built-in font."""
+        if family == DEFAULT_FAMILY and family not in self.families:
+            logger.debug("Loading Pillow's default font at size %s.", size)
+            if size is None:
+                return ImageFont.load_default()
+            return ImageFont.load_default(size)
+
+        path = self.families.get(family)
+        if path is None:
+            logger.error("Unknown font family: %s", family)
+            raise ValueError(f"Unknown font family: {family}")
+        logger.info("Loading font %s from %s at size %s.", family, path, size)
+        return ImageFont.truetype(path, size or DEFAULT_TRUETYPE_SIZE)
+
+    @staticmethod
+    def _text_bbox(font: Font, text: str, mode: str = "L") -> BBox:
+        """Returns the bounding box of text drawn at the origin.
+
+        Args:
+            font: A font returned by ``get_font``.
+            text (str): The text to measure.
+            mode (str, optional): The font mode of the target ``ImageDraw``,
+                as ``draw.fontmode``. Default is 'L'.
+
+        Returns:
+            tuple: The left, top, right and bottom coordinates, as
+            ``ImageDraw.textbbox((0, 0), text, font=font)`` reports them.
+        """
+        if isinstance(font, ImageFont.FreeTypeFont):
+            return font.getbbox(text, mode=mode)
+        return font.getbbox(text)
+
+
+_font_registry: Optional[FontRegistry] = None
+_font_registry_lock = threading.Lock()
+
+
+def get_font_registry() -> FontRegistry:
+    """Returns the process-wide font registry, creating it on first use.
+
+    Families are read from the ``SAGE_QRCODE_FONTS`` setting, a mapping of
+    family names to font files.
+
+    Returns:
+        FontRegistry: The shared registry.
+    """
+    global _font_registry
+    if _font_registry is None:
+        with _font_registry_lock:
+            if _font_registry is None:
+                _font_registry = FontRegistry(get_setting("FONTS"))
+    return _font_registry
+
+
+def reset_font_registry() -> None:
+    """Discards the shared registry so the next use re-reads the settings."""
+    global _font_registry
+    with _font_registry_lock:
+        _font_registry = None
@@ -0,0 +1,242 @@
+import logging
+import os
+import pkgutil
+import threading
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+try:
+    from importlib.resources import files as resource_files
+except ImportError:  # Python 3.8
+    resource_files = None
+
+try:
+    from PIL import Image
+except ImportError as exc:
+    raise ImportError("Install `pillow` package. Run `pip install pillow`.") from exc
+
+from sage_qrcode.conf import get_setting
+
+logger = logging.getLogger(__name__)
+
+# Bundled icons are package data of ``sage_qrcode.service`` and are read
+# through importlib.resources, never relative to the working directory.
+ICONS_PACKAGE = "sage_qrcode.service"
+ICONS_DIRECTORY = "icons"
+BUNDLED_ICONS_DIR = Path(__file__).resolve().parent.parent / "service" / ICONS_DIRECTORY
+DEFAULT_ICON_SIZE_RATIO = 0.2
+
+# ("file", absolute path, (mtime_ns, size)) or ("bundled", file name, None)
+IconKey = Tuple[str, str, Optional[Tuple[int, int]]]
+
+
+def bundled_icon_names() -> List[str]:
+    """Returns the file names of the icons shipped with the package."""
+    if resource_files is not None:
+        directory = resource_files(ICONS_PACKAGE) / ICONS_DIRECTORY
+        names = [entry.name for entry in directory.iterdir()]
+    else:
+        names = os.listdir(BUNDLED_ICONS_DIR)
+    return sorted(name for name in names if name.endswith(".png"))
+
+
+def read_bundled_icon(name: str) -> bytes:
+    """Reads the encoded bytes of a bundled icon.
+
+    Args:
+        name (str): The file name of the icon, e.g. 'instagram.png'.
+
+    Returns:
+        bytes: The icon file content.
+
+    Raises:
+        FileNotFoundError: If no such icon is bundled.
+    """
+    if resource_files is not None:
+        resource = resource_files(ICONS_PACKAGE) / ICONS_DIRECTORY / name
+        return resource.read_bytes()
+    data = pkgutil.get_data(ICONS_PACKAGE, f"{ICONS_DIRECTORY}/{name}")
+    if data is None:  # pragma: no cover
+        raise FileNotFoundError(name)
+    return data
+
+
+class IconCache:
+    """Decodes icons once and keeps copies scaled for each QR code size.
+
+    Icons are sized to a fixed fraction of the QR code width. Scaled copies
+    are resampled in premultiplied alpha, so transparent edges do not bleed
+    dark fringes, and are stored ready for a single alpha paste.
+
+    Attributes:
+        ratio (Optional[float]): Icon width as a fraction of the QR code
+            width, or None to paste icons at their native size.
+    """
+
+    def __init__(
+        self, ratio: Optional[float] = DEFAULT_ICON_SIZE_RATIO, max_size: int = 256
+    ) -> None:
+        """Initializes an empty cache.
+
+        Args:
+            ratio (float, optional): Icon width as a fraction of the QR code
+                width. Default is 0.2; None keeps the native size.
+            max_size (int, optional): Maximum number of decoded and of scaled
+                icons kept. Default is 256.
+        """
+        self.ratio = ratio
+        self._decode = lru_cache(maxsize=max_size)(self._decode_icon)
+        self._scale = lru_cache(maxsize=max_size)(self._scale_icon)
+
+    @staticmethod
+    def make_key(icon_path: str, bundled: bool = False) -> IconKey:
+        """Identifies an icon file and its version.
+
+        Bundled icons never change at runtime and are not checked on disk.
+        Other files are keyed by modification time and size, so a replaced
+        file is decoded again.
+
+        Args:
+            icon_path (str): The file path to the icon image, or the file
+                name of a bundled icon.
+            bundled (bool, optional): Whether ``icon_path`` names a bundled
+                icon. Default is False.
+
+        Returns:
+            IconKey: The key of the icon.
+        """
+        if bundled:
+            return ("bundled", icon_path, None)
+        icon_path = os.path.abspath(icon_path)
+        if os.path.dirname(icon_path) == str(BUNDLED_ICONS_DIR):
+            return ("bundled", os.path.basename(icon_path), None)
+        stat = os.stat(icon_path)
+        return ("file", icon_path, (stat.st_mtime_ns, stat.st_size))
+
+    @staticmethod
+    def _decode_icon(key: IconKey) -> Image.Image:
+        source, name, _ = key
+        logger.debug("Decoding %s icon: %s", source, name)
+        if source == "bundled":
+            name = BytesIO(read_bundled_icon(name))
+        with Image.open(name) as icon:
+            return icon.convert("RGBA")
+
+    def _scale_icon(self, key: IconKey, size: int) -> Image.Image:
+        icon = self._decode(key)
+        if icon.size == (size, size):
+            return icon
+        logger.debug("Scaling icon %s to %s pixels.", key[1], size)
+        # Pillow resamples RGBA in premultiplied alpha, so no conversion is needed.
+        return icon.resize((size, size), Image.LANCZOS)
+
+    def get(self, icon_path: str) -> Image.Image:
+        """Returns the decoded RGBA icon at its native size.
+
+        Args:
+            icon_path (str): The file path to the icon image.
+
+        Returns:
+            Image.Image: The decoded icon. It is shared and must not be mutated.
+        """
+        return self._decode(self.make_key(icon_path))
+
+    def get_bundled(self, name: str) -> Image.Image:
+        """Returns a decoded bundled icon at its native size.
+
+        Args:
+            name (str): The file name of the icon, e.g. 'instagram.png'.
+
+        Returns:
+            Image.Image: The decoded icon. It is shared and must not be mutated.
+        """
+        return self._decode(self.make_key(name, bundled=True))
+
+    def icon_size(self, qr_size: int, native_size: int) -> int:
+        """Returns the icon width for a QR code width.
+
+        Args:
+            qr_size (int): The width of the QR code image in pixels.
+            native_size (int): The width of the decoded icon.
+
+        Returns:
+            int: The icon width in pixels.
+        """
+        if not self.ratio:
+            return native_size
+        return max(1, round(qr_size * self.ratio))
+
+    def get_scaled(self, icon_path: str, qr_size: int) -> Image.Image:
+        """Returns the icon scaled for a QR code of the given width.
+
+        Args:
+            icon_path (str): The file path to the icon image.
+            qr_size (int): The width of the QR code image in pixels.
+
+        Returns:
+            Image.Image: The scaled RGBA icon. It is shared and must not be
+            mutated.
+        """
+        return self._get_scaled(self.make_key(icon_path), qr_size)
+
+    def get_bundled_scaled(self, name: str, qr_size: int) -> Image.Image:
+        """Returns a bundled icon scaled for a QR code of the given width.
+
+        Args:
+            name (str): The file name of the icon, e.g. 'instagram.png'.
+            qr_size (int): The width of the QR code image in pixels.
+
+        Returns:
+            Image.Image: The scaled RGBA icon. It is shared and must not be
+            mutated.
+        """
+        return self._get_scaled(self.make_key(name, bundled=True), qr_size)
+
+    def _get_scaled(self, key: IconKey, qr_size: int) -> Image.Image:
+        native_size = self._decode(key).width
+        return self._scale(key, self.icon_size(qr_size, native_size))
+
+    def preload(self, directory: Optional[os.PathLike] = None) -> None:
+        """Decodes every PNG icon of a directory, the bundled ones by default."""
+        if directory is None:
+            for name in bundled_icon_names():
+                self.get_bundled(name)
+            return
+        for icon_path in sorted(Path(directory).glob("*.png")):
+            self.get(str(icon_path))
+
+    def clear(self) -> None:
+        """Drops all decoded and scaled icons."""
+        self._decode.cache_clear()
+        self._scale.cache_clear()
+
+
+_icon_cache: Optional[IconCache] = None
+_icon_cache_lock = threading.Lock()
+
+
+def get_icon_cache() -> IconCache:
+    """Returns the process-wide icon cache, creating it on first use.
+
+    The icon size is read from the ``SAGE_QRCODE_ICON_SIZE_RATIO`` setting.
+
+    Returns:
+        IconCache: The shared cache.
+    """
+    global _icon_cache
+    if _icon_cache is None:
+        with _icon_cache_lock:
+            if _icon_cache is None:
+                _icon_cache = IconCache(
+                    ratio=get_setting("ICON_SIZE_RATIO", DEFAULT_ICON_SIZE_RATIO)
+                )
+    return _icon_cache
+
+
+def reset_icon_cache() -> None:
+    """Discards the shared cache so the next use re-reads the settings."""
+    global _icon_cache
+    with _icon_cache_lock:
+        _icon_cache = None
@@ -0,0 +1,138 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+try:
+    from PIL import Image
+except ImportError as exc:
+    raise ImportError("Install `pillow` package. Run `pip install pillow`.") from exc
+
+from sage_qrcode.conf import get_setting
+from sage_qrcode.utils.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# The symbol raster, then the decorations in the order they are composited.
+LAYERS = ("base", "icon", "frame", "caption")
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def image_nbytes(image: Image.Image) -> int:
+    """Returns the approximate memory held by an image."""
+    return image.width * image.height * len(image.getbands())
+
+
+class LayerCache:
+    """Bounded LRU caches of the layers a QR code image is composited from.
+
+    Each layer is keyed by its own inputs only: the base symbol raster by
+    payload, scale and colors, an icon by its file and the image width, a
+    frame by style, width and image size, and a caption by text, font and
+    image size. Colors of frames and captions are applied while compositing,
+    so changing a caption renders only the caption layer again, and a new
+    color renders nothing but the composite.
+
+    Attributes:
+        layers (Dict[str, LRUCache]): One cache for each name in ``LAYERS``,
+            each with the same limits.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initializes empty layer caches with the given limits."""
+        self.layers = {layer: LRUCache(max_size, max_bytes) for layer in LAYERS}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether layers are cached at all."""
+        return self.layers["base"].enabled
+
+    def get_or_create(
+        self,
+        layer: str,
+        key: Optional[Hashable],
+        create: Callable[[], Any],
+        sizeof: Callable[[Any], int] = image_nbytes,
+    ) -> Any:
+        """Returns a cached layer, rendering it on a miss.
+
+        Args:
+            layer (str): One of ``LAYERS``.
+            key (Hashable, optional): The inputs of the layer, or None to
+                always render it.
+            create (Callable): Renders the layer.
+            sizeof (Callable, optional): Returns the byte size of a layer.
+                Defaults to the size of an image.
+
+        Returns:
+            Any: The layer. It is shared and must not be mutated.
+
+        Raises:
+            ValueError: If the layer name is unknown.
+        """
+        cache = self.layers.get(layer)
+        if cache is None:
+            raise ValueError(f"Unknown layer: {layer}")
+        return cache.get_or_create(key, create, sizeof)
+
+    def clear(self, layer: Optional[str] = None) -> None:
+        """Drops the entries of one layer, or of all layers.
+
+        Args:
+            layer (str, optional): The layer to clear. Default is all layers.
+        """
+        for name, cache in self.layers.items():
+            if layer is None or name == layer:
+                cache.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the counters of every layer for monitoring.
+
+        Returns:
+            dict: For each layer, the ``LRUCache`` counters together with the
+            ``hit_rate`` of its lookups.
+        """
+        stats = {}
+        for layer, cache in self.layers.items():
+            counters: Dict[str, Any] = cache.stats()
+            lookups = counters["hits"] + counters["misses"]
+            counters["hit_rate"] = counters["hits"] / lookups if lookups else 0.0
+            stats[layer] = counters
+        return stats
+
+
+_layer_cache: Optional[LayerCache] = None
+_layer_cache_lock = threading.Lock()
+
+
+def get_layer_cache() -> LayerCache:
+    """Returns the process-wide layer cache, creating it on first use.
+
+    The limits of each layer are read from the ``SAGE_QRCODE_LAYER_CACHE_SIZE``
+    and ``SAGE_QRCODE_LAYER_CACHE_MAX_BYTES`` settings.
+
+    Returns:
+        LayerCache: The shared cache instance.
+    """
+    global _layer_cache
+    if _layer_cache is None:
+        with _layer_cache_lock:
+            if _layer_cache is None:
+                _layer_cache = LayerCache(
+                    max_size=get_setting("LAYER_CACHE_SIZE", DEFAULT_CACHE_SIZE),
+                    max_bytes=get_setting(
+                        "LAYER_CACHE_MAX_BYTES", DEFAULT_CACHE_MAX_BYTES
+                    ),
+                )
+    return _layer_cache
+
+
+def reset_layer_cache() -> None:
+    """Discards the shared cache so the next use re-reads the settings."""
+    global _layer_cache
+    with _layer_cache_lock:
+        _layer_cache = None
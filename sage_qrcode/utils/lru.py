@@ -0,0 +1,127 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """A bounded, thread-safe LRU cache of values with a known byte size.
+
+    Entries are evicted in least-recently-used order once either the entry
+    count or the approximate byte size exceeds its limit. Values are shared
+    between callers and must not be mutated.
+
+    Attributes:
+        max_size (int): Maximum number of entries. ``0`` disables caching.
+        max_bytes (int): Maximum approximate size of all entries.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that found no entry.
+        evictions (int): Number of entries dropped to honour the limits.
+    """
+
+    def __init__(self, max_size: int, max_bytes: int) -> None:
+        """Initializes an empty cache with the given limits."""
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache keeps any entries."""
+        return self.max_size > 0
+
+    def get(self, key: Optional[Hashable]) -> Optional[Any]:
+        """Returns a cached value and counts the hit or miss.
+
+        Args:
+            key (Hashable, optional): The key, or None for uncacheable requests.
+
+        Returns:
+            Optional[Any]: The value, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key) if key is not None else None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Optional[Hashable], value: Any, nbytes: int) -> None:
+        """Inserts a value and evicts entries until the limits hold.
+
+        Args:
+            key (Hashable, optional): The key. Nothing is stored for None.
+            value (Any): The value to share.
+            nbytes (int): The approximate memory held by the value.
+        """
+        if key is None or not self.enabled:
+            return
+        if nbytes > self.max_bytes:
+            logger.debug("Entry of %s bytes exceeds cache byte limit.", nbytes)
+            return
+
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (value, nbytes)
+            self._bytes += nbytes
+            while len(self._entries) > self.max_size or self._bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._bytes -= evicted_bytes
+                self.evictions += 1
+
+    def get_or_create(
+        self,
+        key: Optional[Hashable],
+        create: Callable[[], Any],
+        sizeof: Callable[[Any], int],
+    ) -> Any:
+        """Returns the cached value for a key, creating it on a miss.
+
+        Args:
+            key (Hashable, optional): The key, or None to always create.
+            create (Callable): Builds the value.
+            sizeof (Callable): Returns the byte size of a value.
+
+        Returns:
+            Any: The cached or newly created value.
+        """
+        value = self.get(key)
+        if value is None:
+            value = create()
+            self.put(key, value, sizeof(value))
+        return value
+
+    def clear(self) -> None:
+        """Drops all entries and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the cache counters for monitoring.
+
+        Returns:
+            dict: Hits, misses, evictions, current entry count and byte size
+            together with the configured limits.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_size": self.max_size,
+                "max_bytes": self.max_bytes,
+            }
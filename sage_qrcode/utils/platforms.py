@@ -0,0 +1,298 @@
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from django.utils.module_loading import import_string
+
+from sage_qrcode.conf import get_setting
+from sage_qrcode.helpers.validators import (
+    validate_facebook,
+    validate_instagram,
+    validate_linkedin,
+    validate_skype,
+    validate_snapchat,
+    validate_telegram,
+    validate_tiktok,
+    validate_x,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Platform:
+    """A social media platform recognised by the hostname of its URLs.
+
+    Attributes:
+        name (str): A unique platform name, e.g. 'instagram'.
+        hosts (tuple): Hostnames of the platform. Subdomains match too, so
+            'instagram.com' covers 'www.instagram.com'.
+        icon (str): The file name of a bundled icon, or the path to an icon.
+        validator (Callable, optional): Validates a profile URL of the platform.
+        model (str, optional): The label of the ``QRCode`` model storing its
+            URLs, e.g. 'sage_qrcode.InstagramQRCode'.
+    """
+
+    name: str
+    hosts: Tuple[str, ...]
+    icon: str
+    validator: Optional[Callable[[str], None]] = None
+    model: Optional[str] = None
+
+    @property
+    def bundled_icon(self) -> bool:
+        """Whether the icon is shipped with the package rather than a file."""
+        return os.path.basename(self.icon) == self.icon
+
+    def validate(self, url: str) -> None:
+        """Runs the platform validator on a URL.
+
+        Raises:
+            ValidationError: If the URL is not a valid profile URL.
+        """
+        if self.validator is not None:
+            self.validator(url)
+
+    def get_model(self):
+        """Returns the model class of the platform, or None if it has none."""
+        if self.model is None:
+            return None
+        from django.apps import apps
+
+        return apps.get_model(self.model)
+
+
+DEFAULT_PLATFORMS = (
+    Platform(
+        "instagram",
+        ("instagram.com",),
+        "instagram.png",
+        validate_instagram,
+        "sage_qrcode.InstagramQRCode",
+    ),
+    Platform("whatsapp", ("whatsapp.com",), "logo.png"),
+    Platform(
+        "telegram",
+        ("t.me",),
+        "gram.png",
+        validate_telegram,
+        "sage_qrcode.TelegramQRCode",
+    ),
+    Platform(
+        "facebook",
+        ("facebook.com",),
+        "meta.png",
+        validate_facebook,
+        "sage_qrcode.FacebookQRCode",
+    ),
+    Platform("x", ("twitter.com",), "witter.png", validate_x, "sage_qrcode.XQRCode"),
+    Platform(
+        "linkedin",
+        ("linkedin.com",),
+        "linkedin.png",
+        validate_linkedin,
+        "sage_qrcode.LinkedInQRCode",
+    ),
+    Platform(
+        "snapchat",
+        ("snapchat.com",),
+        "snapchat.png",
+        validate_snapchat,
+        "sage_qrcode.SnapchatQRCode",
+    ),
+    Platform(
+        "tiktok", ("tiktok.com",), "ti.png", validate_tiktok, "sage_qrcode.TikTokQRCode"
+    ),
+    Platform(
+        "skype", ("skype.com",), "skype.png", validate_skype, "sage_qrcode.SkypeQRCode"
+    ),
+)
+
+
+def get_hostname(url: str) -> str:
+    """Returns the lower-cased hostname of a URL.
+
+    URLs pasted without a scheme, such as 'instagram.com/user', are accepted.
+
+    Args:
+        url (str): The URL to parse.
+
+    Returns:
+        str: The hostname without a trailing dot, or '' if there is none.
+    """
+    url = url.strip()
+    if "//" not in url:
+        url = f"//{url}"
+    try:
+        hostname = urlsplit(url).hostname
+    except ValueError:
+        return ""
+    return (hostname or "").rstrip(".")
+
+
+class PlatformRegistry:
+    """Resolves URLs to platforms through an index of their hostnames.
+
+    A hostname matches a platform if it equals one of the platform hosts or
+    is a subdomain of it, so 't.me' matches 't.me' but not 'start.me'. The
+    most specific registered host wins, whatever the registration order.
+    """
+
+    def __init__(self, platforms: Iterable[Platform] = DEFAULT_PLATFORMS) -> None:
+        """Initializes the registry with the given platforms.
+
+        Args:
+            platforms (Iterable[Platform], optional): The platforms to
+                register. Defaults to the built-in social media platforms.
+        """
+        self._lock = threading.Lock()
+        self._platforms: Dict[str, Platform] = {}
+        self._hosts: Dict[str, Platform] = {}
+        for platform in platforms:
+            self.register(platform)
+
+    @property
+    def platforms(self) -> Tuple[Platform, ...]:
+        """The registered platforms in registration order."""
+        return tuple(self._platforms.values())
+
+    def register(self, platform: Platform) -> None:
+        """Registers a platform, replacing one with the same name.
+
+        Args:
+            platform (Platform): The platform to register.
+        """
+        with self._lock:
+            platforms = dict(self._platforms)
+            platforms[platform.name] = platform
+            self._rebuild(platforms)
+
+    def unregister(self, name: str) -> None:
+        """Removes a platform by name if it is registered."""
+        with self._lock:
+            platforms = dict(self._platforms)
+            platforms.pop(name, None)
+            self._rebuild(platforms)
+
+    def _rebuild(self, platforms: Dict[str, Platform]) -> None:
+        hosts = {
+            host.lower().rstrip("."): platform
+            for platform in platforms.values()
+            for host in platform.hosts
+        }
+        # Swap whole dicts so concurrent lookups never see a partial index.
+        self._platforms, self._hosts = platforms, hosts
+
+    def match_host(self, hostname: str) -> Optional[Platform]:
+        """Returns the platform of a hostname.
+
+        Args:
+            hostname (str): A lower-cased hostname, e.g. 'www.instagram.com'.
+
+        Returns:
+            Optional[Platform]: The platform, or None if the host is unknown.
+        """
+        hosts = self._hosts
+        labels = hostname.split(".")
+        for start in range(len(labels)):
+            platform = hosts.get(".".join(labels[start:]))
+            if platform is not None:
+                return platform
+        return None
+
+    def resolve(self, url: str) -> Optional[Platform]:
+        """Returns the platform of a URL.
+
+        Args:
+            url (str): A profile URL, with or without a scheme.
+
+        Returns:
+            Optional[Platform]: The platform, or None if the host is unknown.
+        """
+        hostname = get_hostname(url)
+        if not hostname:
+            return None
+        return self.match_host(hostname)
+
+
+def platform_from_setting(name: str, config: Mapping[str, Any]) -> Platform:
+    """Builds a platform from an entry of the ``SAGE_QRCODE_PLATFORMS`` setting.
+
+    Args:
+        name (str): The platform name.
+        config (Mapping[str, Any]): 'HOSTS' and 'ICON', and optionally
+            'VALIDATOR' (a callable or its dotted path) and 'MODEL' (a model
+            label).
+
+    Returns:
+        Platform: The configured platform.
+
+    Raises:
+        ValueError: If the hosts or the icon are missing.
+    """
+    hosts = config.get("HOSTS")
+    icon = config.get("ICON")
+    if not hosts or not icon:
+        raise ValueError(
+            f"SAGE_QRCODE_PLATFORMS[{name!r}] requires 'HOSTS' and 'ICON'."
+        )
+    if isinstance(hosts, str):
+        hosts = (hosts,)
+    validator = config.get("VALIDATOR")
+    if isinstance(validator, str):
+        validator = import_string(validator)
+    return Platform(name, tuple(hosts), icon, validator, config.get("MODEL"))
+
+
+def build_platform_registry(
+    config: Optional[Mapping[str, Optional[Mapping[str, Any]]]] = None,
+) -> PlatformRegistry:
+    """Creates a registry of the built-in platforms and configured ones.
+
+    Args:
+        config (Mapping, optional): Maps platform names to their settings, as
+            the ``SAGE_QRCODE_PLATFORMS`` setting. A built-in name replaces
+            that platform, and None removes it.
+
+    Returns:
+        PlatformRegistry: The registry.
+    """
+    registry = PlatformRegistry()
+    for name, platform_config in (config or {}).items():
+        if platform_config is None:
+            logger.debug("Removing platform %s.", name)
+            registry.unregister(name)
+        else:
+            logger.debug("Registering platform %s.", name)
+            registry.register(platform_from_setting(name, platform_config))
+    return registry
+
+
+_platform_registry: Optional[PlatformRegistry] = None
+_platform_registry_lock = threading.Lock()
+
+
+def get_platform_registry() -> PlatformRegistry:
+    """Returns the process-wide platform registry, creating it on first use.
+
+    Additional platforms are read from the ``SAGE_QRCODE_PLATFORMS`` setting.
+
+    Returns:
+        PlatformRegistry: The shared registry.
+    """
+    global _platform_registry
+    if _platform_registry is None:
+        with _platform_registry_lock:
+            if _platform_registry is None:
+                _platform_registry = build_platform_registry(get_setting("PLATFORMS"))
+    return _platform_registry
+
+
+def reset_platform_registry() -> None:
+    """Discards the shared registry so the next use re-reads the settings."""
+    global _platform_registry
+    with _platform_registry_lock:
+        _platform_registry = None
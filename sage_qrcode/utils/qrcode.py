@@ -1,12 +1,52 @@
 import logging
+from io import BytesIO
 
 try:
-    from PIL import Image, ImageDraw, ImageFont
+    from PIL import Image
 except ImportError as exc:
     raise ImportError("Install `pillow` package. Run `pip install pillow`.") from exc
 
+from sage_qrcode.utils.composition import (  # noqa: F401
+    PALETTE_RESERVED_KEY,
+    Caption,
+    Frame,
+    Icon,
+    compose,
+    get_ink,
+    is_indexed_symbol,
+)
+from sage_qrcode.utils.icons import get_icon_cache
+
 logger = logging.getLogger(__name__)
 
+
+def load_icon(icon_path: str) -> Image.Image:
+    """Returns the decoded RGBA icon for a path, reusing earlier decodes.
+
+    Args:
+        icon_path (str): The file path to the icon image.
+
+    Returns:
+        Image.Image: The decoded icon. It is shared and must not be mutated.
+    """
+    return get_icon_cache().get(icon_path)
+
+
+def encode_image(image: Image, image_format: str = "PNG") -> bytes:
+    """Encodes an image to bytes in the given format.
+
+    Args:
+        image (Image): The image to encode.
+        image_format (str, optional): A Pillow format name. Default is "PNG".
+
+    Returns:
+        bytes: The encoded image.
+    """
+    buffer = BytesIO()
+    image.save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
 def add_text_to_image(image: Image, text: str):
     """Adds centered text to the provided image.
 
@@ -19,29 +59,15 @@ def add_text_to_image(image: Image, text: str):
 
     """
     logger.debug("Adding text to image: %s", text)
-    draw = ImageDraw.Draw(image)
-    font = ImageFont.load_default()
-
-    # Calculate text position
-    text_bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = text_bbox[2] - text_bbox[0]
-    text_height = text_bbox[3] - text_bbox[1]
-    logger.debug(
-        "Text dimensions: width=%s, height=%s", text_width, text_height
-    )
-
-    draw.text(
-        ((image.width - text_width) // 2, image.height - text_height - 10),
-        text,
-        fill="black",
-        font=font,
-    )
-    logger.info("Text added to image successfully.")
-    return image
+    return compose(image, [Caption(text)])
+
 
 def add_icon_to_image(image: Image, icon_path: str):
     """Adds an icon to the center of the provided image.
 
+    The icon is scaled to ``SAGE_QRCODE_ICON_SIZE_RATIO`` of the image width
+    and taken from the process-wide icon cache.
+
     Args:
         image (Image): The image to which the icon will be added.
         icon_path (str): The file path to the icon image.
@@ -51,17 +77,25 @@ def add_icon_to_image(image: Image, icon_path: str):
 
     """
     logger.debug("Adding icon to image from path: %s", icon_path)
-    icon = Image.open(icon_path).convert("RGBA")
+    return compose(image, [Icon(icon_path)])
+
+
+def add_bundled_icon_to_image(image: Image, name: str):
+    """Adds one of the package's bundled icons to the center of the image.
 
-    # Calculate icon position
-    qr_size = image.size[0]
-    icon_size = icon.size[0]
-    position = (qr_size - icon_size) // 2
-    logger.debug("Icon position calculated: %s", position)
+    The icon is read through ``importlib.resources`` and never relative to
+    the working directory.
+
+    Args:
+        image (Image): The image to which the icon will be added.
+        name (str): The file name of the bundled icon, e.g. 'instagram.png'.
+
+    Returns:
+        Image: The image with the added icon.
+    """
+    logger.debug("Adding bundled icon to image: %s", name)
+    return compose(image, [Icon(name, bundled=True)])
 
-    image.paste(icon, (position, position), icon)
-    logger.info("Icon added to image successfully.")
-    return image
 
 def add_frame_to_image(image: Image, frame_type: str = "simple"):
     """Adds a frame to the provided image. Supports simple and rounded frames.
@@ -76,16 +110,4 @@ def add_frame_to_image(image: Image, frame_type: str = "simple"):
 
     """
     logger.debug("Adding %s frame to image.", frame_type)
-    if image.mode != "RGBA":
-        logger.info("Converting image to RGBA mode.")
-        image = image.convert("RGBA")
-
-    draw = ImageDraw.Draw(image)
-    if frame_type == "simple":
-        draw.rectangle([(0, 0), image.size], outline="black", width=10)
-    elif frame_type == "rounded":
-        draw.rounded_rectangle(
-            [(0, 0), image.size], radius=20, outline="black", width=10
-        )
-    logger.info("%s frame added to image successfully.", frame_type.capitalize())
-    return image
+    return compose(image, [Frame(frame_type)])
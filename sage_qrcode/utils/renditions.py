@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+
+from sage_qrcode.conf import get_setting
+
+if TYPE_CHECKING:
+    from sage_qrcode.models import QRCode
+
+DEFAULT_RENDITION_PATH = "qr_codes/renditions"
+
+
+@dataclass(frozen=True)
+class Rendition:
+    """One additional file stored for every QR code, e.g. a thumbnail.
+
+    Attributes:
+        alias (str): A unique name, e.g. 'thumbnail'.
+        size (int, optional): Pixels per module; None keeps the code's size.
+        image_format (str, optional): 'png', 'svg', 'pdf' or 'eps'; None
+            uses ``SAGE_QRCODE_OUTPUT_FORMAT``.
+        dpi (int, optional): Resolution recorded in PNG renditions.
+        path (str): The storage directory of the rendition files.
+    """
+
+    alias: str
+    size: Optional[int] = None
+    image_format: Optional[str] = None
+    dpi: Optional[int] = None
+    path: str = ""
+
+    @property
+    def extension(self) -> str:
+        """Returns the file extension of the rendition."""
+        return (self.image_format or get_setting("OUTPUT_FORMAT", "png")).lower()
+
+    def get_name(self, obj: "QRCode") -> str:
+        """Returns the storage name of the rendition of a QR code.
+
+        Args:
+            obj (QRCode): A saved QR code.
+
+        Returns:
+            str: The file name relative to the storage root.
+        """
+        return f"{self.path}/{obj.pk}_qr.{self.extension}"
+
+
+def rendition_from_setting(alias: str, config: Mapping[str, Any]) -> Rendition:
+    """Builds a rendition from an entry of the ``SAGE_QRCODE_RENDITIONS`` setting.
+
+    Args:
+        alias (str): The rendition alias.
+        config (Mapping[str, Any]): Optionally 'SIZE', 'FORMAT', 'DPI' and
+            'PATH'.
+
+    Returns:
+        Rendition: The configured rendition.
+
+    Raises:
+        ValueError: If the DPI is set for a vector format.
+    """
+    image_format = config.get("FORMAT")
+    if image_format:
+        image_format = image_format.lower()
+    dpi = config.get("DPI")
+    if dpi and image_format and image_format != "png":
+        raise ValueError(
+            f"SAGE_QRCODE_RENDITIONS[{alias!r}] sets 'DPI' for {image_format} output."
+        )
+    return Rendition(
+        alias,
+        config.get("SIZE"),
+        image_format,
+        dpi,
+        config.get("PATH", f"{DEFAULT_RENDITION_PATH}/{alias}").rstrip("/"),
+    )
+
+
+def get_renditions() -> Dict[str, Rendition]:
+    """Returns the renditions configured in ``SAGE_QRCODE_RENDITIONS``.
+
+    Returns:
+        dict: The renditions by alias, in setting order.
+    """
+    config = get_setting("RENDITIONS") or {}
+    return {
+        alias: rendition_from_setting(alias, options or {})
+        for alias, options in config.items()
+    }